@@ -8,6 +8,7 @@ Mehmet Yay tarafından geliştirildi
 import numpy as np
 import librosa
 from scipy import signal
+from scipy import fft as sp_fft
 import soundfile as sf
 from pydub import AudioSegment
 import os
@@ -15,18 +16,28 @@ import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
 import multiprocessing
+from myp_precision import PrecisionPolicy, DEFAULT_PRECISION, DtypeError
+from myp_instrumentation import instrumented
+from myp_logging import get_logger
+
+log = get_logger('features')
 
 class AdvancedAudioFeatures:
     """Gelişmiş ses özellikleri sınıfı"""
     
-    def __init__(self):
+    def __init__(self, precision=DEFAULT_PRECISION, debug_dtype=None):
         self.sample_rate = 44100
         self.cpu_count = multiprocessing.cpu_count()
+        # Efektlerin tek dtype'ı (float32 / float64), debug modunda çıktılar doğrulanır
+        self.precision = PrecisionPolicy(precision, debug_dtype)
+        self.dtype = self.precision.dtype
         
+    @instrumented
     def pitch_shift_advanced(self, audio_data, semitones, preserve_formants=True):
         """Gelişmiş pitch shifting"""
         try:
-            print(f"🎵 Gelişmiş pitch shift: {semitones:+.1f} semitone")
+            log.info("🎵 Gelişmiş pitch shift: %+.1f semitone", semitones)
+            audio_data = self.precision.cast(audio_data)
             
             if len(audio_data.shape) == 2:
                 # Stereo
@@ -47,23 +58,28 @@ class AdvancedAudioFeatures:
                             sr=self.sample_rate, 
                             n_steps=semitones
                         )
-                return shifted
+                return self.precision.check(shifted, 'pitch_shift')
             else:
                 # Mono
-                return librosa.effects.pitch_shift(
+                shifted = librosa.effects.pitch_shift(
                     audio_data, 
                     sr=self.sample_rate, 
                     n_steps=semitones,
                     bins_per_octave=12 if preserve_formants else None
                 )
+                return self.precision.check(shifted, 'pitch_shift')
+        except DtypeError:
+            raise
         except Exception as e:
-            print(f"Pitch shift hatası: {e}")
+            log.error("Pitch shift hatası: %s", e)
             return audio_data
     
+    @instrumented
     def time_stretch_advanced(self, audio_data, rate, preserve_pitch=True):
         """Gelişmiş zaman uzatma/sıkıştırma"""
         try:
-            print(f"⏱️ Gelişmiş time stretch: {rate:.2f}x")
+            log.info("⏱️ Gelişmiş time stretch: %.2fx", rate)
+            audio_data = self.precision.cast(audio_data)
             
             if len(audio_data.shape) == 2:
                 # Stereo
@@ -81,18 +97,22 @@ class AdvancedAudioFeatures:
                             audio_data[:, i], 
                             rate=rate
                         )
-                return stretched
+                return self.precision.check(stretched, 'time_stretch')
             else:
                 # Mono
-                return librosa.effects.time_stretch(audio_data, rate=rate)
+                return self.precision.check(librosa.effects.time_stretch(audio_data, rate=rate), 'time_stretch')
+        except DtypeError:
+            raise
         except Exception as e:
-            print(f"Time stretch hatası: {e}")
+            log.error("Time stretch hatası: %s", e)
             return audio_data
     
+    @instrumented
     def add_reverb_advanced(self, audio_data, room_size=0.5, damping=0.5, wet_level=0.3, early_reflections=True):
         """Gelişmiş reverb efekti"""
         try:
-            print(f"🏛️ Gelişmiş reverb: Room={room_size:.1f}, Wet={wet_level:.1f}")
+            log.info("🏛️ Gelişmiş reverb: Room=%.1f, Wet=%.1f", room_size, wet_level)
+            audio_data = self.precision.cast(audio_data)
             
             # Reverb parametreleri
             delay_times = [0.03, 0.05, 0.07, 0.09, 0.11, 0.13]  # saniye
@@ -105,43 +125,44 @@ class AdvancedAudioFeatures:
                     channel = audio_data[:, i]
                     reverb_channel = np.zeros_like(channel)
                     
-                    # Çoklu gecikme ile reverb
+                    # Çoklu gecikme ile reverb (gecikmeli kopya yerinde eklenir, float64 sıfır dizisi yok)
                     for delay_time, decay in zip(delay_times, decay_factors):
                         delay_samples = int(delay_time * self.sample_rate * room_size)
-                        if delay_samples < len(channel):
-                            delayed = np.concatenate([np.zeros(delay_samples), channel[:-delay_samples]])
-                            reverb_channel += delayed * decay * (1 - damping)
+                        if 0 < delay_samples < len(channel):
+                            reverb_channel[delay_samples:] += channel[:-delay_samples] * (decay * (1 - damping))
                     
                     # Early reflections
                     if early_reflections:
                         early_delay = int(0.01 * self.sample_rate)
-                        if early_delay < len(channel):
-                            early = np.concatenate([np.zeros(early_delay), channel[:-early_delay]])
-                            reverb_channel += early * 0.3
+                        if 0 < early_delay < len(channel):
+                            reverb_channel[early_delay:] += channel[:-early_delay] * 0.3
                     
                     # Wet/dry karışımı
                     reverb_audio[:, i] = channel * (1 - wet_level) + reverb_channel * wet_level
                 
-                return reverb_audio
+                return self.precision.check(reverb_audio, 'reverb')
             else:
                 reverb_channel = np.zeros_like(audio_data)
                 
                 for delay_time, decay in zip(delay_times, decay_factors):
                     delay_samples = int(delay_time * self.sample_rate * room_size)
-                    if delay_samples < len(audio_data):
-                        delayed = np.concatenate([np.zeros(delay_samples), audio_data[:-delay_samples]])
-                        reverb_channel += delayed * decay * (1 - damping)
+                    if 0 < delay_samples < len(audio_data):
+                        reverb_channel[delay_samples:] += audio_data[:-delay_samples] * (decay * (1 - damping))
                 
-                return audio_data * (1 - wet_level) + reverb_channel * wet_level
+                return self.precision.check(audio_data * (1 - wet_level) + reverb_channel * wet_level, 'reverb')
                 
+        except DtypeError:
+            raise
         except Exception as e:
-            print(f"Reverb hatası: {e}")
+            log.error("Reverb hatası: %s", e)
             return audio_data
     
+    @instrumented
     def add_chorus_advanced(self, audio_data, rate=1.5, depth=0.002, mix=0.5, voices=3):
         """Gelişmiş chorus efekti"""
         try:
-            print(f"🎭 Gelişmiş chorus: Rate={rate:.1f}Hz, Voices={voices}")
+            log.info("🎭 Gelişmiş chorus: Rate=%.1fHz, Voices=%s", rate, voices)
+            audio_data = self.precision.cast(audio_data)
             
             if len(audio_data.shape) == 2:
                 chorus_audio = np.zeros_like(audio_data)
@@ -171,7 +192,7 @@ class AdvancedAudioFeatures:
                     
                     chorus_audio[:, i] = channel * (1 - mix) + chorus_channel * mix
                 
-                return chorus_audio
+                return self.precision.check(chorus_audio, 'chorus')
             else:
                 chorus_channel = np.zeros_like(audio_data)
                 
@@ -190,17 +211,21 @@ class AdvancedAudioFeatures:
                     
                     chorus_channel += voice_channel / voices
                 
-                return audio_data * (1 - mix) + chorus_channel * mix
+                return self.precision.check(audio_data * (1 - mix) + chorus_channel * mix, 'chorus')
                 
+        except DtypeError:
+            raise
         except Exception as e:
-            print(f"Chorus hatası: {e}")
+            log.error("Chorus hatası: %s", e)
             return audio_data
     
+    @instrumented
     def add_distortion_advanced(self, audio_data, drive=2.0, mix=0.3, type='soft'):
         """Gelişmiş distortion efekti"""
         try:
-            print(f"🔥 Gelişmiş distortion: Drive={drive:.1f}, Type={type}")
+            log.info("🔥 Gelişmiş distortion: Drive=%.1f, Type=%s", drive, type)
             
+            audio_data = self.precision.cast(audio_data)
             driven_audio = audio_data * drive
             
             if type == 'soft':
@@ -219,18 +244,21 @@ class AdvancedAudioFeatures:
                 distorted = np.tanh(driven_audio)
             
             # Wet/dry karışımı
-            return audio_data * (1 - mix) + distorted * mix
+            return self.precision.check(audio_data * (1 - mix) + distorted * mix, 'distortion')
             
+        except DtypeError:
+            raise
         except Exception as e:
-            print(f"Distortion hatası: {e}")
+            log.error("Distortion hatası: %s", e)
             return audio_data
     
+    @instrumented
     def parametric_eq_advanced(self, audio_data, bands):
         """Gelişmiş parametrik EQ"""
         try:
-            print(f"🎛️ Gelişmiş parametrik EQ: {len(bands)} band")
+            log.info("🎛️ Gelişmiş parametrik EQ: %s band", len(bands))
             
-            processed = audio_data.copy()
+            processed = self.precision.cast(audio_data).copy()
             
             for band in bands:
                 freq = band.get('freq', 1000)
@@ -278,9 +306,9 @@ class AdvancedAudioFeatures:
                 else:
                     continue
                 
-                # Normalize
-                b = [b0/a0, b1/a0, b2/a0]
-                a = [1, a1/a0, a2/a0]
+                # Normalize (katsayılar veriyle aynı dtype, lfilter float64'e yükseltmesin)
+                b = np.array([b0/a0, b1/a0, b2/a0], dtype=self.dtype)
+                a = np.array([1, a1/a0, a2/a0], dtype=self.dtype)
                 
                 if len(processed.shape) == 2:
                     # Stereo
@@ -290,17 +318,21 @@ class AdvancedAudioFeatures:
                     # Mono
                     processed = signal.lfilter(b, a, processed)
             
-            return processed
+            return self.precision.check(processed, 'parametric_eq')
                 
+        except DtypeError:
+            raise
         except Exception as e:
-            print(f"Parametrik EQ hatası: {e}")
+            log.error("Parametrik EQ hatası: %s", e)
             return audio_data
     
+    @instrumented
     def vocal_isolation_advanced(self, audio_data, method='center'):
         """Gelişmiş vokal izolasyonu"""
         try:
-            print(f"🎤 Gelişmiş vokal izolasyon: {method}")
+            log.info("🎤 Gelişmiş vokal izolasyon: %s", method)
             
+            audio_data = self.precision.cast(audio_data)
             if len(audio_data.shape) != 2:
                 return audio_data
             
@@ -310,38 +342,38 @@ class AdvancedAudioFeatures:
             if method == 'center':
                 # Center channel extraction
                 center = (left + right) / 2
-                return np.column_stack((center, center))
+                return self.precision.check(np.column_stack((center, center)), 'vocal_isolation')
             elif method == 'karaoke':
                 # Karaoke (vocal removal)
                 karaoke = (left - right) / 2
-                return np.column_stack((karaoke, karaoke))
+                return self.precision.check(np.column_stack((karaoke, karaoke)), 'vocal_isolation')
             elif method == 'advanced':
                 # Gelişmiş vokal izolasyon
-                # FFT tabanlı işleme
-                fft_left = np.fft.fft(left)
-                fft_right = np.fft.fft(right)
-                
-                # Center channel'ı güçlendir
-                fft_center = (fft_left + fft_right) / 2
+                # FFT tabanlı işleme (gerçek FFT, float32 veride complex64 kalır)
+                fft_center = sp_fft.rfft(left + right)
+                fft_center *= 0.5
                 
                 # Yüksek frekanslarda daha az karışım
-                freqs = np.fft.fftfreq(len(fft_center), 1/self.sample_rate)
-                mask = np.abs(freqs) > 4000
-                fft_center[mask] = fft_center[mask] * 0.5
+                freqs = sp_fft.rfftfreq(len(left), 1/self.sample_rate)
+                fft_center[freqs > 4000] *= 0.5
                 
-                isolated = np.fft.ifft(fft_center).real
-                return np.column_stack((isolated, isolated))
+                isolated = sp_fft.irfft(fft_center, n=len(left))
+                return self.precision.check(np.column_stack((isolated, isolated)), 'vocal_isolation')
             else:
                 return audio_data
                 
+        except DtypeError:
+            raise
         except Exception as e:
-            print(f"Vokal izolasyon hatası: {e}")
+            log.error("Vokal izolasyon hatası: %s", e)
             return audio_data
     
+    @instrumented
     def normalize_advanced(self, audio_data, target_db=-3.0, method='peak'):
         """Gelişmiş ses normalizasyonu"""
         try:
-            print(f"📊 Gelişmiş normalizasyon: {target_db:.1f}dB ({method})")
+            log.info("📊 Gelişmiş normalizasyon: %.1fdB (%s)", target_db, method)
+            audio_data = self.precision.cast(audio_data)
             
             if method == 'peak':
                 # Peak normalizasyon
@@ -349,7 +381,7 @@ class AdvancedAudioFeatures:
                 if peak > 0:
                     target_peak = 10 ** (target_db / 20)
                     normalized = audio_data * (target_peak / peak)
-                    return normalized
+                    return self.precision.check(normalized, 'normalize')
             elif method == 'rms':
                 # RMS normalizasyon
                 rms = np.sqrt(np.mean(audio_data**2))
@@ -357,7 +389,7 @@ class AdvancedAudioFeatures:
                     target_rms = 10 ** (target_db / 20)
                     normalized = audio_data * (target_rms / rms)
                     # Peak limiting
-                    return np.clip(normalized, -1, 1)
+                    return self.precision.check(np.clip(normalized, -1, 1), 'normalize')
             elif method == 'lufs':
                 # LUFS normalizasyon (basitleştirilmiş)
                 # Gerçek LUFS hesaplaması çok karmaşık, burada RMS benzeri yaklaşım
@@ -372,36 +404,40 @@ class AdvancedAudioFeatures:
                 if combined_rms > 0:
                     target_rms = 10 ** (target_db / 20)
                     normalized = audio_data * (target_rms / combined_rms)
-                    return np.clip(normalized, -1, 1)
+                    return self.precision.check(np.clip(normalized, -1, 1), 'normalize')
             
             return audio_data
                 
+        except DtypeError:
+            raise
         except Exception as e:
-            print(f"Normalizasyon hatası: {e}")
+            log.error("Normalizasyon hatası: %s", e)
             return audio_data
     
+    @instrumented
     def fade_in_out_advanced(self, audio_data, fade_in_duration=1.0, fade_out_duration=1.0, curve='linear'):
         """Gelişmiş fade in/out efekti"""
         try:
-            print(f"🌅 Gelişmiş fade: In={fade_in_duration:.1f}s, Out={fade_out_duration:.1f}s ({curve})")
+            log.info("🌅 Gelişmiş fade: In=%.1fs, Out=%.1fs (%s)", fade_in_duration, fade_out_duration, curve)
             
             fade_in_samples = int(fade_in_duration * self.sample_rate)
             fade_out_samples = int(fade_out_duration * self.sample_rate)
             
-            result = audio_data.copy()
+            result = self.precision.cast(audio_data).copy()
+            dtype = result.dtype
             
             # Fade in
             if fade_in_samples > 0 and fade_in_samples < len(result):
                 if curve == 'linear':
-                    fade_in_curve = np.linspace(0, 1, fade_in_samples)
+                    fade_in_curve = np.linspace(0, 1, fade_in_samples, dtype=dtype)
                 elif curve == 'exponential':
-                    fade_in_curve = np.exp(np.linspace(-5, 0, fade_in_samples))
+                    fade_in_curve = np.exp(np.linspace(-5, 0, fade_in_samples, dtype=dtype))
                 elif curve == 'logarithmic':
-                    fade_in_curve = np.log(np.linspace(1, np.e, fade_in_samples))
+                    fade_in_curve = np.log(np.linspace(1, np.e, fade_in_samples, dtype=dtype))
                 elif curve == 'sine':
-                    fade_in_curve = np.sin(np.linspace(0, np.pi/2, fade_in_samples))
+                    fade_in_curve = np.sin(np.linspace(0, np.pi/2, fade_in_samples, dtype=dtype))
                 else:
-                    fade_in_curve = np.linspace(0, 1, fade_in_samples)
+                    fade_in_curve = np.linspace(0, 1, fade_in_samples, dtype=dtype)
                 
                 if len(result.shape) == 2:
                     result[:fade_in_samples, 0] *= fade_in_curve
@@ -412,15 +448,15 @@ class AdvancedAudioFeatures:
             # Fade out
             if fade_out_samples > 0 and fade_out_samples < len(result):
                 if curve == 'linear':
-                    fade_out_curve = np.linspace(1, 0, fade_out_samples)
+                    fade_out_curve = np.linspace(1, 0, fade_out_samples, dtype=dtype)
                 elif curve == 'exponential':
-                    fade_out_curve = np.exp(np.linspace(0, -5, fade_out_samples))
+                    fade_out_curve = np.exp(np.linspace(0, -5, fade_out_samples, dtype=dtype))
                 elif curve == 'logarithmic':
-                    fade_out_curve = np.log(np.linspace(np.e, 1, fade_out_samples))
+                    fade_out_curve = np.log(np.linspace(np.e, 1, fade_out_samples, dtype=dtype))
                 elif curve == 'sine':
-                    fade_out_curve = np.sin(np.linspace(np.pi/2, 0, fade_out_samples))
+                    fade_out_curve = np.sin(np.linspace(np.pi/2, 0, fade_out_samples, dtype=dtype))
                 else:
-                    fade_out_curve = np.linspace(1, 0, fade_out_samples)
+                    fade_out_curve = np.linspace(1, 0, fade_out_samples, dtype=dtype)
                 
                 if len(result.shape) == 2:
                     result[-fade_out_samples:, 0] *= fade_out_curve
@@ -428,16 +464,19 @@ class AdvancedAudioFeatures:
                 else:
                     result[-fade_out_samples:] *= fade_out_curve
             
-            return result
+            return self.precision.check(result, 'fade')
             
+        except DtypeError:
+            raise
         except Exception as e:
-            print(f"Fade efekti hatası: {e}")
+            log.error("Fade efekti hatası: %s", e)
             return audio_data
     
+    @instrumented
     def spectral_analysis(self, audio_data):
         """Spektral analiz"""
         try:
-            print("📊 Spektral analiz yapılıyor...")
+            log.info("📊 Spektral analiz yapılıyor...")
             
             if len(audio_data.shape) == 2:
                 # Stereo - sol kanalı analiz et
@@ -479,16 +518,14 @@ class AdvancedAudioFeatures:
                 'total_energy': np.sum(positive_magnitude)
             }
             
-            print(f"   🎵 Peak Frequency: {peak_frequency:.1f} Hz")
-            print(f"   📊 Spectral Centroid: {spectral_centroid:.1f} Hz")
-            print(f"   🔊 Bass Energy: {bass_energy:.2f}")
-            print(f"   🎤 Mid Energy: {mid_energy:.2f}")
-            print(f"   ✨ Treble Energy: {treble_energy:.2f}")
+            log.info("   🎵 Peak Frequency: %.1f Hz\n   📊 Spectral Centroid: %.1f Hz\n   🔊 Bass Energy: %.2f\n"
+                     "   🎤 Mid Energy: %.2f\n   ✨ Treble Energy: %.2f",
+                     peak_frequency, spectral_centroid, bass_energy, mid_energy, treble_energy)
             
             return analysis
             
         except Exception as e:
-            print(f"Spektral analiz hatası: {e}")
+            log.error("Spektral analiz hatası: %s", e)
             return {}
 
 # Test fonksiyonu
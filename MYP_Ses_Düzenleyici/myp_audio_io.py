@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MYP Ses Düzenleyici - Hızlı Ses Okuma
+Mehmet Yay tarafından geliştirildi
+"""
+
+import os
+import json
+import subprocess
+import numpy as np
+import soundfile as sf
+
+# libsndfile ile doğrudan okunan formatlar
+SOUNDFILE_FORMATS = ('.wav', '.flac', '.ogg')
+# ffmpeg ham PCM borusu ile çözülen formatlar
+FFMPEG_FORMATS = ('.mp3', '.aac', '.m4a', '.wma')
+
+FFMPEG_BINARY = os.environ.get('MYP_FFMPEG', 'ffmpeg')
+FFPROBE_BINARY = os.environ.get('MYP_FFPROBE', 'ffprobe')
+
+
+def decoder_backend(file_path):
+    """Dosya uzantısına göre kullanılacak çözücü"""
+    file_ext = os.path.splitext(file_path)[1].lower()
+    if file_ext in SOUNDFILE_FORMATS:
+        return 'soundfile'
+    if file_ext in FFMPEG_FORMATS:
+        return 'ffmpeg'
+    raise ValueError(f"Desteklenmeyen format: {file_ext}")
+
+
+def _probe_ffmpeg(file_path):
+    """ffprobe ile sample rate, kanal sayısı ve süreyi al"""
+    result = subprocess.run(
+        [FFPROBE_BINARY, '-v', 'error', '-select_streams', 'a:0',
+         '-show_entries', 'stream=sample_rate,channels:format=duration',
+         '-of', 'json', file_path],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True
+    )
+    probe = json.loads(result.stdout)
+    stream = probe['streams'][0]
+    duration = float(probe.get('format', {}).get('duration') or 0)
+    return int(stream['sample_rate']), int(stream['channels']), duration
+
+
+def _open_ffmpeg_pipe(file_path):
+    """Dosyayı float32 little-endian ham PCM olarak stdout'a çözen ffmpeg süreci"""
+    return subprocess.Popen(
+        [FFMPEG_BINARY, '-v', 'error', '-i', file_path,
+         '-map', '0:a:0', '-f', 'f32le', '-acodec', 'pcm_f32le', '-'],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+    )
+
+
+def _read_into(stream, buffer):
+    """Ham baytları doğrudan NumPy tamponuna oku, okunan bayt sayısını döndür"""
+    view = memoryview(buffer).cast('B')
+    filled = 0
+    while filled < len(view):
+        count = stream.readinto(view[filled:])
+        if not count:
+            break
+        filled += count
+    return filled
+
+
+def audio_info(file_path):
+    """(sample rate, kanal sayısı, çözücü) döndür"""
+    backend = decoder_backend(file_path)
+    if backend == 'soundfile':
+        info = sf.info(file_path)
+        return info.samplerate, info.channels, backend
+    sample_rate, channels, _ = _probe_ffmpeg(file_path)
+    return sample_rate, channels, backend
+
+
+def read_audio(file_path, dtype=np.float32):
+    """Dosyayı önceden ayrılmış (samples, channels) tampona oku
+
+    (ses verisi, sample rate, çözücü) döndürür
+    """
+    backend = decoder_backend(file_path)
+
+    if backend == 'soundfile':
+        with sf.SoundFile(file_path) as source:
+            audio_data = np.empty((source.frames, source.channels), dtype=dtype)
+            frames = len(source.read(out=audio_data))
+            return audio_data[:frames], source.samplerate, backend
+
+    sample_rate, channels, duration = _probe_ffmpeg(file_path)
+    frame_bytes = channels * 4
+
+    # Süreden tahmini tampon, gerekirse büyütülür
+    capacity = int(duration * sample_rate * 1.01) + sample_rate
+    audio_data = np.empty((capacity, channels), dtype=np.float32)
+
+    process = _open_ffmpeg_pipe(file_path)
+    try:
+        frames = _read_into(process.stdout, audio_data) // frame_bytes
+        while frames == len(audio_data):
+            grown = np.empty((len(audio_data) * 2, channels), dtype=np.float32)
+            grown[:frames] = audio_data
+            audio_data = grown
+            frames += _read_into(process.stdout, audio_data[frames:]) // frame_bytes
+    finally:
+        process.stdout.close()
+        if process.wait() != 0:
+            raise RuntimeError(f"ffmpeg çözme hatası: {os.path.basename(file_path)}")
+
+    return audio_data[:frames].astype(dtype, copy=False), sample_rate, backend
+
+
+def iter_audio_blocks(file_path, block_size, dtype=np.float32):
+    """Dosyayı (samples, channels) float bloklar halinde sırayla oku"""
+    backend = decoder_backend(file_path)
+
+    if backend == 'soundfile':
+        with sf.SoundFile(file_path) as source:
+            for block in source.blocks(blocksize=block_size, dtype=np.dtype(dtype).name, always_2d=True):
+                yield block
+        return
+
+    _, channels, _ = _probe_ffmpeg(file_path)
+    frame_bytes = channels * 4
+
+    process = _open_ffmpeg_pipe(file_path)
+    try:
+        while True:
+            block = np.empty((block_size, channels), dtype=np.float32)
+            frames = _read_into(process.stdout, block) // frame_bytes
+            if frames == 0:
+                break
+            yield block[:frames].astype(dtype, copy=False)
+            if frames < block_size:
+                break
+    finally:
+        process.stdout.close()
+        returncode = process.wait()
+
+    # Tüketici üreteci erken kapattıysa buraya gelinmez (boru kırıldığı için ffmpeg hata döner);
+    # tamamı okunduysa bozuk dosya read_audio'daki gibi hata verir, kesik sinyal akmaz
+    if returncode != 0:
+        raise RuntimeError(f"ffmpeg çözme hatası: {os.path.basename(file_path)}")
@@ -9,7 +9,6 @@ import librosa
 import soundfile as sf
 import numpy as np
 from scipy import signal
-import noisereduce as nr
 from pydub import AudioSegment
 from pydub.effects import normalize, compress_dynamic_range
 import os
@@ -18,568 +17,1300 @@ import time
 import threading
 from concurrent.futures import ThreadPoolExecutor
 import multiprocessing
-import gc
+import tempfile
+from myp_filter_bank import filter_bank
+from myp_audio_io import read_audio, audio_info, iter_audio_blocks
+from myp_resampler import resample, StreamingResampler, DEFAULT_QUALITY
+from myp_precision import PrecisionPolicy, DEFAULT_PRECISION, DtypeError
+from myp_buffer_pool import buffer_pool, Workspace
+from myp_limiter import TruePeakLimiter, DEFAULT_CEILING_DB, DEFAULT_RELEASE
+from myp_spectral import SpectralNoiseReducer, CHUNK_SIZE, PADDING, stationary_threshold
+from myp_noise_profile import NoiseProfile, learn_noise_profile, noise_profiles
+from myp_thread_pool import parallel_map
+from myp_segment_render import SegmentRenderer
+from myp_pipeline import StagePipeline
+from myp_instrumentation import instrumentation
+from myp_stage_cache import CachedChain
+from myp_render_scheduler import RenderCancelled
+from myp_logging import get_logger, INFO
 warnings.filterwarnings('ignore')
 
+log = get_logger('audio_processor')
+
 class AdvancedAudioProcessor:
     """Gelişmiş ses işleme motoru"""
     
-    def __init__(self):
+    # Doğrusal EQ aşamaları (kuru sinyal + bant karışımı): ayar anahtarı -> metod
+    LINEAR_EQ_STAGES = (
+        ('vocal_enhance', 'professional_vocal_enhance'),
+        ('bass_boost', 'cinematic_bass_boost'),
+        ('treble_enhance', 'crystal_treble_enhance'),
+        ('warmth_filter', 'heart_touching_warmth'),
+    )
+    
+    # Birleşik EQ: impuls yanıtı en fazla bu süre kadar hesaplanır ve kuyruk
+    # enerjisi toplam enerjinin bu oranının altına düştüğü yerden kesilir.
+    # Ardışık zincirle fark tipik olarak tepe girişin 1e-5'i (-100 dB) civarında,
+    # belgelenen tolerans 1e-4 (-80 dB)
+    FUSED_EQ_MAX_SECONDS = 2.0
+    FUSED_EQ_TAIL_TOLERANCE = 1e-12
+    
+    # Bant tabloları: (derece, kesim frekansı, tip, karışım ağırlığı)
+    VOCAL_BANDS = (
+        (6, (200, 4000), 'band', 0.3),    # Ana vokal frekansları
+        (4, (2000, 6000), 'band', 0.25),  # Vokal berraklığı
+        (3, (400, 1500), 'band', 0.2),    # Vokal sıcaklığı
+        (4, (1000, 3000), 'band', 0.15),  # Vokal varlığı
+    )
+    BASS_BANDS = (
+        (8, (20, 60), 'band', 0.4),       # Sub-bass - Derinlik
+        (6, (60, 200), 'band', 0.35),     # Mid-bass - Güç
+        (4, (200, 500), 'band', 0.25),    # Upper-bass - Sıcaklık
+        (4, (80, 120), 'band', 0.3),      # Punch bass - Vuruş
+    )
+    TREBLE_BANDS = (
+        (6, (3000, 6000), 'band', 0.3),   # Presence - Netlik
+        (4, (6000, 12000), 'band', 0.25), # Brilliance - Parlaklık
+        (3, (12000, 20000), 'band', 0.15),# Air - Hava
+        (4, (8000, 16000), 'band', 0.2),  # Sparkle - Işıltı
+    )
+    WARMTH_BANDS = (
+        (6, (300, 1200), 'band', 0.3),    # Ana sıcaklık frekansları
+        (4, (800, 2500), 'band', 0.2),    # Yumuşaklık frekansları
+        (4, (150, 600), 'band', 0.25),    # İntimacy frekansları
+        (3, (400, 1000), 'band', 0.15),   # Comfort frekansları
+    )
+    # Stereo genişletmede side sinyal bantları: (derece, kesim frekansı, tip, genişletme)
+    STEREO_SIDE_BANDS = (
+        (4, 200, 'low', 0.2),             # Düşük frekanslar - Az genişletme
+        (4, (200, 2000), 'band', 0.6),    # Orta frekanslar - Orta genişletme
+        (4, (2000, 8000), 'band', 1.0),   # Yüksek frekanslar - Maksimum genişletme
+        (4, 8000, 'high', 0.4),           # Çok yüksek frekanslar - Orta genişletme
+    )
+    # Kompresyon bantları: (derece, kesim frekansı, tip, yoğunluk çarpanı, eşik)
+    COMPRESSION_BANDS = (
+        (4, (20, 200), 'band', 0.8, 0.6),     # Düşük frekans bandı
+        (4, (200, 2000), 'band', 1.0, 0.5),   # Orta frekans bandı
+        (4, (2000, 20000), 'band', 0.7, 0.7), # Yüksek frekans bandı
+    )
+    
+    # Mastering son EQ filtreleri: (derece, kesim frekansı, tip)
+    MASTERING_FILTERS = {
+        'hpf': (2, 20, 'high'),                # Düşük frekans temizliği (20Hz altı)
+        'lpf': (2, 18000, 'low'),              # Yüksek frekans yumuşatma (18kHz üstü)
+        'presence': (2, (2000, 5000), 'band'), # Presence boost (2kHz - 5kHz)
+    }
+    
+    # Ayar verilmeden çağrılan dosya işleme için varsayılan yoğunluklar
+    DEFAULT_SETTINGS = {
+        'noise_reduction': 0.8,
+        'vocal_enhance': 0.7,
+        'bass_boost': 0.6,
+        'treble_enhance': 0.7,
+        'stereo_enhance': 0.5,
+        'warmth_filter': 0.4,
+        'compression': 0.6,
+        'mastering': 0.8
+    }
+    
+    # Akış işleme: blok boyu (~12 sn @ 44.1 kHz)
+    STREAM_BLOCK_SIZE = 2 ** 19
+    
+    # Gürültü azaltma sonrası aşamalar bu boydaki parçalar halinde, tampon üzerinde
+    # yerinde çalışır (IIR/FIR durumu parçalar arasında taşınır, parça önbellekte kalır)
+    STAGE_CHUNK_SIZE = 2 ** 16
+    
+    # MP3 kodlayıcının kabul ettiği sample rate değerleri (dışa aktarımda gerekirse tek seferlik dönüşüm)
+    MP3_SAMPLE_RATES = (48000, 44100, 32000, 24000, 22050, 16000, 12000, 11025, 8000)
+    
+    # Zincirin son adımı: ileri bakışlı true-peak limiter ya da eski global tepe normalizasyonu
+    FINAL_STAGES = ('limiter', 'normalize')
+    
+    # Etkileşimli önizleme (proxy) sample rate'i: ayar sürüklenirken mono, seyreltilmiş kopya işlenir
+    PROXY_SAMPLE_RATE = 11025
+    
+    def __init__(self, fused_eq=False, resample_quality=DEFAULT_QUALITY, native_rate=False, output_channels=2,
+                 precision=DEFAULT_PRECISION, debug_dtype=None, final_stage='limiter',
+                 limiter_ceiling=DEFAULT_CEILING_DB, limiter_release=DEFAULT_RELEASE, noise_profile=None,
+                 parallel=False, segment_seconds=None, pipeline=False):
         self.sample_rate = 44100
         self.bit_depth = 16
-        self.channels = 2
+        # Dışa aktarım kanal düzeni: 2 ise mono kaynak yalnızca yazılırken
+        # stereo'ya çoğaltılır, None ise kaynağın düzeni korunur
+        self.channels = output_channels
         self.version = "3.0"
         self.cpu_count = multiprocessing.cpu_count()
+        # Son yüklemede kullanılan çözücü ('soundfile' / 'ffmpeg')
+        self.last_load_backend = None
+        # Filtreler süreç genelinde bir kez tasarlanır (kanal/dosya/thread ortak)
+        self.filter_bank = filter_bank
+        # Vokal/bas/tiz/sıcaklık aşamalarını tek bir filtreye derleyip tek geçişte uygula
+        self.fused_eq = fused_eq
+        # Yeniden örnekleme kalitesi ('fast' / 'medium' / 'high')
+        self.resample_quality = resample_quality
+        # True: dosyalar özgün sample rate'te işlenir, filtreler o rate için tasarlanır
+        self.native_rate = native_rate
+        # Son yüklenen verinin sample rate'i (native_rate açıkken dosyanınki)
+        self.last_load_sample_rate = None
+        # Zincirin tek dtype'ı (float32 / float64); debug modunda her aşama çıktısı doğrulanır
+        self.precision = PrecisionPolicy(precision, debug_dtype)
+        self.dtype = self.precision.dtype
+        # Karalama tamponları çalıştırmalar arasında yeniden kullanılır
+        self.buffer_pool = buffer_pool
+        # Son işlemenin bellek özeti (çıktı + çalışma alanı tepe baytı, havuz sayaçları)
+        self.last_memory_stats = None
+        # 'limiter': tavan (dBTP) ve release (sn) ile sınırla, akışta tek geçiş yeter;
+        # 'normalize': tüm sinyalin tepe değerine göre ölçekle (iki geçiş)
+        if final_stage not in self.FINAL_STAGES:
+            raise ValueError(f"Geçersiz son aşama: {final_stage} ({', '.join(self.FINAL_STAGES)})")
+        self.final_stage = final_stage
+        self.limiter_ceiling = limiter_ceiling
+        self.limiter_release = limiter_release
+        # Gürültü azaltmada kullanılacak sabit gürültü profili (ad ya da NoiseProfile);
+        # None ise her dosyanın gürültüsü kendi içinden tahmin edilir
+        self.noise_profiles = noise_profiles
+        self.noise_profile = None
+        if noise_profile is not None:
+            self.use_noise_profile(noise_profile)
+        # Dosya içi paralellik: kanallar ve bağımsız bant filtreleri paylaşılan
+        # iş parçacığı havuzunda (self.cpu_count işçi); toplu işlemede kapalı kalır
+        self.parallel = parallel
+        # Verilirse bu süreden (sn) iki kat uzun sinyaller parçalara bölünüp paralel işlenir
+        self.segment_seconds = segment_seconds
+        # True: aşamalar ayrı iş parçacıklarında, sınırlı kuyruklarla boru hattı olarak çalışır
+        # (blok k+1 gürültü azaltmadayken blok k EQ'da); son çalıştırmanın aşama kullanımı saklanır
+        self.pipeline = pipeline
+        self.last_pipeline_stats = None
+        # Aşama ölçümleri (süre, CPU, bellek); hedef eklenmedikçe kapalı ve maliyetsiz
+        self.instrumentation = instrumentation
         
     def load_audio_advanced(self, file_path):
         """Gelişmiş ses dosyası yükleme"""
         try:
-            print(f"📂 Gelişmiş ses yükleme: {os.path.basename(file_path)}")
+            log.info("📂 Gelişmiş ses yükleme: %s", os.path.basename(file_path))
             
-            # Çoklu format desteği
-            supported_formats = ['.mp3', '.wav', '.flac', '.aac', '.ogg', '.m4a', '.wma']
-            file_ext = os.path.splitext(file_path)[1].lower()
+            # WAV/FLAC/OGG soundfile ile, MP3/AAC/M4A/WMA ffmpeg borusu ile
+            # doğrudan politika dtype'ındaki tampona çözülür (desteklenmeyen format ValueError)
+            audio_data, original_sr, backend = read_audio(file_path, dtype=self.dtype)
+            self.last_load_backend = backend
             
-            if file_ext not in supported_formats:
-                raise ValueError(f"Desteklenmeyen format: {file_ext}")
+            # Dosya analizi (yalnızca tanı amaçlı: sessiz modda hesaplanmaz)
+            original_channels = audio_data.shape[1]
+            diagnostics = log.isEnabledFor(INFO)
+            if diagnostics:
+                log.info("📊 Dosya Analizi:\n   ⏱️ Süre: %.2f saniye\n   🔊 Kanal: %s (%s)\n"
+                         "   📈 Sample Rate: %s Hz\n   💾 Boyut: %.2f MB\n   ⚙️ Çözücü: %s",
+                         len(audio_data) / original_sr, original_channels,
+                         'Stereo' if original_channels == 2 else 'Mono', original_sr,
+                         os.path.getsize(file_path) / (1024 * 1024), backend)
             
-            # Pydub ile yükle
-            audio = AudioSegment.from_file(file_path)
+            # Optimizasyon (önce yeniden örnekleme, sonra kanal çoğaltma: daha az iş)
+            if self.native_rate:
+                log.info("🎯 Özgün sample rate'te işlenecek: %s Hz", original_sr)
+            elif original_sr != self.sample_rate:
+                audio_data = resample(audio_data, original_sr, self.sample_rate, self.resample_quality)
+                log.info("🔄 Sample rate %s Hz'e ayarlandı", self.sample_rate)
             
-            # Dosya analizi
-            duration = len(audio) / 1000
-            original_sr = audio.frame_rate
-            original_channels = audio.channels
-            file_size = os.path.getsize(file_path) / (1024 * 1024)
-            
-            print(f"📊 Dosya Analizi:")
-            print(f"   ⏱️ Süre: {duration:.2f} saniye")
-            print(f"   🔊 Kanal: {original_channels} ({'Stereo' if original_channels == 2 else 'Mono'})")
-            print(f"   📈 Sample Rate: {original_sr} Hz")
-            print(f"   💾 Boyut: {file_size:.2f} MB")
-            
-            # Optimizasyon
+            # Mono kaynak tüm zincir boyunca tek kanal (1-D) kalır
+            audio_data = self._to_processing_layout(audio_data)
             if original_channels == 1:
-                audio = audio.set_channels(2)
-                print("🔄 Mono'dan Stereo'ya dönüştürüldü")
-            
-            if original_sr != self.sample_rate:
-                audio = audio.set_frame_rate(self.sample_rate)
-                print(f"🔄 Sample rate {self.sample_rate} Hz'e ayarlandı")
+                log.info("🎙️ Mono kaynak mono olarak işlenecek")
             
-            # NumPy array'e çevir
-            samples = np.array(audio.get_array_of_samples())
-            if audio.channels == 2:
-                samples = samples.reshape((-1, 2))
-            
-            # Normalize
-            audio_data = samples.astype(np.float32) / 32768.0
-            
-            # Kalite kontrolü
-            peak_level = np.max(np.abs(audio_data))
-            rms_level = np.sqrt(np.mean(audio_data**2))
-            dynamic_range = peak_level / (rms_level + 1e-10)
-            
-            print(f"🎵 Ses Kalite Analizi:")
-            print(f"   📊 Peak Level: {20*np.log10(peak_level + 1e-10):.1f} dB")
-            print(f"   📊 RMS Level: {20*np.log10(rms_level + 1e-10):.1f} dB")
-            print(f"   📊 Dynamic Range: {20*np.log10(dynamic_range):.1f} dB")
+            # Kalite kontrolü (tam boy geçici dizi oluşturmadan; sessiz modda atlanır)
+            if diagnostics:
+                flat = audio_data.reshape(-1)
+                peak_level = max(float(flat.max()), -float(flat.min())) if flat.size else 0.0
+                rms_level = np.sqrt(np.dot(flat, flat) / max(flat.size, 1))
+                dynamic_range = peak_level / (rms_level + 1e-10)
+                
+                log.info("🎵 Ses Kalite Analizi:\n   📊 Peak Level: %.1f dB\n   📊 RMS Level: %.1f dB\n"
+                         "   📊 Dynamic Range: %.1f dB",
+                         20 * np.log10(peak_level + 1e-10), 20 * np.log10(rms_level + 1e-10),
+                         20 * np.log10(dynamic_range))
             
+            self.last_load_sample_rate = original_sr if self.native_rate else self.sample_rate
             return audio_data
             
         except Exception as e:
-            print(f"❌ Gelişmiş yükleme hatası: {e}")
+            log.error("❌ Gelişmiş yükleme hatası: %s", e)
             return None
     
-    def advanced_noise_reduction(self, audio_data, intensity=0.8):
-        """Gelişmiş çok katmanlı gürültü azaltma"""
+    def advanced_noise_reduction(self, audio_data, intensity=0.8, state=None, sample_rate=None, out=None):
+        """Gelişmiş çok katmanlı gürültü azaltma (out girişin kendisi olabilir)
+
+        state['threshold'] verilirse gürültü eşiği oradan alınır (parçalı işlemede tüm dosya için ortak),
+        state['offset'] verinin dosyadaki konumudur (STFT parçaları dosya genelinde hizalanır),
+        state['lead'] / state['trail'] baştaki / sondaki yalnızca bağlam olan örnek sayısıdır
+        (o bölgelerin çıktısı kullanılmaz)
+        """
         if intensity == 0:
             return audio_data
+        sample_rate = sample_rate or self.sample_rate
             
         try:
-            print(f"🔧 Gelişmiş gürültü temizleme (Yoğunluk: {intensity*100:.0f}%)")
+            log.info("🔧 Gelişmiş gürültü temizleme (Yoğunluk: %.0f%%)", intensity * 100)
             
-            # Çok katmanlı gürültü azaltma
-            if len(audio_data.shape) == 2:
-                cleaned = np.zeros_like(audio_data)
-                
-                for i in range(2):
-                    # 1. Katman: Stationary noise reduction
-                    first_pass = nr.reduce_noise(
-                        y=audio_data[:, i], 
-                        sr=self.sample_rate,
-                        stationary=True,
-                        prop_decrease=intensity * 0.6
-                    )
-                    
-                    # 2. Katman: Non-stationary noise reduction
-                    second_pass = nr.reduce_noise(
-                        y=first_pass, 
-                        sr=self.sample_rate,
-                        stationary=False,
-                        prop_decrease=intensity * 0.4
-                    )
-                    
-                    cleaned[:, i] = second_pass
-                
-                return cleaned
-            else:
-                # Mono için
-                first_pass = nr.reduce_noise(
-                    y=audio_data, 
-                    sr=self.sample_rate,
-                    stationary=True,
-                    prop_decrease=intensity * 0.6
-                )
-                
-                return nr.reduce_noise(
-                    y=first_pass, 
-                    sr=self.sample_rate,
-                    stationary=False,
-                    prop_decrease=intensity * 0.4
-                )
+            # Kayıtlı profil ya da taşınan eşik varsa gürültü istatistiği tahmini atlanır
+            threshold = None if state is None else state.get('threshold')
+            offset = 0 if state is None else state.get('offset', 0)
+            lead = 0 if state is None else state.get('lead', 0)
+            trail = 0 if state is None else state.get('trail', 0)
+            if threshold is None and self.noise_profile is not None:
+                channel_count = 1 if audio_data.ndim == 1 else audio_data.shape[1]
+                threshold = self.noise_profile.threshold_for(sample_rate, channel_count)
+            
+            # 1. Katman: stationary, 2. Katman: non-stationary gürültü azaltma;
+            # ikisi de tek STFT üzerinde (kanallar birlikte, istatistikler kanal başına)
+            reducer = SpectralNoiseReducer(sample_rate, intensity * 0.6, intensity * 0.4)
+            columns = self._columns(audio_data)
+            if columns == [None]:
+                return reducer.process(audio_data, threshold=threshold, out=out, offset=offset, lead=lead, trail=trail)
+            
+            # Paralel mod: her kanal kendi STFT'siyle ayrı iş (out girişin kendisi olabilir)
+            out = np.empty_like(audio_data) if out is None else out
+            
+            def reduce_column(column):
+                column_threshold = None if threshold is None else threshold[column:column + 1]
+                reducer.process(audio_data[:, column], threshold=column_threshold, out=out[:, column],
+                                offset=offset, lead=lead, trail=trail)
+            
+            for _ in self._map(reduce_column, columns):
+                pass
+            return out
                 
         except Exception as e:
-            print(f"⚠️ Gürültü azaltma hatası: {e}")
+            log.warning("⚠️ Gürültü azaltma hatası: %s", e)
             return audio_data
     
-    def professional_vocal_enhance(self, audio_data, intensity=0.7):
+    def use_noise_profile(self, profile):
+        """Gürültü azaltmada sabit profil kullan (ad verilirse depodan yüklenir, None: kapalı)"""
+        if isinstance(profile, str):
+            profile = self.noise_profiles.load(profile)
+        if profile is not None and not isinstance(profile, NoiseProfile):
+            raise TypeError(f"Geçersiz gürültü profili: {profile!r}")
+        self.noise_profile = profile
+        return profile
+    
+    def learn_noise_profile(self, source, seconds=None, name=None, sample_rate=None):
+        """Referans klipten ya da dosyanın ilk N saniyesinden gürültü profili öğren
+
+        source: dosya yolu veya ses verisi; name verilirse profil diske kaydedilir.
+        Öğrenilen profil bu işlemcide hemen kullanılmaya başlar.
+        """
+        if isinstance(source, str):
+            source_rate, _, _ = audio_info(source)
+            sample_rate = source_rate if self.native_rate else self.sample_rate
+            # Yalnızca gereken baş kısım okunur (işleme rate'ine dönüştürülerek)
+            needed = None if seconds is None else int(seconds * sample_rate)
+            blocks = []
+            total = 0
+            reader = self._iter_input_blocks(source, self.STREAM_BLOCK_SIZE, source_rate, sample_rate)
+            try:
+                for block in reader:
+                    blocks.append(block)
+                    total += len(block)
+                    if needed is not None and total >= needed:
+                        break
+            finally:
+                reader.close()
+            audio_data = np.concatenate(blocks) if blocks else np.zeros(0, dtype=self.dtype)
+            label = os.path.basename(source)
+        else:
+            audio_data = self.precision.cast(source)
+            sample_rate = sample_rate or self.sample_rate
+            label = ''
+        
+        profile = learn_noise_profile(audio_data, sample_rate, seconds, source=label)
+        log.info("🔇 Gürültü profili öğrenildi: %s kanal, %s Hz%s",
+                 profile.channels, sample_rate, f", {seconds:g} sn" if seconds else "")
+        if name:
+            path = self.noise_profiles.save(name, profile)
+            log.info("💾 Gürültü profili kaydedildi: %s (%s)", name, path)
+        self.noise_profile = profile
+        return profile
+    
+    @property
+    def parallel_workers(self):
+        """Dosya içi paralel işçi sayısı (paralel mod kapalıysa 1)"""
+        return self.cpu_count if self.parallel else 1
+    
+    def _map(self, func, items):
+        """Paralel modda işleri paylaşılan havuzda, değilse sırayla çalıştır (sıra korunur)"""
+        return parallel_map(func, items, self.parallel_workers)
+    
+    def _columns(self, audio_data):
+        """Paralel işlenecek kanal sütunları (seri modda ya da mono'da tek parça: None)"""
+        if self.parallel_workers <= 1 or audio_data.ndim == 1:
+            return [None]
+        return list(range(audio_data.shape[1]))
+    
+    def _filter_bands(self, audio_data, filters, state=None):
+        """Bağımsız bant filtrelerini uygula; (filtre sırası, kanal, bant) üret
+
+        filters: (durum anahtarı, sos) listesi. Paralel modda her (bant, kanal)
+        çifti ayrı iştir; kanal None ise bant tüm kanalları kapsar.
+        """
+        jobs = [(index, column) for index in range(len(filters)) for column in self._columns(audio_data)]
+        
+        def run(job):
+            index, column = job
+            key, sos = filters[index]
+            if column is None:
+                return self._sosfilt(sos, audio_data, state, key)
+            return self._sosfilt(sos, audio_data[:, column], state, (key, column))
+        
+        for (index, column), band in zip(jobs, self._map(run, jobs)):
+            yield index, column, band
+    
+    def _sosfilt(self, sos, audio_data, state=None, key=None):
+        """axis=0 boyunca sosfilt; state verilirse IIR durumu (zi) bloklar arasında taşınır"""
+        if state is None:
+            return signal.sosfilt(sos, audio_data, axis=0)
+        
+        zi = state.get(key)
+        if zi is None:
+            zi = np.zeros((sos.shape[0], 2) + audio_data.shape[1:], dtype=audio_data.dtype)
+        filtered, state[key] = signal.sosfilt(sos, audio_data, axis=0, zi=zi)
+        return filtered
+    
+    def _band_mix(self, audio_data, bands, intensity, state=None, sample_rate=None, out=None):
+        """Kuru sinyale ağırlıklı bant kopyalarını ekle (tüm kanallar tek seferde, axis=0)
+
+        out verilirse karışım oraya yazılır; bantlar kuru sinyalden süzüldüğü
+        için out girişle aynı dizi olamaz
+        """
+        sample_rate = sample_rate or self.sample_rate
+        if out is None:
+            mixed = audio_data.copy()
+        else:
+            mixed = out
+            np.copyto(mixed, audio_data)
+        
+        filters, weights = [], []
+        for i, (order, cutoff, btype, weight) in enumerate(bands):
+            sos = self.filter_bank.get_sos(order, cutoff, btype, sample_rate, self.dtype)
+            if sos is None:
+                continue  # Bant bu sample rate'in Nyquist sınırının üstünde
+            filters.append((i, sos))
+            weights.append(weight)
+        
+        for index, column, band in self._filter_bands(audio_data, filters, state):
+            band *= intensity * weights[index]
+            if column is None:
+                mixed += band
+            else:
+                mixed[:, column] += band
+        
+        return mixed
+    
+    def professional_vocal_enhance(self, audio_data, intensity=0.7, state=None, sample_rate=None, out=None):
         """Profesyonel vokal geliştirme"""
         if intensity == 0:
             return audio_data
             
         try:
-            print(f"🎤 Profesyonel vokal geliştirme (Yoğunluk: {intensity*100:.0f}%)")
-            
-            if len(audio_data.shape) == 2:
-                enhanced = np.zeros_like(audio_data)
-                
-                for i in range(2):
-                    # Ana vokal frekansları (200Hz - 4kHz)
-                    sos_main = signal.butter(6, [200, 4000], btype='band', fs=self.sample_rate, output='sos')
-                    main_vocal = signal.sosfilt(sos_main, audio_data[:, i])
-                    
-                    # Vokal berraklığı (2kHz - 6kHz)
-                    sos_clarity = signal.butter(4, [2000, 6000], btype='band', fs=self.sample_rate, output='sos')
-                    clarity_band = signal.sosfilt(sos_clarity, audio_data[:, i])
-                    
-                    # Vokal sıcaklığı (400Hz - 1.5kHz)
-                    sos_warmth = signal.butter(3, [400, 1500], btype='band', fs=self.sample_rate, output='sos')
-                    warmth_band = signal.sosfilt(sos_warmth, audio_data[:, i])
-                    
-                    # Vokal varlığı (1kHz - 3kHz)
-                    sos_presence = signal.butter(4, [1000, 3000], btype='band', fs=self.sample_rate, output='sos')
-                    presence_band = signal.sosfilt(sos_presence, audio_data[:, i])
-                    
-                    # Karışım
-                    enhanced[:, i] = (audio_data[:, i] + 
-                                    (main_vocal * intensity * 0.3) + 
-                                    (clarity_band * intensity * 0.25) + 
-                                    (warmth_band * intensity * 0.2) + 
-                                    (presence_band * intensity * 0.15))
-                
-                return enhanced
-            else:
-                # Mono için aynı işlem
-                sos_main = signal.butter(6, [200, 4000], btype='band', fs=self.sample_rate, output='sos')
-                main_vocal = signal.sosfilt(sos_main, audio_data)
-                
-                sos_clarity = signal.butter(4, [2000, 6000], btype='band', fs=self.sample_rate, output='sos')
-                clarity_band = signal.sosfilt(sos_clarity, audio_data)
-                
-                return (audio_data + 
-                       (main_vocal * intensity * 0.3) + 
-                       (clarity_band * intensity * 0.25))
+            if not state:
+                log.info("🎤 Profesyonel vokal geliştirme (Yoğunluk: %.0f%%)", intensity * 100)
+            return self._band_mix(audio_data, self.VOCAL_BANDS, intensity, state, sample_rate, out)
                 
         except Exception as e:
-            print(f"⚠️ Vokal geliştirme hatası: {e}")
+            log.warning("⚠️ Vokal geliştirme hatası: %s", e)
             return audio_data
     
-    def cinematic_bass_boost(self, audio_data, intensity=0.6):
+    def cinematic_bass_boost(self, audio_data, intensity=0.6, state=None, sample_rate=None, out=None):
         """Sinematik bas güçlendirme"""
         if intensity == 0:
             return audio_data
             
         try:
-            print(f"🔊 Sinematik bas güçlendirme (Yoğunluk: {intensity*100:.0f}%)")
-            
-            if len(audio_data.shape) == 2:
-                enhanced = np.zeros_like(audio_data)
-                
-                for i in range(2):
-                    # Sub-bass (20Hz - 60Hz) - Derinlik
-                    sos_sub = signal.butter(8, [20, 60], btype='band', fs=self.sample_rate, output='sos')
-                    sub_bass = signal.sosfilt(sos_sub, audio_data[:, i])
-                    
-                    # Mid-bass (60Hz - 200Hz) - Güç
-                    sos_mid = signal.butter(6, [60, 200], btype='band', fs=self.sample_rate, output='sos')
-                    mid_bass = signal.sosfilt(sos_mid, audio_data[:, i])
-                    
-                    # Upper-bass (200Hz - 500Hz) - Sıcaklık
-                    sos_upper = signal.butter(4, [200, 500], btype='band', fs=self.sample_rate, output='sos')
-                    upper_bass = signal.sosfilt(sos_upper, audio_data[:, i])
-                    
-                    # Punch bass (80Hz - 120Hz) - Vuruş
-                    sos_punch = signal.butter(4, [80, 120], btype='band', fs=self.sample_rate, output='sos')
-                    punch_bass = signal.sosfilt(sos_punch, audio_data[:, i])
-                    
-                    # Karışım
-                    enhanced[:, i] = (audio_data[:, i] + 
-                                    (sub_bass * intensity * 0.4) + 
-                                    (mid_bass * intensity * 0.35) + 
-                                    (upper_bass * intensity * 0.25) + 
-                                    (punch_bass * intensity * 0.3))
-                
-                return enhanced
-            else:
-                sos_sub = signal.butter(8, [20, 60], btype='band', fs=self.sample_rate, output='sos')
-                sub_bass = signal.sosfilt(sos_sub, audio_data)
-                
-                sos_mid = signal.butter(6, [60, 200], btype='band', fs=self.sample_rate, output='sos')
-                mid_bass = signal.sosfilt(sos_mid, audio_data)
-                
-                return (audio_data + 
-                       (sub_bass * intensity * 0.4) + 
-                       (mid_bass * intensity * 0.35))
+            if not state:
+                log.info("🔊 Sinematik bas güçlendirme (Yoğunluk: %.0f%%)", intensity * 100)
+            return self._band_mix(audio_data, self.BASS_BANDS, intensity, state, sample_rate, out)
                 
         except Exception as e:
-            print(f"⚠️ Bas güçlendirme hatası: {e}")
+            log.warning("⚠️ Bas güçlendirme hatası: %s", e)
             return audio_data
     
-    def crystal_treble_enhance(self, audio_data, intensity=0.7):
+    def crystal_treble_enhance(self, audio_data, intensity=0.7, state=None, sample_rate=None, out=None):
         """Kristal berraklığında tiz geliştirme"""
         if intensity == 0:
             return audio_data
             
         try:
-            print(f"✨ Kristal tiz geliştirme (Yoğunluk: {intensity*100:.0f}%)")
-            
-            if len(audio_data.shape) == 2:
-                enhanced = np.zeros_like(audio_data)
+            if not state:
+                log.info("✨ Kristal tiz geliştirme (Yoğunluk: %.0f%%)", intensity * 100)
+            return self._band_mix(audio_data, self.TREBLE_BANDS, intensity, state, sample_rate, out)
                 
-                for i in range(2):
-                    # Presence (3kHz - 6kHz) - Netlik
-                    sos_presence = signal.butter(6, [3000, 6000], btype='band', fs=self.sample_rate, output='sos')
-                    presence_band = signal.sosfilt(sos_presence, audio_data[:, i])
-                    
-                    # Brilliance (6kHz - 12kHz) - Parlaklık
-                    sos_brilliance = signal.butter(4, [6000, 12000], btype='band', fs=self.sample_rate, output='sos')
-                    brilliance_band = signal.sosfilt(sos_brilliance, audio_data[:, i])
-                    
-                    # Air (12kHz - 20kHz) - Hava
-                    sos_air = signal.butter(3, [12000, 20000], btype='band', fs=self.sample_rate, output='sos')
-                    air_band = signal.sosfilt(sos_air, audio_data[:, i])
-                    
-                    # Sparkle (8kHz - 16kHz) - Işıltı
-                    sos_sparkle = signal.butter(4, [8000, 16000], btype='band', fs=self.sample_rate, output='sos')
-                    sparkle_band = signal.sosfilt(sos_sparkle, audio_data[:, i])
-                    
-                    # Karışım
-                    enhanced[:, i] = (audio_data[:, i] + 
-                                    (presence_band * intensity * 0.3) + 
-                                    (brilliance_band * intensity * 0.25) + 
-                                    (air_band * intensity * 0.15) + 
-                                    (sparkle_band * intensity * 0.2))
-                
-                return enhanced
+        except Exception as e:
+            log.warning("⚠️ Tiz geliştirme hatası: %s", e)
+            return audio_data
+    
+    def fused_eq_intensities(self, settings):
+        """Birleşik EQ'nun bağlı olduğu doğrusal EQ yoğunlukları (LINEAR_EQ_STAGES sırasıyla)"""
+        return tuple(float(settings.get(key, 0)) for key, _ in self.LINEAR_EQ_STAGES)
+    
+    def compile_fused_eq(self, settings, sample_rate=None):
+        """Aktif doğrusal EQ aşamalarını tek bir FIR yanıtına derle"""
+        return self._compile_fused_eq(self.fused_eq_intensities(settings), sample_rate)
+    
+    def _compile_fused_eq(self, intensities, sample_rate=None):
+        sample_rate = sample_rate or self.sample_rate
+        key = ('fused_eq', intensities, int(sample_rate), self.dtype.name)
+        return self.filter_bank.get_compiled(key, lambda: self._design_fused_eq(intensities, sample_rate))
+    
+    def _design_fused_eq(self, intensities, sample_rate):
+        """Ardışık zinciri impuls üzerinde çalıştırıp yanıtı kes"""
+        length = int(self.FUSED_EQ_MAX_SECONDS * sample_rate)
+        
+        # Aşamalar kanal bağımsız olduğu için tek kanalın yanıtı yeterli
+        impulse_response = np.zeros(length, dtype=self.dtype)
+        impulse_response[0] = 1.0
+        for (_, method), intensity in zip(self.LINEAR_EQ_STAGES, intensities):
+            if intensity > 0:
+                impulse_response = getattr(self, method)(impulse_response, intensity, sample_rate=sample_rate)
+        
+        # Kuyruk enerjisi toleransın altına düştüğü yerden kes
+        tail_energy = np.cumsum(impulse_response[::-1] ** 2)[::-1]
+        significant = np.flatnonzero(tail_energy > tail_energy[0] * self.FUSED_EQ_TAIL_TOLERANCE)
+        taps = significant[-1] + 1 if len(significant) else 1
+        
+        return impulse_response[:taps].copy()
+    
+    def apply_fused_eq(self, audio_data, intensities, state=None, sample_rate=None, out=None):
+        """Birleşik EQ'yu FFT overlap-add ile tek geçişte uygula
+
+        intensities: fused_eq_intensities() çıktısı; aşama parametresi yalnızca buna bağlı
+        olduğundan diğer ayarlar değişince önbellekteki birleşik EQ çıktısı geçerli kalır
+        """
+        try:
+            fir = self._compile_fused_eq(intensities, sample_rate)
+            if not state:
+                log.info("🎛️ Birleşik EQ (%s tap, tek geçiş)", len(fir))
+            
+            # FIR'ı tüm kanallara axis=0 boyunca yay
+            columns = self._columns(audio_data)
+            if columns == [None]:
+                fir = fir.reshape((-1,) + (1,) * (audio_data.ndim - 1))
+                fused = signal.oaconvolve(audio_data, fir, axes=0)
             else:
-                sos_presence = signal.butter(6, [3000, 6000], btype='band', fs=self.sample_rate, output='sos')
-                presence_band = signal.sosfilt(sos_presence, audio_data)
-                
-                sos_brilliance = signal.butter(4, [6000, 12000], btype='band', fs=self.sample_rate, output='sos')
-                brilliance_band = signal.sosfilt(sos_brilliance, audio_data)
-                
-                return (audio_data + 
-                       (presence_band * intensity * 0.3) + 
-                       (brilliance_band * intensity * 0.25))
-                
+                # Paralel mod: her kanal ayrı iş
+                fused = np.empty((len(audio_data) + len(fir) - 1, audio_data.shape[1]), dtype=audio_data.dtype)
+                for column, convolved in zip(columns, self._map(
+                        lambda column: signal.oaconvolve(audio_data[:, column], fir), columns)):
+                    fused[:, column] = convolved
+            
+            # Akış modunda önceki bloğun FIR kuyruğu bu bloğun başına eklenir
+            if state is not None:
+                tail = state.get('tail')
+                if tail is not None:
+                    fused[:len(tail)] += tail
+                state['tail'] = fused[len(audio_data):].copy()
+            
+            if out is None:
+                return fused[:len(audio_data)].astype(audio_data.dtype, copy=False)
+            np.copyto(out, fused[:len(audio_data)], casting='same_kind')
+            return out
+            
         except Exception as e:
-            print(f"⚠️ Tiz geliştirme hatası: {e}")
+            log.warning("⚠️ Birleşik EQ hatası: %s", e)
             return audio_data
     
-    def advanced_stereo_enhance(self, audio_data, intensity=0.5):
+    def advanced_stereo_enhance(self, audio_data, intensity=0.5, state=None, sample_rate=None, out=None):
         """Gelişmiş 3D stereo genişletme"""
-        if intensity == 0 or len(audio_data.shape) != 2:
+        # Mid-Side yalnızca iki kanallı (stereo) sinyal için anlamlı
+        if intensity == 0 or len(audio_data.shape) != 2 or audio_data.shape[1] != 2:
             return audio_data
             
         try:
-            print(f"🎧 Gelişmiş 3D stereo genişletme (Yoğunluk: {intensity*100:.0f}%)")
+            if not state:
+                log.info("🎧 Gelişmiş 3D stereo genişletme (Yoğunluk: %.0f%%)", intensity * 100)
             
             # Gelişmiş Mid-Side işleme
             mid = (audio_data[:, 0] + audio_data[:, 1]) / 2
             side = (audio_data[:, 0] - audio_data[:, 1]) / 2
             
             # Frekans bazlı genişletme
-            # Düşük frekanslar (20Hz - 200Hz) - Az genişletme
-            sos_low = signal.butter(4, 200, btype='low', fs=self.sample_rate, output='sos')
-            side_low = signal.sosfilt(sos_low, side) * (1 + intensity * 0.2)
-            
-            # Orta frekanslar (200Hz - 2kHz) - Orta genişletme
-            sos_mid = signal.butter(4, [200, 2000], btype='band', fs=self.sample_rate, output='sos')
-            side_mid = signal.sosfilt(sos_mid, side) * (1 + intensity * 0.6)
-            
-            # Yüksek frekanslar (2kHz - 8kHz) - Maksimum genişletme
-            sos_high = signal.butter(4, [2000, 8000], btype='band', fs=self.sample_rate, output='sos')
-            side_high = signal.sosfilt(sos_high, side) * (1 + intensity * 1.0)
+            sample_rate = sample_rate or self.sample_rate
+            side_enhanced = np.zeros(len(side), dtype=side.dtype)
+            filters, widenings = [], []
+            for i, (order, cutoff, btype, widening) in enumerate(self.STEREO_SIDE_BANDS):
+                sos = self.filter_bank.get_sos(order, cutoff, btype, sample_rate, self.dtype)
+                if sos is None:
+                    continue
+                filters.append((i, sos))
+                widenings.append(widening)
             
-            # Çok yüksek frekanslar (8kHz+) - Orta genişletme
-            sos_vhigh = signal.butter(4, 8000, btype='high', fs=self.sample_rate, output='sos')
-            side_vhigh = signal.sosfilt(sos_vhigh, side) * (1 + intensity * 0.4)
-            
-            # Birleştir
-            side_enhanced = side_low + side_mid + side_high + side_vhigh
+            for index, _, band in self._filter_bands(side, filters, state):
+                band *= 1 + intensity * widenings[index]
+                side_enhanced += band
             
             # Geri dönüştür
-            left = mid + side_enhanced
-            right = mid - side_enhanced
+            if out is None:
+                out = np.empty_like(audio_data)
+            np.add(mid, side_enhanced, out=out[:, 0])
+            np.subtract(mid, side_enhanced, out=out[:, 1])
             
-            return np.column_stack((left, right))
+            return out
             
         except Exception as e:
-            print(f"⚠️ Stereo genişletme hatası: {e}")
+            log.warning("⚠️ Stereo genişletme hatası: %s", e)
             return audio_data
     
-    def heart_touching_warmth(self, audio_data, intensity=0.4):
+    def heart_touching_warmth(self, audio_data, intensity=0.4, state=None, sample_rate=None, out=None):
         """Yüreğe dokunacak sıcaklık filtresi"""
         if intensity == 0:
             return audio_data
             
         try:
-            print(f"❤️ Yüreğe dokunacak sıcaklık (Yoğunluk: {intensity*100:.0f}%)")
-            
-            if len(audio_data.shape) == 2:
-                warmed = np.zeros_like(audio_data)
-                
-                for i in range(2):
-                    # Ana sıcaklık frekansları (300Hz - 1.2kHz)
-                    sos_warmth = signal.butter(6, [300, 1200], btype='band', fs=self.sample_rate, output='sos')
-                    warmth_band = signal.sosfilt(sos_warmth, audio_data[:, i])
-                    
-                    # Yumuşaklık frekansları (800Hz - 2.5kHz)
-                    sos_soft = signal.butter(4, [800, 2500], btype='band', fs=self.sample_rate, output='sos')
-                    soft_band = signal.sosfilt(sos_soft, audio_data[:, i])
-                    
-                    # İntimacy frekansları (150Hz - 600Hz)
-                    sos_intimate = signal.butter(4, [150, 600], btype='band', fs=self.sample_rate, output='sos')
-                    intimate_band = signal.sosfilt(sos_intimate, audio_data[:, i])
-                    
-                    # Comfort frekansları (400Hz - 1kHz)
-                    sos_comfort = signal.butter(3, [400, 1000], btype='band', fs=self.sample_rate, output='sos')
-                    comfort_band = signal.sosfilt(sos_comfort, audio_data[:, i])
-                    
-                    # Sıcaklık karışımı
-                    warmed[:, i] = (audio_data[:, i] + 
-                                  (warmth_band * intensity * 0.3) + 
-                                  (soft_band * intensity * 0.2) + 
-                                  (intimate_band * intensity * 0.25) + 
-                                  (comfort_band * intensity * 0.15))
-                
-                return warmed
-            else:
-                sos_warmth = signal.butter(6, [300, 1200], btype='band', fs=self.sample_rate, output='sos')
-                warmth_band = signal.sosfilt(sos_warmth, audio_data)
-                
-                sos_soft = signal.butter(4, [800, 2500], btype='band', fs=self.sample_rate, output='sos')
-                soft_band = signal.sosfilt(sos_soft, audio_data)
-                
-                return (audio_data + 
-                       (warmth_band * intensity * 0.3) + 
-                       (soft_band * intensity * 0.2))
+            if not state:
+                log.info("❤️ Yüreğe dokunacak sıcaklık (Yoğunluk: %.0f%%)", intensity * 100)
+            return self._band_mix(audio_data, self.WARMTH_BANDS, intensity, state, sample_rate, out)
                 
         except Exception as e:
-            print(f"⚠️ Sıcaklık filtresi hatası: {e}")
+            log.warning("⚠️ Sıcaklık filtresi hatası: %s", e)
             return audio_data
     
-    def professional_compression(self, audio_data, intensity=0.6):
+    def professional_compression(self, audio_data, intensity=0.6, state=None, sample_rate=None, out=None):
         """Profesyonel çok bantlı dinamik kompresyon"""
         if intensity == 0:
             return audio_data
             
         try:
-            print(f"⚡ Profesyonel kompresyon (Yoğunluk: {intensity*100:.0f}%)")
+            if not state:
+                log.info("⚡ Profesyonel kompresyon (Yoğunluk: %.0f%%)", intensity * 100)
             
-            # Çok bantlı kompresyon
-            if len(audio_data.shape) == 2:
+            # Çok bantlı kompresyon (tüm kanallar tek seferde)
+            sample_rate = sample_rate or self.sample_rate
+            if out is None:
                 compressed = np.zeros_like(audio_data)
-                
-                for i in range(2):
-                    # Düşük frekans bandı (20Hz - 200Hz)
-                    sos_low = signal.butter(4, [20, 200], btype='band', fs=self.sample_rate, output='sos')
-                    low_band = signal.sosfilt(sos_low, audio_data[:, i])
-                    
-                    # Orta frekans bandı (200Hz - 2kHz)
-                    sos_mid = signal.butter(4, [200, 2000], btype='band', fs=self.sample_rate, output='sos')
-                    mid_band = signal.sosfilt(sos_mid, audio_data[:, i])
-                    
-                    # Yüksek frekans bandı (2kHz - 20kHz)
-                    sos_high = signal.butter(4, [2000, 20000], btype='band', fs=self.sample_rate, output='sos')
-                    high_band = signal.sosfilt(sos_high, audio_data[:, i])
-                    
-                    # Her banda farklı kompresyon uygula
-                    low_compressed = self.apply_band_compression(low_band, intensity * 0.8, 0.6)
-                    mid_compressed = self.apply_band_compression(mid_band, intensity * 1.0, 0.5)
-                    high_compressed = self.apply_band_compression(high_band, intensity * 0.7, 0.7)
-                    
-                    # Bantları birleştir
-                    compressed[:, i] = low_compressed + mid_compressed + high_compressed
-                
-                return compressed
             else:
-                # Mono için basit kompresyon
-                return self.apply_band_compression(audio_data, intensity, 0.6)
+                compressed = out
+                compressed.fill(0)
+            
+            def compress_band(band_index):
+                order, cutoff, btype, band_intensity, threshold = self.COMPRESSION_BANDS[band_index]
+                sos = self.filter_bank.get_sos(order, cutoff, btype, sample_rate, self.dtype)
+                if sos is None:
+                    return None
+                band = self._sosfilt(sos, audio_data, state, band_index)
+                
+                # Her banda farklı kompresyon uygula (zarf durumu bant başına, kanallar bağlı)
+                band_state = None if state is None else state.setdefault(('envelope', band_index), {})
+                return self.apply_band_compression(
+                    band, intensity * band_intensity, threshold, band_state, sample_rate
+                )
+            
+            # Bantlar bağımsız: paralel modda her bant ayrı iş, sonra birleştirilir
+            for band in self._map(compress_band, range(len(self.COMPRESSION_BANDS))):
+                if band is not None:
+                    compressed += band
+            
+            return compressed
                 
         except Exception as e:
-            print(f"⚠️ Kompresyon hatası: {e}")
+            log.warning("⚠️ Kompresyon hatası: %s", e)
             return audio_data
     
-    def apply_band_compression(self, audio_data, intensity, threshold):
-        """Tek banda kompresyon uygula"""
+    def apply_band_compression(self, audio_data, intensity, threshold, state=None, sample_rate=None):
+        """Tek banda attack/release zarflı, stereo bağlı ileri beslemeli kompresyon uygula
+
+        Bant yerinde kazançla çarpılır; state verilirse zarf bloklar arasında taşınır
+        """
         try:
             # Kompresyon parametreleri
             ratio = 1 + (intensity * 4)  # 1:1 - 5:1 arası
             attack = 0.003  # 3ms
             release = 0.1   # 100ms
+            sample_rate = sample_rate or self.sample_rate
+            dtype = audio_data.dtype
             
-            # Basit kompresyon algoritması
-            abs_audio = np.abs(audio_data)
-            mask = abs_audio > threshold
+            # Stereo bağlı algılama: tüm kanalların tepe seviyesi tek zarf sürer
+            level = np.abs(audio_data)
+            if level.ndim == 2:
+                level = level.max(axis=1)
+            np.maximum(level, 1e-9, out=level)
+            level_db = np.log10(level, out=level)
+            level_db *= 20
             
-            compressed = audio_data.copy()
-            over_threshold = abs_audio[mask] - threshold
-            compressed[mask] = np.sign(audio_data[mask]) * (threshold + over_threshold / ratio)
+            # Release: doğrusal genlikte üstel sönüm = dB'de sabit eğim (örnek başına)
+            # env[n] = max_k(level_db[k] - slope*(n-k)) -> birikimli maksimum ile vektörel
+            slope = dtype.type(20 * np.log10(np.e) / (release * sample_rate))
+            ramp = np.arange(1, len(level_db) + 1, dtype=dtype)
+            ramp *= slope
+            envelope = np.add(level_db, ramp, out=level_db)
+            np.maximum.accumulate(envelope, out=envelope)
+            envelope -= ramp
+            previous = None if state is None else state.get('envelope')
+            if previous is not None:
+                np.maximum(envelope, previous - ramp, out=envelope)
+            if state is not None and len(envelope):
+                state['envelope'] = envelope[-1]
             
-            return compressed
+            # dB alanında kazanç azaltımı (sert diz)
+            reduction = np.subtract(envelope, 20 * np.log10(threshold), out=envelope)
+            np.maximum(reduction, 0, out=reduction)
+            reduction *= 1 - 1 / ratio
+            
+            # Attack: kazanç azaltımını tek kutuplu alçak geçiren ile yumuşat
+            pole = np.exp(-1 / (attack * sample_rate))
+            b = np.array([1 - pole], dtype=dtype)
+            a = np.array([1, -pole], dtype=dtype)
+            zi = None if state is None else state.get('attack')
+            if zi is None:
+                zi = np.zeros(1, dtype=dtype)
+            reduction, zi = signal.lfilter(b, a, reduction, zi=zi)
+            if state is not None:
+                state['attack'] = zi
+            
+            # dB -> doğrusal kazanç, tüm kanallara aynı kazanç
+            reduction *= dtype.type(-np.log(10) / 20)
+            gain = np.exp(reduction, out=reduction)
+            if audio_data.ndim == 2:
+                gain = gain[:, np.newaxis]
+            audio_data *= gain
+            
+            return audio_data
             
         except Exception as e:
-            print(f"⚠️ Band kompresyon hatası: {e}")
+            log.warning("⚠️ Band kompresyon hatası: %s", e)
             return audio_data
     
-    def final_mastering(self, audio_data, intensity=0.8):
+    def final_mastering(self, audio_data, intensity=0.8, state=None, sample_rate=None, out=None):
         """Final mastering ve son rötuşlar"""
         if intensity == 0:
             return audio_data
             
         try:
-            print(f"🎭 Final mastering (Yoğunluk: {intensity*100:.0f}%)")
+            if not state:
+                log.info("🎭 Final mastering (Yoğunluk: %.0f%%)", intensity * 100)
             
-            if len(audio_data.shape) == 2:
-                mastered = np.zeros_like(audio_data)
-                
-                for i in range(2):
-                    # Soft clipping ile saturasyon
-                    saturation = 0.85 + (intensity * 0.15)
-                    saturated = np.tanh(audio_data[:, i] * saturation) * 1.05
-                    
-                    # Son EQ rötuşu
-                    # Düşük frekans temizliği (20Hz altı)
-                    sos_hpf = signal.butter(2, 20, btype='high', fs=self.sample_rate, output='sos')
-                    cleaned = signal.sosfilt(sos_hpf, saturated)
-                    
-                    # Yüksek frekans yumuşatma (18kHz üstü)
-                    sos_lpf = signal.butter(2, 18000, btype='low', fs=self.sample_rate, output='sos')
-                    smoothed = signal.sosfilt(sos_lpf, cleaned)
-                    
-                    # Presence boost (2kHz - 5kHz)
-                    sos_presence = signal.butter(2, [2000, 5000], btype='band', fs=self.sample_rate, output='sos')
-                    presence = signal.sosfilt(sos_presence, smoothed)
-                    
-                    mastered[:, i] = smoothed + (presence * intensity * 0.1)
+            # Soft clipping ile saturasyon
+            saturation = 0.85 + (intensity * 0.15)
+            saturated = np.multiply(audio_data, saturation, out=out)
+            np.tanh(saturated, out=saturated)
+            saturated *= 1.05
+            
+            # Son EQ rötuşu (Nyquist üstünde kalan filtre atlanır)
+            sample_rate = sample_rate or self.sample_rate
+            sos_hpf = self.filter_bank.get_sos(*self.MASTERING_FILTERS['hpf'], sample_rate, self.dtype)
+            sos_lpf = self.filter_bank.get_sos(*self.MASTERING_FILTERS['lpf'], sample_rate, self.dtype)
+            sos_presence = self.filter_bank.get_sos(*self.MASTERING_FILTERS['presence'], sample_rate, self.dtype)
+            
+            mastered = np.empty_like(audio_data) if out is None else out
+            
+            def finish(column):
+                """Filtre zinciri: tüm kanallar (None) ya da paralel modda tek kanal"""
+                source = saturated if column is None else saturated[:, column]
+                target = mastered if column is None else mastered[:, column]
+                key = (lambda name: name) if column is None else (lambda name: (name, column))
                 
-                return mastered
-            else:
-                # Mono için
-                saturation = 0.85 + (intensity * 0.15)
-                saturated = np.tanh(audio_data * saturation) * 1.05
+                # Düşük frekans temizliği (20Hz altı)
+                cleaned = source if sos_hpf is None else self._sosfilt(sos_hpf, source, state, key('hpf'))
                 
-                sos_hpf = signal.butter(2, 20, btype='high', fs=self.sample_rate, output='sos')
-                cleaned = signal.sosfilt(sos_hpf, saturated)
+                # Yüksek frekans yumuşatma (18kHz üstü)
+                smoothed = cleaned if sos_lpf is None else self._sosfilt(sos_lpf, cleaned, state, key('lpf'))
                 
-                sos_lpf = signal.butter(2, 18000, btype='low', fs=self.sample_rate, output='sos')
-                return signal.sosfilt(sos_lpf, cleaned)
+                # Presence boost (2kHz - 5kHz)
+                if sos_presence is None:
+                    target[...] = smoothed
+                    return
+                presence = self._sosfilt(sos_presence, smoothed, state, key('presence'))
+                presence *= intensity * 0.1
+                np.add(smoothed, presence, out=target, casting='same_kind')
+            
+            for _ in self._map(finish, self._columns(saturated)):
+                pass
+            return mastered
                 
         except Exception as e:
-            print(f"⚠️ Final mastering hatası: {e}")
+            log.warning("⚠️ Final mastering hatası: %s", e)
             return audio_data
     
-    def process_audio_professional(self, audio_data, settings):
-        """Profesyonel ses işleme pipeline"""
+    def warm_up(self, settings=None, sample_rate=None):
+        """Tüm aşama filtrelerini önceden tasarla (işçi süreç başlangıcı için)"""
+        sample_rate = sample_rate or self.sample_rate
+        tables = (self.VOCAL_BANDS, self.BASS_BANDS, self.TREBLE_BANDS, self.WARMTH_BANDS,
+                  self.STEREO_SIDE_BANDS, self.COMPRESSION_BANDS, self.MASTERING_FILTERS.values())
+        for bands in tables:
+            for order, cutoff, btype, *_ in bands:
+                self.filter_bank.get_sos(order, cutoff, btype, sample_rate, self.dtype)
+        
+        if self.fused_eq:
+            self.compile_fused_eq(self.DEFAULT_SETTINGS if settings is None else settings, sample_rate)
+        
+        return self.filter_bank.stats()
+    
+    def _stage_plan(self, settings, recorder=None):
+        """Ayarlara göre sıralı işleme aşamaları: (ad, metod, parametre)
+
+        recorder verilirse (ölçüm açık) her aşama ölçen sarmalayıcıyla döner
+        """
+        # Doğrusal ve zamanla değişmeyen EQ aşamaları M/S stereo işlemiyle yer
+        # değiştirebilir, bu yüzden birleşik EQ stereo aşamasından önce uygulanır
+        fused = self.fused_eq and any(
+            settings.get(key, 0) > 0 for key, _ in self.LINEAR_EQ_STAGES
+        )
+        
+        plan = []
+        if settings.get('noise_reduction', 0) > 0:
+            plan.append(('noise_reduction', self.advanced_noise_reduction, settings['noise_reduction']))
+        
+        if fused:
+            plan.append(('fused_eq', self.apply_fused_eq, self.fused_eq_intensities(settings)))
+        
+        for key, method in self.LINEAR_EQ_STAGES[:3]:
+            if not fused and settings.get(key, 0) > 0:
+                plan.append((key, getattr(self, method), settings[key]))
+        
+        if settings.get('stereo_enhance', 0) > 0:
+            plan.append(('stereo_enhance', self.advanced_stereo_enhance, settings['stereo_enhance']))
+        
+        if not fused and settings.get('warmth_filter', 0) > 0:
+            plan.append(('warmth_filter', self.heart_touching_warmth, settings['warmth_filter']))
+        
+        if settings.get('compression', 0) > 0:
+            plan.append(('compression', self.professional_compression, settings['compression']))
+        
+        if settings.get('mastering', 0) > 0:
+            plan.append(('mastering', self.final_mastering, settings['mastering']))
+        
+        if recorder is not None:
+            plan = [(name, recorder.wrap(name, stage), param) for name, stage, param in plan]
+        return plan
+    
+    def process_audio_professional(self, audio_data, settings, sample_rate=None):
+        """Profesyonel ses işleme pipeline
+
+        sample_rate: verinin sample rate'i (varsayılan self.sample_rate)
+        """
+        recorder = None
         try:
-            print("\n🚀 Profesyonel ses işleme başlıyor...")
+            log.info("\n🚀 Profesyonel ses işleme başlıyor...")
             start_time = time.time()
             
-            processed = audio_data.copy()
-            
-            # İşleme adımları
-            if settings.get('noise_reduction', 0) > 0:
-                processed = self.advanced_noise_reduction(processed, settings['noise_reduction'])
-                
-            if settings.get('vocal_enhance', 0) > 0:
-                processed = self.professional_vocal_enhance(processed, settings['vocal_enhance'])
-                
-            if settings.get('bass_boost', 0) > 0:
-                processed = self.cinematic_bass_boost(processed, settings['bass_boost'])
-                
-            if settings.get('treble_enhance', 0) > 0:
-                processed = self.crystal_treble_enhance(processed, settings['treble_enhance'])
-                
-            if settings.get('stereo_enhance', 0) > 0:
-                processed = self.advanced_stereo_enhance(processed, settings['stereo_enhance'])
-                
-            if settings.get('warmth_filter', 0) > 0:
-                processed = self.heart_touching_warmth(processed, settings['warmth_filter'])
-                
-            if settings.get('compression', 0) > 0:
-                processed = self.professional_compression(processed, settings['compression'])
-                
-            if settings.get('mastering', 0) > 0:
-                processed = self.final_mastering(processed, settings['mastering'])
+            sample_rate = sample_rate or self.sample_rate
+            recorder = self.instrumentation.run(type(self).__name__, 'process_audio_professional', sample_rate,
+                                                channels=1 if audio_data.ndim == 1 else audio_data.shape[1])
+            if self.segment_seconds and len(audio_data) > 2 * self.segment_seconds * sample_rate:
+                # Uzun sinyal: ısınma bağlamlı parçalar paralel işçilerde, çapraz geçişle birleştirilir
+                renderer = SegmentRenderer(self, self.segment_seconds)
+                processed = renderer.render(self.precision.cast(audio_data), settings, sample_rate, recorder)
+                peak_bytes = renderer.peak_bytes
+            else:
+                # Girişin tek kopyası; tüm aşamalar bu tampon üzerinde yerinde çalışır
+                processed = np.array(audio_data, dtype=self.dtype)
+                peak_bytes = self._render_in_place(processed, settings, sample_rate, recorder=recorder)
             
-            # Final normalize
-            max_val = np.max(np.abs(processed))
-            if max_val > 0:
-                processed = processed / max_val * 0.95
+            final_stage = self._apply_final_stage
+            if recorder is not None:
+                final_stage = recorder.wrap(self.final_stage, final_stage)
+            final_stage(processed, sample_rate)
             
             end_time = time.time()
             processing_time = end_time - start_time
             
-            print(f"✅ İşleme tamamlandı ({processing_time:.2f} saniye)")
+            log.info("✅ İşleme tamamlandı (%.2f saniye)", processing_time)
+            
+            bank_stats = self.filter_bank.stats()
+            log.info("🧮 Filtre bankası: %s filtre, %s isabet / %s ıskalama",
+                     bank_stats['filters'], bank_stats['hits'], bank_stats['misses'])
             
-            # Bellek temizliği
-            gc.collect()
+            pool_stats = self.buffer_pool.stats()
+            self.last_memory_stats = dict(pool_stats, output_bytes=processed.nbytes, peak_bytes=peak_bytes)
+            log.info("💾 Tepe çalışma belleği: %.1f MB (çıktı %.1f MB), havuz yeniden kullanım: %.0f%%",
+                     peak_bytes / 1e6, processed.nbytes / 1e6, pool_stats['reuse_rate'] * 100)
             
+            if recorder is not None:
+                recorder.finish(input_samples=len(audio_data), output_samples=len(processed),
+                                workspace_peak_bytes=peak_bytes)
             return processed
             
+        except DtypeError:
+            # Debug dtype denetimi yutulmaz, işlenmemiş giriş dönmez
+            raise
+        except Exception as e:
+            log.error("❌ İşleme hatası: %s", e)
+            if recorder is not None:
+                recorder.finish(input_samples=len(audio_data), error=str(e))
+            return audio_data
+    
+    def process_audio_incremental(self, audio_data, settings, sample_rate=None, chain=None, cancel=None,
+                                  progress=None, final_stage=None):
+        """Ayar değişikliğinde yalnızca değişen aşama ve sonrasını yeniden işle (GUI kaydırıcıları)
+
+        chain: aşama çıktılarını giriş kimliği + önceki aşama ayarlarıyla saklayan CachedChain;
+        son adım her çağrıda son aşama çıktısının kopyası üzerinde uygulanır.
+        cancel: CancellationToken; aşama ve parça sınırlarında yoklanır, iptalde RenderCancelled
+        yükselir (tamamlanan aşamalar önbellekte kalır).
+        progress: progress(aşama adı, tamamlanan, toplam) her aşama ve son adımdan sonra.
+        final_stage: son adımı bu çağrı için değiştir (ör. önizlemede ucuz 'normalize')
+        """
+        try:
+            sample_rate = sample_rate or self.sample_rate
+            chain = chain if chain is not None else CachedChain()
+            # Her aşama yeni diziye yazar (önbellekteki girişler değişmez)
+            stages = [('input', lambda audio, dtype: self.precision.cast(audio), self.dtype.str)]
+            stages += [(name, self._blockwise_stage(name, stage, sample_rate, cancel), param)
+                       for name, stage, param in self._stage_plan(settings)]
+            total = len(stages) + 1
+            stage_progress = None if progress is None else (lambda name, done, _: progress(name, done, total))
+            profile = None if self.noise_profile is None else self.noise_profile.fingerprint
+            rendered = chain.run(audio_data, stages, variant=(sample_rate, self.fused_eq, profile),
+                                 progress=stage_progress)
+            log.info("♻️ Önbellekten %s aşama, yeniden işlenen %s aşama",
+                     chain.last_reused, chain.last_computed)
+            if cancel is not None:
+                cancel.check()
+            final_stage = final_stage or self.final_stage
+            processed = self._apply_final_stage(np.array(rendered, dtype=self.dtype), sample_rate, final_stage)
+            if progress is not None:
+                progress(final_stage, total, total)
+            return processed
+
+        except (RenderCancelled, DtypeError):
+            raise
         except Exception as e:
-            print(f"❌ İşleme hatası: {e}")
+            log.error("❌ İşleme hatası: %s", e)
             return audio_data
+
+    def make_proxy(self, audio_data, sample_rate=None, proxy_rate=None, mono=True, start=0.0, seconds=None):
+        """Önizleme için seyreltilmiş kopya, (veri, proxy sample rate) döndür
+
+        start/seconds verilirse yalnızca o zaman penceresi alınır; mono=True kanalları ortalar.
+        Kopya process_audio_incremental'a proxy rate ile verilir: filtreler o rate için
+        tasarlanır, Nyquist üstündeki bantlar atlanır (mono kopyada stereo genişletme yoktur);
+        önizlemede son adım olarak limiter yerine 'normalize' verilebilir
+        """
+        sample_rate = sample_rate or self.sample_rate
+        proxy_rate = min(proxy_rate or self.PROXY_SAMPLE_RATE, sample_rate)
+        first = max(0, int(start * sample_rate))
+        last = len(audio_data) if seconds is None else min(len(audio_data), first + int(seconds * sample_rate))
+        proxy = self.precision.cast(audio_data[first:last])
+        if mono and proxy.ndim == 2:
+            proxy = proxy.mean(axis=1, dtype=self.dtype)
+        proxy = resample(proxy, sample_rate, proxy_rate, quality='fast')
+        return np.ascontiguousarray(proxy, dtype=self.dtype), proxy_rate
+
+    def _blockwise_stage(self, name, stage, sample_rate, cancel=None):
+        """Aşamayı yeni diziye STAGE_CHUNK_SIZE parçalarla (durum taşıyarak) uygulayan fonksiyon
+
+        Gürültü azaltma tüm sinyal üzerinde çalışır; iptal her parçadan önce yoklanır
+        """
+        def run(audio_data, param):
+            if cancel is not None:
+                cancel.check()
+            if name == 'noise_reduction':
+                return stage(audio_data, param, sample_rate=sample_rate)
+            output = np.empty_like(audio_data)
+            state = {}
+            for start in range(0, len(audio_data), self.STAGE_CHUNK_SIZE):
+                if cancel is not None:
+                    cancel.check()
+                block = audio_data[start:start + self.STAGE_CHUNK_SIZE]
+                target = output[start:start + self.STAGE_CHUNK_SIZE]
+                result = self.precision.check(
+                    stage(block, param, state=state, sample_rate=sample_rate, out=target), name
+                )
+                if result is not target:
+                    np.copyto(target, result)
+            return output
+        return run
+
+    def _render_in_place(self, processed, settings, sample_rate, noise_state=None, recorder=None):
+        """Gürültü azaltma ve aşamaları tampon üzerinde yerinde uygula (son adım hariç)
+
+        noise_state: gürültü azaltmaya verilecek durum (ör. ortak eşik); çalışma alanı tepe baytını döndürür
+        """
+        plan = self._stage_plan(settings, recorder)
+        with Workspace(self.buffer_pool) as workspace:
+            workspace.track(processed.nbytes)
+            
+            # Gürültü azaltma tüm sinyal üzerinde (gürültü profili bütün dosyadan)
+            if plan and plan[0][0] == 'noise_reduction':
+                name, stage, param = plan.pop(0)
+                self.precision.check(
+                    stage(processed, param, state=noise_state, sample_rate=sample_rate, out=processed), name
+                )
+            
+            # Kalan aşamalar parça parça, durum taşıyarak
+            if self.pipeline and plan:
+                # Parçalar (tampon görünümleri) aşama iş parçacıkları arasında yerinde ilerler
+                peaks = []
+                chunks = (processed[start:start + self.STAGE_CHUNK_SIZE]
+                          for start in range(0, len(processed), self.STAGE_CHUNK_SIZE))
+                for _ in self._run_pipeline(self._stage_pipeline(plan, sample_rate, peaks), chunks):
+                    pass
+                workspace.track(sum(peaks))
+            else:
+                states = [{} for _ in plan]
+                self._run_stages_in_place(processed, plan, states, sample_rate, workspace)
+            return workspace.peak_bytes
+    
+    def _apply_final_stage(self, processed, sample_rate, final_stage=None):
+        """Son adımı tampon üzerinde yerinde uygula: true-peak limiter ya da global tepe normalizasyonu"""
+        if (final_stage or self.final_stage) == 'limiter':
+            log.info("🧱 True-peak limiter (tavan: %.1f dBTP)", self.limiter_ceiling)
+            self._make_limiter(sample_rate).limit(processed, out=processed)
+        else:
+            max_val = max(float(processed.max()), -float(processed.min())) if processed.size else 0.0
+            if max_val > 0:
+                processed *= 0.95 / max_val
+        return processed
+    
+    def _to_processing_layout(self, block):
+        """(samples, 1) mono bloğu 1-D yap, çok kanallı bloğu olduğu gibi bırak"""
+        if block.ndim == 2 and block.shape[1] == 1:
+            return block[:, 0]
+        return block
+    
+    def _match_output_channels(self, audio_data):
+        """Mono veriyi dışa aktarım kanal düzenine (self.channels) çıkar"""
+        if self.channels == 2 and (audio_data.ndim == 1 or audio_data.shape[1] == 1):
+            return np.repeat(audio_data.reshape(-1, 1), 2, axis=1)
+        return audio_data
+    
+    def _iter_input_blocks(self, file_path, block_size, source_rate, target_rate):
+        """Giriş dosyasını target_rate'te politika dtype'ında bloklar halinde oku"""
+        if source_rate == target_rate:
+            for block in iter_audio_blocks(file_path, block_size, self.dtype):
+                yield self._to_processing_layout(block)
+            return
+        
+        # Farklı sample rate: bloklar arası durum taşıyan akış yeniden örnekleme
+        log.info("🔄 Akış yeniden örnekleme: %s Hz -> %s Hz", source_rate, target_rate)
+        resampler = StreamingResampler(source_rate, target_rate, self.resample_quality)
+        for block in iter_audio_blocks(file_path, block_size, self.dtype):
+            resampled = resampler.process(block)
+            if len(resampled):
+                yield self._to_processing_layout(resampled)
+        tail = resampler.flush()
+        if len(tail):
+            yield self._to_processing_layout(tail)
+    
+    def _stream_noise_reduction(self, blocks, intensity, sample_rate, reduce=None):
+        """Akışı dosya genelindeki CHUNK_SIZE ızgarasında gürültü azalt (bellekteki işlemeyle aynı)
+
+        Tüm akış için tek eşik kullanılır (kayıtlı profil ya da akışın ilk CHUNK_SIZE örneği);
+        her ızgara parçası iki yanından PADDING bağlamıyla işlenir. Çıktı parça parça verilir.
+        reduce: parça başına çağrılacak gürültü azaltma (varsayılan advanced_noise_reduction)
+        """
+        reduce = reduce or self.advanced_noise_reduction
+        parts = []
+        buffer = None
+        base = 0            # buffer[0]'ın akıştaki konumu
+        chunk_start = 0
+        threshold = None
+        exhausted = False
+        
+        while True:
+            # Parçanın sağ bağlamı da gelene kadar (ya da akış bitene kadar) oku
+            needed = chunk_start + CHUNK_SIZE + PADDING
+            available = base + (0 if buffer is None else len(buffer)) + sum(len(part) for part in parts)
+            while not exhausted and available < needed:
+                block = next(blocks, None)
+                if block is None:
+                    exhausted = True
+                else:
+                    parts.append(block)
+                    available += len(block)
+            if parts:
+                buffer = np.concatenate(([buffer] if buffer is not None else []) + parts)
+                parts = []
+            if buffer is None or chunk_start >= base + len(buffer):
+                return
+            
+            if threshold is None:
+                if self.noise_profile is not None:
+                    channel_count = 1 if buffer.ndim == 1 else buffer.shape[1]
+                    threshold = self.noise_profile.threshold_for(sample_rate or self.sample_rate, channel_count)
+                else:
+                    threshold = stationary_threshold(buffer)
+            
+            context_start = max(0, chunk_start - PADDING)
+            lead = chunk_start - context_start
+            segment = buffer[context_start - base:needed - base]
+            count = min(CHUNK_SIZE, len(segment) - lead)
+            cleaned = reduce(segment, intensity, sample_rate=sample_rate,
+                             state={'threshold': threshold, 'offset': context_start,
+                                    'lead': lead, 'trail': len(segment) - lead - count})
+            chunk = cleaned[lead:lead + count]
+            # Hata durumunda giriş döner: sonraki parçanın bağlamı olan tampon değişmesin
+            yield self.precision.check(chunk.copy() if cleaned is segment else chunk, 'noise_reduction')
+            
+            chunk_start += CHUNK_SIZE
+            drop = max(0, chunk_start - PADDING - base)
+            buffer = buffer[drop:]
+            base += drop
+    
+    def _stream_stages(self, blocks, settings, sample_rate, recorder=None):
+        """Blokları aşamalardan geçir, IIR durumlarını bloklar arasında taşı"""
+        plan = self._stage_plan(settings, recorder)
+        
+        if self.pipeline:
+            pipeline = self._stage_pipeline(plan, sample_rate)
+            yield from self._run_pipeline(pipeline, blocks)
+            return
+        
+        # Gürültü azaltma durumsuz spektral işlem, kenar bağlamıyla ayrıca yürütülür
+        if plan and plan[0][0] == 'noise_reduction':
+            blocks = self._stream_noise_reduction(blocks, plan[0][2], sample_rate, plan[0][1])
+            plan = plan[1:]
+        
+        # Okunan bloklar bu üretecin malıdır, aşamalar onların üzerinde yerinde çalışır
+        states = [{} for _ in plan]
+        with Workspace(self.buffer_pool) as workspace:
+            for block in blocks:
+                yield self._run_stages_in_place(block, plan, states, sample_rate, workspace)
+    
+    def _stage_pipeline(self, plan, sample_rate, peaks=None):
+        """Aşama planından boru hattı: her aşama kendi iş parçacığında, kendi durumu ve karalama tamponuyla
+
+        peaks verilirse her aşamanın çalışma alanı tepe baytı eklenir
+        """
+        stages = []
+        if plan and plan[0][0] == 'noise_reduction':
+            _, reduce, intensity = plan[0]
+            stages.append(('noise_reduction',
+                           lambda blocks: self._stream_noise_reduction(blocks, intensity, sample_rate, reduce)))
+            plan = plan[1:]
+        for entry in plan:
+            stages.append((entry[0], lambda blocks, entry=entry: self._pipeline_stage(entry, sample_rate, blocks, peaks)))
+        return StagePipeline(stages)
+    
+    def _pipeline_stage(self, entry, sample_rate, blocks, peaks=None):
+        """Tek aşamayı blok akışına yerinde uygula (durum bloklar arasında taşınır)"""
+        state = {}
+        with Workspace(self.buffer_pool) as workspace:
+            for block in blocks:
+                yield self._run_stages_in_place(block, [entry], [state], sample_rate, workspace)
+            if peaks is not None:
+                peaks.append(workspace.peak_bytes)
+    
+    def _run_pipeline(self, pipeline, blocks):
+        """Boru hattını çalıştır, bitince aşama kullanımını sakla ve yazdır"""
+        yield from pipeline.run(blocks)
+        self.last_pipeline_stats = pipeline.stats()
+        pipeline.report()
+    
+    def _run_stages_in_place(self, buffer, plan, states, sample_rate, workspace):
+        """Aşamaları tamponun STAGE_CHUNK_SIZE'lık parçalarına sırayla, yerinde uygula
+
+        Her aşama ortak karalama tamponuna yazar, sonuç parçaya geri kopyalanır;
+        böylece aşama başına tam boy ara dizi ayrılmaz.
+        """
+        for start in range(0, len(buffer), self.STAGE_CHUNK_SIZE):
+            block = buffer[start:start + self.STAGE_CHUNK_SIZE]
+            scratch = workspace.scratch_for(block, self.STAGE_CHUNK_SIZE)
+            for (name, stage, param), state in zip(plan, states):
+                result = self.precision.check(
+                    stage(block, param, state=state, sample_rate=sample_rate, out=scratch), name
+                )
+                if result is not block:
+                    np.copyto(block, result)
+        return buffer
+    
+    def _make_limiter(self, sample_rate=None):
+        """Motor ayarlarıyla true-peak limiter"""
+        return TruePeakLimiter(sample_rate or self.sample_rate, ceiling_db=self.limiter_ceiling,
+                               release=self.limiter_release)
+    
+    def _stream_limiter(self, blocks, sample_rate):
+        """Blokları limiter'dan geçir; gecikmeyi düşüp girişle aynı toplam uzunlukta ver"""
+        limiter = self._make_limiter(sample_rate)
+        skip = limiter.latency
+        for block in blocks:
+            limited = limiter.process(block)[skip:]
+            skip = max(0, skip - len(block))
+            if len(limited):
+                yield limited
+        
+        # Kuyruk: gecikme hattında kalanlar (girişten uzun çıkmasın diye kırpılır)
+        tail = limiter.flush()[skip:]
+        if len(tail):
+            yield tail
+    
+    def _write_blocks(self, blocks, output_path, sample_rate, subtype, upmix=False):
+        """Blokları dosyaya sırayla yaz; (örnek sayısı, tepe) döndür
+
+        upmix: mono bloklar dışa aktarım kanal düzenine (self.channels) çoğaltılır
+        """
+        total_samples = 0
+        peak = 0.0
+        target = None
+        try:
+            for block in blocks:
+                if target is None:
+                    # Mono kaynak, dışa aktarım stereo ise yalnızca yazılırken çoğaltılır
+                    channels = 1 if block.ndim == 1 else block.shape[1]
+                    if upmix and channels == 1 and self.channels == 2:
+                        channels = 2
+                    target = sf.SoundFile(output_path, 'w', samplerate=sample_rate,
+                                          channels=channels, subtype=subtype)
+                peak = max(peak, float(np.max(np.abs(block))))
+                total_samples += len(block)
+                target.write(self._match_output_channels(block) if upmix else block)
+        finally:
+            if target is not None:
+                target.close()
+        return total_samples, peak
+    
+    def _export_rate(self, sample_rate, format):
+        """Hedef formatın kabul ettiği sample rate (gerekmedikçe değişmez)"""
+        if format.lower() in ('wav', 'flac') or sample_rate in self.MP3_SAMPLE_RATES:
+            return sample_rate
+        # Tam bölen oran tercih edilir (96 kHz -> 48 kHz, 88.2 kHz -> 44.1 kHz)
+        for rate in self.MP3_SAMPLE_RATES:
+            if sample_rate % rate == 0:
+                return rate
+        return self.sample_rate
+    
+    def _write_scaled(self, temp_path, output_path, scale, block_size, quality='high'):
+        """Geçici float dosyayı ölçekleyerek hedef formata yaz"""
+        file_ext = os.path.splitext(output_path)[1].lower()
+        
+        if file_ext in ('.wav', '.flac'):
+            with sf.SoundFile(temp_path) as source:
+                # Mono ara dosya, gerekiyorsa yalnızca burada stereo'ya çoğaltılır
+                channels = 2 if source.channels == 1 and self.channels == 2 else source.channels
+                with sf.SoundFile(
+                    output_path, 'w',
+                    samplerate=source.samplerate,
+                    channels=channels,
+                    format=file_ext[1:].upper(),
+                    subtype='PCM_16'
+                ) as target:
+                    for block in source.blocks(blocksize=block_size, dtype='float32', always_2d=True):
+                        block *= scale
+                        target.write(self._match_output_channels(block))
+            return True
+        
+        # MP3 gibi formatlar pydub ile kodlanır ve tüm sinyali bellekte ister
+        audio_data, sample_rate = sf.read(temp_path, dtype='float32')
+        audio_data *= scale
+        return self.save_audio_professional(audio_data, output_path, format=file_ext[1:],
+                                            quality=quality, sample_rate=sample_rate)
     
-    def save_audio_professional(self, audio_data, output_path, format='wav', quality='high'):
-        """Profesyonel ses kaydetme"""
+    def mehmet_yay_process_audio(self, input_path, output_path, settings=None, block_size=None, quality='high'):
+        """Dosyadan dosyaya blok blok profesyonel işleme (sabit bellek)"""
+        settings = self.DEFAULT_SETTINGS if settings is None else settings
+        block_size = block_size or self.STREAM_BLOCK_SIZE
+        temp_path = None
+        recorder = None
+        
         try:
-            print(f"💾 Profesyonel kaydetme: {os.path.basename(output_path)}")
+            log.info("\n🚀 Akış işleme başlıyor: %s", os.path.basename(input_path))
+            start_time = time.time()
+            
+            # İşleme rate'i: native_rate açıkken dosyanınki, değilse motorunki
+            source_rate, _, backend = audio_info(input_path)
+            self.last_load_backend = backend
+            sample_rate = source_rate if self.native_rate else self.sample_rate
+            recorder = self.instrumentation.run(type(self).__name__, 'mehmet_yay_process_audio', sample_rate,
+                                                file=os.path.basename(input_path), source_rate=source_rate)
+            
+            blocks = self._iter_input_blocks(input_path, block_size, source_rate, sample_rate)
+            if self.segment_seconds:
+                # Uzun kayıtlar: okunan parçalar paralel işçilerde (bellekte işçi sayısı kadar parça)
+                blocks = SegmentRenderer(self, self.segment_seconds).render_stream(
+                    blocks, settings, sample_rate, recorder
+                )
+            else:
+                blocks = self._stream_stages(blocks, settings, sample_rate, recorder)
+            file_ext = os.path.splitext(output_path)[1].lower()
+            
+            if self.final_stage == 'limiter' and file_ext in ('.wav', '.flac'):
+                # Limiter akışta çalışır: doğrudan hedef dosyaya tek geçiş
+                total_samples, _ = self._write_blocks(
+                    self._stream_limiter(blocks, sample_rate), output_path, sample_rate, 'PCM_16', upmix=True
+                )
+                if total_samples == 0:
+                    raise ValueError("Giriş dosyasında ses verisi yok")
+                success = True
+            else:
+                # 1. geçiş: işle, geçici float WAV'a yaz ve tepe seviyesini izle
+                fd, temp_path = tempfile.mkstemp(suffix='.wav', prefix='myp_stream_')
+                os.close(fd)
+                
+                if self.final_stage == 'limiter':
+                    blocks = self._stream_limiter(blocks, sample_rate)
+                total_samples, peak = self._write_blocks(
+                    blocks, temp_path, sample_rate, 'FLOAT' if self.dtype == np.float32 else 'DOUBLE'
+                )
+                if total_samples == 0:
+                    raise ValueError("Giriş dosyasında ses verisi yok")
+                
+                # 2. geçiş: hedef formata yaz (normalize modunda global tepeye göre ölçekleyerek)
+                scale = 1.0
+                if self.final_stage == 'normalize' and peak > 0:
+                    scale = 0.95 / peak
+                success = self._write_scaled(temp_path, output_path, scale, block_size, quality)
+            
+            processing_time = time.time() - start_time
+            duration = total_samples / sample_rate
+            log.info("✅ Akış işleme tamamlandı: %.1f sn ses, %.2f saniye", duration, processing_time)
+            
+            if recorder is not None:
+                recorder.finish(input_samples=total_samples, output_samples=total_samples, success=success)
+            return success
+            
+        except DtypeError:
+            raise
+        except Exception as e:
+            log.error("❌ Akış işleme hatası: %s", e)
+            if recorder is not None:
+                recorder.finish(error=str(e))
+            return False
+            
+        finally:
+            if temp_path and os.path.exists(temp_path):
+                os.unlink(temp_path)
+    
+    def mehmet_yay_load_audio(self, file_path):
+        """Ses dosyasını yükle, (ses verisi, sample rate) döndür"""
+        audio_data = self.load_audio_advanced(file_path)
+        return audio_data, self.last_load_sample_rate if audio_data is not None else self.sample_rate
+    
+    def save_audio_professional(self, audio_data, output_path, format='wav', quality='high', sample_rate=None):
+        """Profesyonel ses kaydetme
+
+        sample_rate: verinin sample rate'i (varsayılan self.sample_rate)
+        """
+        try:
+            log.info("💾 Profesyonel kaydetme: %s", os.path.basename(output_path))
+            sample_rate = sample_rate or self.sample_rate
+            
+            # Mono veri gerekiyorsa yalnızca dışa aktarımda stereo'ya çoğaltılır
+            audio_data = self._match_output_channels(audio_data)
             
             # Format'a göre kaydet
             if format.lower() == 'wav':
-                sf.write(output_path, audio_data, self.sample_rate, subtype='PCM_16')
+                sf.write(output_path, audio_data, sample_rate, subtype='PCM_16')
             elif format.lower() == 'flac':
-                sf.write(output_path, audio_data, self.sample_rate, format='FLAC')
+                sf.write(output_path, audio_data, sample_rate, format='FLAC')
             else:
+                # MP3'ün desteklemediği rate'ler burada, tek seferde dönüştürülür
+                export_rate = self._export_rate(sample_rate, format)
+                if export_rate != sample_rate:
+                    log.info("🔄 Dışa aktarım için %s Hz -> %s Hz", sample_rate, export_rate)
+                    audio_data = resample(audio_data, sample_rate, export_rate, self.resample_quality)
+                    sample_rate = export_rate
+                
                 # MP3 için pydub kullan
                 if len(audio_data.shape) == 2:
                     audio_int = (np.clip(audio_data, -1, 1) * 32767).astype(np.int16)
                     audio_bytes = audio_int.tobytes()
                     audio_segment = AudioSegment(
                         audio_bytes,
-                        frame_rate=self.sample_rate,
+                        frame_rate=sample_rate,
                         sample_width=2,
-                        channels=2
+                        channels=audio_data.shape[1]
                     )
                 else:
                     audio_int = (np.clip(audio_data, -1, 1) * 32767).astype(np.int16)
                     audio_bytes = audio_int.tobytes()
                     audio_segment = AudioSegment(
                         audio_bytes,
-                        frame_rate=self.sample_rate,
+                        frame_rate=sample_rate,
                         sample_width=2,
                         channels=1
                     )
@@ -594,13 +1325,16 @@ class AdvancedAudioProcessor:
                 bitrate = bitrate_map.get(quality, '320k')
                 audio_segment.export(output_path, format="mp3", bitrate=bitrate)
             
-            print(f"✅ Başarıyla kaydedildi: {output_path}")
+            log.info("✅ Başarıyla kaydedildi: %s", output_path)
             return True
             
         except Exception as e:
-            print(f"❌ Kaydetme hatası: {e}")
+            log.error("❌ Kaydetme hatası: %s", e)
             return False
 
+# Toplu işleme, web ve GUI modüllerinin kullandığı isim
+MYPAudioProcessor = AdvancedAudioProcessor
+
 # Test fonksiyonu
 if __name__ == "__main__":
     processor = AdvancedAudioProcessor()
@@ -8,15 +8,95 @@ Mehmet Yay tarafından geliştirildi
 import os
 import glob
 from myp_audio_processor import MYPAudioProcessor
+from myp_noise_profile import noise_profiles
+from myp_logging import get_logger, set_level, set_quiet, flush, INFO
 import threading
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import time
 
+log = get_logger('batch')
+
+# İşçi süreç başına bir kez oluşturulan, filtreleri hazır işlemci
+_worker_processor = None
+
+def available_cpu_count():
+    """Bu sürecin kullanabileceği çekirdek sayısı"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+def _set_verbosity(verbose):
+    """verbose kapalıyken efekt başlıkları ve tanı istatistikleri yazılmaz (ilerleme, uyarı ve hatalar kalır)"""
+    set_quiet(not verbose)
+    set_level(INFO, 'batch')
+
+def _init_worker(native_rate=False, noise_profile=None, verbose=False):
+    """İşçi süreci bir kez hazırla (importlar yüklü, filtreler tasarlanmış, profil yüklü)"""
+    global _worker_processor
+    _set_verbosity(verbose)
+    _worker_processor = MYPAudioProcessor(native_rate=native_rate, noise_profile=noise_profile)
+    _worker_processor.warm_up()
+
+def _process_file_in_worker(input_file, output_file, current, total):
+    """İşçi süreçte tek dosya işle"""
+    try:
+        return _process_file_with_progress(_worker_processor, input_file, output_file, current, total)
+    finally:
+        # İşçi süreçler os._exit ile kapanır (atexit çalışmaz): işin son satırları kaybolmasın
+        flush()
+
+def _process_file_with_progress(processor, input_file, output_file, current, total):
+    """Tek dosyayı işle ve ilerlemeyi günlüğe yaz"""
+    filename = os.path.basename(input_file)
+    try:
+        log.info("🎵 [%02d/%02d] İşleniyor: %s", current, total, filename)
+        
+        start_time = time.time()
+        success = processor.mehmet_yay_process_audio(input_file, output_file)
+        end_time = time.time()
+        
+        if success:
+            duration = end_time - start_time
+            log.info("✅ [%02d/%02d] Tamamlandı: %s (%.1fs)", current, total, filename, duration)
+            return True
+        else:
+            log.error("❌ [%02d/%02d] Başarısız: %s", current, total, filename)
+            return False
+            
+    except Exception as e:
+        log.error("❌ [%02d/%02d] Hata: %s - %s", current, total, filename, e)
+        return False
+
 class MYPBatchProcessor:
-    def __init__(self, max_workers=4):
-        self.processor = MYPAudioProcessor()
+    def __init__(self, max_workers=None, backend='thread', native_rate=False, noise_profile=None, verbose=False):
+        """backend: 'thread' (ortak işlemci) veya 'process' (GIL'siz, çekirdek başına süreç)
+        native_rate: dosyaları özgün sample rate'lerinde işle (44.1 kHz'e dönüştürmeden)
+        noise_profile: tüm seride kullanılacak kayıtlı gürültü profilinin adı
+        verbose: efekt başlıkları ve dosya analizleri de yazılsın (varsayılan: yalnızca ilerleme)
+        """
+        if backend not in ('thread', 'process'):
+            raise ValueError(f"Desteklenmeyen backend: {backend}")
+        
+        self.backend = backend
+        self.native_rate = native_rate
+        self.noise_profile = noise_profile
+        self.verbose = verbose
+        self.processor = MYPAudioProcessor(native_rate=native_rate, noise_profile=noise_profile)
+        # İş parçacığı havuzunda her iş parçacığının kendi işlemcisi (çağrı başına durumlar paylaşılmaz)
+        self._thread_state = threading.local()
+        
+        if max_workers is None:
+            max_workers = available_cpu_count() if backend == 'process' else 4
         self.max_workers = max_workers
         
+    def _create_executor(self):
+        """Seçilen backend'e göre havuz oluştur"""
+        if self.backend == 'process':
+            return ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker,
+                                       initargs=(self.native_rate, self.noise_profile, self.verbose))
+        return ThreadPoolExecutor(max_workers=self.max_workers)
+    
     def mehmet_yay_process_folder(self, input_folder, output_folder=None):
         """Klasördeki tüm ses dosyalarını profesyonel olarak işle"""
         if not os.path.exists(input_folder):
@@ -49,21 +129,27 @@ class MYPBatchProcessor:
         print(f"📁 Giriş klasörü: {input_folder}")
         print(f"📁 Çıkış klasörü: {output_folder}")
         print(f"🔢 Toplam dosya: {len(audio_files)}")
-        print(f"⚡ İş parçacığı sayısı: {self.max_workers}")
+        print(f"⚡ İşçi sayısı: {self.max_workers} ({'süreç' if self.backend == 'process' else 'iş parçacığı'})")
+        if self.noise_profile:
+            print(f"🔇 Gürültü profili: {self.noise_profile}")
         print("=" * 70)
         
+        _set_verbosity(self.verbose)
         start_time = time.time()
         
         # Toplu işleme
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        with self._create_executor() as executor:
             futures = []
             
+            # Süreç havuzunda işlemci işçilerde yaşar, bu nesne gönderilmez
+            job = _process_file_in_worker if self.backend == 'process' else self._process_file_in_thread
+            
             for i, input_file in enumerate(audio_files, 1):
                 filename = os.path.basename(input_file)
                 name, ext = os.path.splitext(filename)
                 output_file = os.path.join(output_folder, f"{name}_MYP_Enhanced.wav")
                 
-                future = executor.submit(self.mehmet_yay_process_single_file, input_file, output_file, i, len(audio_files))
+                future = executor.submit(job, input_file, output_file, i, len(audio_files))
                 futures.append(future)
             
             # Sonuçları bekle
@@ -77,12 +163,13 @@ class MYPBatchProcessor:
                     else:
                         failed += 1
                 except Exception as e:
-                    print(f"❌ İşleme hatası: {e}")
+                    log.error("❌ İşleme hatası: %s", e)
                     failed += 1
         
         end_time = time.time()
         total_time = end_time - start_time
         
+        flush()
         print("\n" + "=" * 70)
         print("🎉 TOPLU İŞLEME TAMAMLANDI!")
         print(f"✅ Başarılı: {completed}/{len(audio_files)}")
@@ -92,27 +179,22 @@ class MYPBatchProcessor:
         print(f"📁 Çıktı klasörü: {output_folder}")
         print("=" * 70)
     
+    def _thread_processor(self):
+        """Bu iş parçacığının işlemcisi (ilk işte oluşturulur, _init_worker gibi hazırlanır)"""
+        processor = getattr(self._thread_state, 'processor', None)
+        if processor is None:
+            processor = MYPAudioProcessor(native_rate=self.native_rate, noise_profile=self.noise_profile)
+            processor.warm_up()
+            self._thread_state.processor = processor
+        return processor
+    
+    def _process_file_in_thread(self, input_file, output_file, current, total):
+        """İş parçacığı havuzunda tek dosya işle (iş parçacığına ait işlemciyle)"""
+        return _process_file_with_progress(self._thread_processor(), input_file, output_file, current, total)
+    
     def mehmet_yay_process_single_file(self, input_file, output_file, current, total):
         """Tek dosya profesyonel işleme"""
-        try:
-            filename = os.path.basename(input_file)
-            print(f"🎵 [{current:02d}/{total:02d}] İşleniyor: {filename}")
-            
-            start_time = time.time()
-            success = self.processor.mehmet_yay_process_audio(input_file, output_file)
-            end_time = time.time()
-            
-            if success:
-                duration = end_time - start_time
-                print(f"✅ [{current:02d}/{total:02d}] Tamamlandı: {filename} ({duration:.1f}s)")
-                return True
-            else:
-                print(f"❌ [{current:02d}/{total:02d}] Başarısız: {filename}")
-                return False
-                
-        except Exception as e:
-            print(f"❌ [{current:02d}/{total:02d}] Hata: {filename} - {e}")
-            return False
+        return _process_file_with_progress(self.processor, input_file, output_file, current, total)
 
 def main():
     print("🎵 MYP TOPLU SES İŞLEME")
@@ -134,17 +216,48 @@ def main():
     if not output_folder:
         output_folder = None
     
-    # İş parçacığı sayısı
+    # İşleme modu
+    backend = input("⚙️ İşleme modu (thread/process, varsayılan process): ").strip().lower() or "process"
+    if backend not in ('thread', 'process'):
+        backend = 'process'
+    
+    # Sample rate
+    native_rate = input("🎯 Dosyalar özgün sample rate'lerinde işlensin mi? (e/h, varsayılan h): ").strip().lower() == "e"
+    
+    # Gürültü profili (aynı ortamda kaydedilmiş seriler için)
+    noise_profile = None
+    saved_profiles = noise_profiles.names()
+    if saved_profiles:
+        print(f"🔇 Kayıtlı gürültü profilleri: {', '.join(saved_profiles)}")
+    profile_name = input("🔇 Gürültü profili adı (boş bırakırsanız her dosya kendi gürültüsünden): ").strip()
+    if profile_name:
+        if profile_name not in saved_profiles:
+            reference = input("🎧 Profil öğrenilecek referans dosya: ").strip().strip('"')
+            try:
+                seconds = float(input("⏱️ Kaç saniyesi kullanılsın? (boş: tamamı): ") or 0) or None
+            except ValueError:
+                seconds = None
+            try:
+                MYPAudioProcessor(native_rate=native_rate).learn_noise_profile(reference, seconds, name=profile_name)
+            except Exception as e:
+                print(f"❌ Gürültü profili öğrenilemedi: {e}")
+                return
+        noise_profile = profile_name
+    
+    # İşçi sayısı
+    cpu_count = available_cpu_count()
+    default_workers = cpu_count if backend == 'process' else 4
     try:
-        max_workers = int(input("⚡ Eş zamanlı işleme sayısı (1-8, varsayılan 4): ") or "4")
-        max_workers = max(1, min(8, max_workers))
+        max_workers = int(input(f"⚡ Eş zamanlı işleme sayısı (1-{cpu_count}, varsayılan {default_workers}): ") or default_workers)
+        max_workers = max(1, min(cpu_count, max_workers))
     except:
-        max_workers = 4
+        max_workers = default_workers
     
-    print(f"\n🚀 {max_workers} iş parçacığı ile işleme başlıyor...\n")
+    print(f"\n🚀 {max_workers} işçi ({backend}) ile işleme başlıyor...\n")
     
     # İşleme başlat
-    processor = MYPBatchProcessor(max_workers=max_workers)
+    processor = MYPBatchProcessor(max_workers=max_workers, backend=backend, native_rate=native_rate,
+                                  noise_profile=noise_profile)
     processor.mehmet_yay_process_folder(input_folder, output_folder)
     
     input("\n✅ İşlem tamamlandı! Çıkmak için Enter'a basın...")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MYP Ses Düzenleyici - Hassasiyet Karşılaştırması
+Mehmet Yay tarafından geliştirildi
+"""
+
+import argparse
+import time
+import tracemalloc
+import numpy as np
+from myp_audio_processor import MYPAudioProcessor
+
+
+def make_test_signal(seconds, channels, sample_rate=44100, seed=0):
+    """Tekrarlanabilir gürültü + ton test sinyali (float64 kaynak)"""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    tone = 0.3 * np.sin(2 * np.pi * 220 * t)
+    audio_data = tone[:, np.newaxis] + 0.05 * rng.standard_normal((len(t), channels))
+    return audio_data[:, 0] if channels == 1 else audio_data
+
+
+def measure_stages(precision, audio_data, settings, repeats=3):
+    """Her aşamanın süresini ve tepe ek belleğini ölç: {aşama: (saniye, bayt)}"""
+    processor = MYPAudioProcessor(precision=precision, debug_dtype=True)
+    processor.warm_up(settings)
+    audio_data = processor.precision.cast(audio_data)
+
+    results = {}
+    stage_input = audio_data
+    for name, stage, param in processor._stage_plan(settings):
+        best = float('inf')
+        for _ in range(repeats):
+            start = time.perf_counter()
+            output = stage(stage_input, param)
+            best = min(best, time.perf_counter() - start)
+
+        # Bellek ölçümü ayrı çalıştırmada (tracemalloc süreyi şişirir)
+        tracemalloc.start()
+        output = stage(stage_input, param)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        processor.precision.check(output, name)
+        results[name] = (best, peak)
+        stage_input = output
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="float32 / float64 işleme zinciri karşılaştırması")
+    parser.add_argument('--seconds', type=float, default=30.0, help="test sinyali süresi")
+    parser.add_argument('--channels', type=int, default=2, help="kanal sayısı (1 veya 2)")
+    parser.add_argument('--noise', action='store_true', help="gürültü azaltmayı da ölç (yavaş)")
+    args = parser.parse_args()
+
+    settings = dict(MYPAudioProcessor.DEFAULT_SETTINGS)
+    if not args.noise:
+        settings['noise_reduction'] = 0
+
+    audio_data = make_test_signal(args.seconds, args.channels)
+    print("🎵 MYP Hassasiyet Karşılaştırması")
+    print(f"📊 {args.seconds:.0f} sn, {args.channels} kanal, "
+          f"giriş {audio_data.size * 4 / 1e6:.1f} MB (float32) / {audio_data.size * 8 / 1e6:.1f} MB (float64)")
+
+    measured = {precision: measure_stages(precision, audio_data, settings)
+                for precision in ('float32', 'float64')}
+
+    print(f"\n{'Aşama':<18}{'float32 ms':>12}{'float64 ms':>12}{'float32 MB':>12}{'float64 MB':>12}")
+    totals = {'float32': [0.0, 0], 'float64': [0.0, 0]}
+    for name in measured['float32']:
+        row = []
+        for precision in ('float32', 'float64'):
+            seconds, peak = measured[precision][name]
+            totals[precision][0] += seconds
+            totals[precision][1] = max(totals[precision][1], peak)
+            row.append((seconds, peak))
+        print(f"{name:<18}{row[0][0] * 1000:>12.1f}{row[1][0] * 1000:>12.1f}"
+              f"{row[0][1] / 1e6:>12.1f}{row[1][1] / 1e6:>12.1f}")
+
+    time32, peak32 = totals['float32']
+    time64, peak64 = totals['float64']
+    print(f"\n⏱️ Toplam: float32 {time32:.2f} sn, float64 {time64:.2f} sn ({time64 / time32:.2f}x)")
+    print(f"💾 Tepe ek bellek: float32 {peak32 / 1e6:.1f} MB, float64 {peak64 / 1e6:.1f} MB ({peak64 / max(peak32, 1):.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MYP Ses Düzenleyici - Tampon Havuzu
+Mehmet Yay tarafından geliştirildi
+"""
+
+import threading
+import numpy as np
+
+
+class MYPBufferPool:
+    """(shape, dtype) anahtarlı, yeniden kullanılabilir NumPy tamponları"""
+
+    def __init__(self, max_free_bytes=64 * 1024 * 1024):
+        # Boşta tutulan tamponların toplam sınırı (bellek kısıtlı sunucular için)
+        self.max_free_bytes = max_free_bytes
+        self._free = {}
+        self._free_bytes = 0
+        self._lock = threading.Lock()
+        self.allocations = 0
+        self.reuses = 0
+
+    @staticmethod
+    def _key(shape, dtype):
+        return (tuple(shape), np.dtype(dtype).str)
+
+    def acquire(self, shape, dtype):
+        """Uygun boşta tampon varsa onu, yoksa yeni (başlatılmamış) tampon döndür"""
+        key = self._key(shape, dtype)
+        with self._lock:
+            free = self._free.get(key)
+            if free:
+                buffer = free.pop()
+                self._free_bytes -= buffer.nbytes
+                self.reuses += 1
+                return buffer
+            self.allocations += 1
+        return np.empty(shape, dtype=dtype)
+
+    def release(self, buffer):
+        """Tamponu havuza geri ver (sınır aşılıyorsa bırakılır)"""
+        with self._lock:
+            if self._free_bytes + buffer.nbytes > self.max_free_bytes:
+                return
+            self._free.setdefault(self._key(buffer.shape, buffer.dtype), []).append(buffer)
+            self._free_bytes += buffer.nbytes
+
+    def stats(self):
+        """Ayırma/yeniden kullanım sayaçları ve boşta bekleyen bayt"""
+        with self._lock:
+            total = self.allocations + self.reuses
+            return {
+                'allocations': self.allocations,
+                'reuses': self.reuses,
+                'reuse_rate': self.reuses / total if total else 0.0,
+                'free_bytes': self._free_bytes
+            }
+
+    def clear(self):
+        """Boştaki tamponları bırak ve sayaçları sıfırla"""
+        with self._lock:
+            self._free.clear()
+            self._free_bytes = 0
+            self.allocations = 0
+            self.reuses = 0
+
+
+class Workspace:
+    """Bir işleme çalıştırmasının karalama tamponları; çıkışta hepsi havuza döner"""
+
+    def __init__(self, pool):
+        self.pool = pool
+        self._buffers = []
+        self._reusable = {}
+        self.in_use_bytes = 0
+        self.peak_bytes = 0
+
+    def scratch(self, shape, dtype):
+        """Çalıştırma süresince kullanılacak karalama tamponu"""
+        buffer = self.pool.acquire(shape, dtype)
+        self._buffers.append(buffer)
+        self.track(buffer.nbytes)
+        return buffer
+
+    def scratch_for(self, array, length=None):
+        """array ile aynı kanal düzeni ve dtype'ta karalama görünümü
+
+        Aynı düzen için tek tampon tutulur, daha uzun blok gelirse büyütülür
+        (length: ilk ayırmada kullanılacak en az uzunluk)
+        """
+        key = (array.shape[1:], array.dtype.str)
+        buffer = self._reusable.get(key)
+        if buffer is None or len(buffer) < len(array):
+            size = max(len(array), length or 0)
+            buffer = self.scratch((size,) + array.shape[1:], array.dtype)
+            self._reusable[key] = buffer
+        return buffer[:len(array)]
+
+    def track(self, nbytes):
+        """Havuz dışı (ör. çıktı) tamponları tepe hesabına ekle"""
+        self.in_use_bytes += nbytes
+        self.peak_bytes = max(self.peak_bytes, self.in_use_bytes)
+
+    def release_all(self):
+        """Karalama tamponlarını havuza geri ver"""
+        for buffer in self._buffers:
+            self.pool.release(buffer)
+            self.in_use_bytes -= buffer.nbytes
+        self._buffers.clear()
+        self._reusable.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release_all()
+        return False
+
+
+# Süreç boyunca paylaşılan tampon havuzu
+buffer_pool = MYPBufferPool()
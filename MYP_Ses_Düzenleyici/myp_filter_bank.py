@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MYP Ses Düzenleyici - Filtre Bankası
+Mehmet Yay tarafından geliştirildi
+"""
+
+import threading
+from collections import OrderedDict
+import numpy as np
+from scipy import signal
+
+# Bant kenarları Nyquist frekansının bu oranını aşamaz (44.1/48 kHz tabloları etkilenmez)
+NYQUIST_MARGIN = 0.95
+
+
+class MYPFilterBank:
+    """Tasarlanmış Butterworth SOS filtrelerini saklayan ortak kayıt"""
+
+    def __init__(self, max_compiled=32):
+        self._filters = {}
+        # Ayar kombinasyonuna bağlı derlenmiş yanıtlar sınırsız büyümesin (LRU)
+        self._compiled = OrderedDict()
+        self.max_compiled = max_compiled
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(btype, order, cutoff, sample_rate):
+        """(tip, derece, bant kenarları, sample rate) anahtarı oluştur"""
+        if isinstance(cutoff, (list, tuple)):
+            cutoff = tuple(float(c) for c in cutoff)
+        else:
+            cutoff = float(cutoff)
+        return (btype, int(order), cutoff, int(sample_rate))
+
+    @staticmethod
+    def fit_to_nyquist(cutoff, btype, sample_rate):
+        """Bant kenarlarını Nyquist sınırına çek, (kesim, tip) ya da None döndür
+
+        None: geçirme bandı tamamen Nyquist üstünde ('low' için filtre
+        etkisiz, 'high'/'band' için çıktı sessiz)
+        """
+        limit = sample_rate / 2 * NYQUIST_MARGIN
+        if btype == 'band':
+            low, high = cutoff
+            if low >= limit:
+                return None
+            if high >= limit:
+                # Üst kenar sığmıyorsa bant, alt kenardan yüksek geçirene döner
+                return low, 'high'
+            return cutoff, btype
+        if cutoff >= limit:
+            return None
+        return cutoff, btype
+
+    def get_sos(self, order, cutoff, btype, sample_rate, dtype=np.float64):
+        """Filtreyi bir kez tasarla, sonraki çağrılarda aynı SOS'u döndür
+
+        Bant Nyquist üstünde kalıyorsa None döner (bkz. fit_to_nyquist).
+        Katsayılar float64 tasarlanıp istenen dtype'a çevrilir; sosfilt
+        hesabı girişle aynı dtype'ta kalsın diye her dtype ayrı saklanır.
+        """
+        fitted = self.fit_to_nyquist(cutoff, btype, sample_rate)
+        if fitted is None:
+            return None
+        cutoff, btype = fitted
+        key = self.make_key(btype, order, cutoff, sample_rate) + (np.dtype(dtype).name,)
+        with self._lock:
+            sos = self._filters.get(key)
+            if sos is not None:
+                self.hits += 1
+                return sos
+            self.misses += 1
+
+        # Tasarım kilit dışında yapılır, aynı anda tasarlanan filtre aynıdır.
+        # Not: sosfilt salt-okunur diziyi kabul etmediği için dizi yazılabilir kalır,
+        # paylaşılan SOS'lar hiçbir yerde yerinde değiştirilmemelidir
+        sos = signal.butter(order, cutoff, btype=btype, fs=sample_rate, output='sos').astype(dtype)
+
+        with self._lock:
+            return self._filters.setdefault(key, sos)
+
+    def get_compiled(self, key, factory):
+        """Filtre dışı derlenmiş yanıtları (ör. birleşik EQ) LRU olarak sakla"""
+        with self._lock:
+            compiled = self._compiled.get(key)
+            if compiled is not None:
+                self._compiled.move_to_end(key)
+                self.hits += 1
+                return compiled
+            self.misses += 1
+
+        compiled = factory()
+
+        with self._lock:
+            compiled = self._compiled.setdefault(key, compiled)
+            self._compiled.move_to_end(key)
+            while len(self._compiled) > self.max_compiled:
+                self._compiled.popitem(last=False)
+            return compiled
+
+    def stats(self):
+        """İsabet/ıskalama sayaçları"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'filters': len(self._filters),
+                'compiled': len(self._compiled),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0
+            }
+
+    def clear(self):
+        """Kayıtları ve sayaçları sıfırla"""
+        with self._lock:
+            self._filters.clear()
+            self._compiled.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Süreç boyunca paylaşılan filtre bankası
+filter_bank = MYPFilterBank()
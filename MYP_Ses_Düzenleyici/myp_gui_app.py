@@ -19,6 +19,9 @@ from scipy import signal
 import noisereduce as nr
 from pydub import AudioSegment
 from pydub.playback import play
+from myp_resampler import resample
+from myp_stage_cache import CachedChain
+from myp_render_scheduler import RenderService, RenderCancelled
 import pygame
 import tempfile
 import shutil
@@ -52,6 +55,8 @@ class AudioProcessor:
         self.sample_rate = 44100
         self.bit_depth = 16
         self.channels = 2
+        # Aşama çıktıları önbellekte: ayar değişince yalnızca o aşama ve sonrası işlenir
+        self.stage_chain = CachedChain()
         
     def load_audio(self, file_path):
         """Gelişmiş ses dosyası yükleme"""
@@ -67,22 +72,21 @@ class AudioProcessor:
             print(f"🔊 Kanal: {audio.channels} ({'Stereo' if audio.channels == 2 else 'Mono'})")
             print(f"📊 Sample Rate: {audio.frame_rate} Hz")
             
-            # Stereo'ya çevir
-            if audio.channels == 1:
-                audio = audio.set_channels(2)
-                print("🔄 Mono'dan Stereo'ya çevrildi")
+            # NumPy array'e çevir
+            samples = np.array(audio.get_array_of_samples())
+            samples = samples.reshape((-1, audio.channels)).astype(np.float32) / 32768.0
             
-            # Sample rate'i ayarla
+            # Sample rate'i ayarla (önbellekli polifaz çekirdek, kanal çoğaltmadan önce)
             if audio.frame_rate != self.sample_rate:
-                audio = audio.set_frame_rate(self.sample_rate)
+                samples = resample(samples, audio.frame_rate, self.sample_rate)
                 print(f"🔄 Sample rate {self.sample_rate} Hz'e ayarlandı")
             
-            # NumPy array'e çevir
-            samples = np.array(audio.get_array_of_samples())
-            if audio.channels == 2:
-                samples = samples.reshape((-1, 2))
+            # Mono kaynak 1-D kalır (stereo filtre döngüleri aynı veriyi iki kez işlemesin)
+            if audio.channels == 1:
+                samples = samples[:, 0]
+                print("🎙️ Mono kaynak mono olarak işlenecek")
             
-            return samples.astype(np.float32) / 32768.0
+            return samples
             
         except Exception as e:
             print(f"❌ Ses dosyası yüklenirken hata: {e}")
@@ -94,14 +98,12 @@ class AudioProcessor:
             return audio_data
         
         try:
-            if len(audio_data.shape) == 2:
-                # Stereo
-                left = nr.reduce_noise(y=audio_data[:, 0], sr=self.sample_rate, prop_decrease=intensity*0.8)
-                right = nr.reduce_noise(y=audio_data[:, 1], sr=self.sample_rate, prop_decrease=intensity*0.8)
-                return np.column_stack([left, right])
-            else:
-                # Mono
-                return nr.reduce_noise(y=audio_data, sr=self.sample_rate, prop_decrease=intensity*0.8)
+            # Her kanal ayrı temizlenir (mono/stereo/N kanal)
+            channels = audio_data.reshape(len(audio_data), -1)
+            cleaned = np.empty_like(channels)
+            for i in range(channels.shape[1]):
+                cleaned[:, i] = nr.reduce_noise(y=channels[:, i], sr=self.sample_rate, prop_decrease=intensity*0.8)
+            return cleaned.reshape(audio_data.shape)
         except Exception as e:
             print(f"Gürültü azaltma hatası: {e}")
             return audio_data
@@ -115,15 +117,11 @@ class AudioProcessor:
             # Vokal frekans aralığı (300Hz - 3kHz)
             sos = signal.butter(4, [300, 3000], btype='band', fs=self.sample_rate, output='sos')
             
-            if len(audio_data.shape) == 2:
-                enhanced = np.zeros_like(audio_data)
-                for i in range(2):
-                    vocal_band = signal.sosfilt(sos, audio_data[:, i])
-                    enhanced[:, i] = audio_data[:, i] + (vocal_band * intensity * 0.3)
-                return enhanced
-            else:
-                vocal_band = signal.sosfilt(sos, audio_data)
-                return audio_data + (vocal_band * intensity * 0.3)
+            # Tüm kanallar tek seferde (mono/stereo/N kanal)
+            vocal_band = signal.sosfilt(sos, audio_data, axis=0)
+            enhanced = audio_data.copy()
+            enhanced += vocal_band * (intensity * 0.3)
+            return enhanced
         except Exception as e:
             print(f"Vokal geliştirme hatası: {e}")
             return audio_data
@@ -137,15 +135,11 @@ class AudioProcessor:
             # Bas frekans aralığı (20Hz - 200Hz)
             sos = signal.butter(4, [20, 200], btype='band', fs=self.sample_rate, output='sos')
             
-            if len(audio_data.shape) == 2:
-                enhanced = np.zeros_like(audio_data)
-                for i in range(2):
-                    bass_band = signal.sosfilt(sos, audio_data[:, i])
-                    enhanced[:, i] = audio_data[:, i] + (bass_band * intensity * 0.4)
-                return enhanced
-            else:
-                bass_band = signal.sosfilt(sos, audio_data)
-                return audio_data + (bass_band * intensity * 0.4)
+            # Tüm kanallar tek seferde (mono/stereo/N kanal)
+            bass_band = signal.sosfilt(sos, audio_data, axis=0)
+            enhanced = audio_data.copy()
+            enhanced += bass_band * (intensity * 0.4)
+            return enhanced
         except Exception as e:
             print(f"Bas güçlendirme hatası: {e}")
             return audio_data
@@ -159,22 +153,18 @@ class AudioProcessor:
             # Tiz frekans aralığı (4kHz - 16kHz)
             sos = signal.butter(4, [4000, 16000], btype='band', fs=self.sample_rate, output='sos')
             
-            if len(audio_data.shape) == 2:
-                enhanced = np.zeros_like(audio_data)
-                for i in range(2):
-                    treble_band = signal.sosfilt(sos, audio_data[:, i])
-                    enhanced[:, i] = audio_data[:, i] + (treble_band * intensity * 0.3)
-                return enhanced
-            else:
-                treble_band = signal.sosfilt(sos, audio_data)
-                return audio_data + (treble_band * intensity * 0.3)
+            # Tüm kanallar tek seferde (mono/stereo/N kanal)
+            treble_band = signal.sosfilt(sos, audio_data, axis=0)
+            enhanced = audio_data.copy()
+            enhanced += treble_band * (intensity * 0.3)
+            return enhanced
         except Exception as e:
             print(f"Tiz geliştirme hatası: {e}")
             return audio_data
     
     def apply_stereo_enhance(self, audio_data, intensity):
         """Stereo genişletme"""
-        if intensity == 0 or len(audio_data.shape) != 2:
+        if intensity == 0 or len(audio_data.shape) != 2 or audio_data.shape[1] != 2:
             return audio_data
         
         try:
@@ -203,15 +193,11 @@ class AudioProcessor:
             # Sıcaklık frekansları (400Hz - 1.5kHz)
             sos = signal.butter(4, [400, 1500], btype='band', fs=self.sample_rate, output='sos')
             
-            if len(audio_data.shape) == 2:
-                warmed = np.zeros_like(audio_data)
-                for i in range(2):
-                    warmth_band = signal.sosfilt(sos, audio_data[:, i])
-                    warmed[:, i] = audio_data[:, i] + (warmth_band * intensity * 0.25)
-                return warmed
-            else:
-                warmth_band = signal.sosfilt(sos, audio_data)
-                return audio_data + (warmth_band * intensity * 0.25)
+            # Tüm kanallar tek seferde (mono/stereo/N kanal)
+            warmth_band = signal.sosfilt(sos, audio_data, axis=0)
+            warmed = audio_data.copy()
+            warmed += warmth_band * (intensity * 0.25)
+            return warmed
         except Exception as e:
             print(f"Sıcaklık filtresi hatası: {e}")
             return audio_data
@@ -226,21 +212,12 @@ class AudioProcessor:
             threshold = 0.7 - (intensity * 0.3)  # 0.4 - 0.7 arası
             ratio = 1 + (intensity * 3)  # 1 - 4 arası
             
-            if len(audio_data.shape) == 2:
-                compressed = np.zeros_like(audio_data)
-                for i in range(2):
-                    # Kompresyon uygula
-                    abs_audio = np.abs(audio_data[:, i])
-                    mask = abs_audio > threshold
-                    compressed[:, i] = audio_data[:, i].copy()
-                    compressed[mask, i] = np.sign(audio_data[mask, i]) * (threshold + (abs_audio[mask] - threshold) / ratio)
-                return compressed
-            else:
-                abs_audio = np.abs(audio_data)
-                mask = abs_audio > threshold
-                compressed = audio_data.copy()
-                compressed[mask] = np.sign(audio_data[mask]) * (threshold + (abs_audio[mask] - threshold) / ratio)
-                return compressed
+            # Kompresyon örnek bazlı olduğu için tüm kanallara birlikte uygulanır
+            abs_audio = np.abs(audio_data)
+            mask = abs_audio > threshold
+            compressed = audio_data.copy()
+            compressed[mask] = np.sign(audio_data[mask]) * (threshold + (abs_audio[mask] - threshold) / ratio)
+            return compressed
         except Exception as e:
             print(f"Kompresyon hatası: {e}")
             return audio_data
@@ -254,38 +231,38 @@ class AudioProcessor:
             # Soft clipping
             saturation = 0.8 + (intensity * 0.2)
             
-            if len(audio_data.shape) == 2:
-                mastered = np.zeros_like(audio_data)
-                for i in range(2):
-                    mastered[:, i] = np.tanh(audio_data[:, i] * saturation) * 1.1
-                return mastered
-            else:
-                return np.tanh(audio_data * saturation) * 1.1
+            # Tüm kanallar tek seferde
+            return np.tanh(audio_data * saturation) * 1.1
         except Exception as e:
             print(f"Mastering hatası: {e}")
             return audio_data
     
-    def process_audio(self, audio_data, settings):
-        """Tüm efektleri uygula"""
+    def process_audio(self, audio_data, settings, cancel=None, progress=None):
+        """Tüm efektleri uygula
+
+        cancel: aşama sınırlarında yoklanan iptal jetonu, progress: progress(aşama, tamamlanan, toplam)
+        """
         try:
-            processed = audio_data.copy()
-            
-            # Efektleri sırayla uygula
-            processed = self.apply_noise_reduction(processed, settings.get('noise_reduction', 0))
-            processed = self.apply_vocal_enhance(processed, settings.get('vocal_enhance', 0))
-            processed = self.apply_bass_boost(processed, settings.get('bass_boost', 0))
-            processed = self.apply_treble_enhance(processed, settings.get('treble_enhance', 0))
-            processed = self.apply_stereo_enhance(processed, settings.get('stereo_enhance', 0))
-            processed = self.apply_warmth_filter(processed, settings.get('warmth_filter', 0))
-            processed = self.apply_compression(processed, settings.get('compression', 0))
-            processed = self.apply_mastering(processed, settings.get('mastering', 0))
+            # Efektleri sırayla uygula (değişmeyen aşamaların çıktıları önbellekten)
+            processed = self.stage_chain.run(audio_data, [
+                ('noise_reduction', self.apply_noise_reduction, settings.get('noise_reduction', 0)),
+                ('vocal_enhance', self.apply_vocal_enhance, settings.get('vocal_enhance', 0)),
+                ('bass_boost', self.apply_bass_boost, settings.get('bass_boost', 0)),
+                ('treble_enhance', self.apply_treble_enhance, settings.get('treble_enhance', 0)),
+                ('stereo_enhance', self.apply_stereo_enhance, settings.get('stereo_enhance', 0)),
+                ('warmth_filter', self.apply_warmth_filter, settings.get('warmth_filter', 0)),
+                ('compression', self.apply_compression, settings.get('compression', 0)),
+                ('mastering', self.apply_mastering, settings.get('mastering', 0)),
+            ], variant=self.sample_rate, cancel=cancel, progress=progress)
             
-            # Normalize
+            # Normalize (yeni dizi; önbellekteki çıktı değişmez)
             max_val = np.max(np.abs(processed))
             if max_val > 0:
                 processed = processed / max_val * 0.95
             
             return processed
+        except RenderCancelled:
+            raise
         except Exception as e:
             print(f"İşleme hatası: {e}")
             return audio_data
@@ -576,6 +553,11 @@ class MYPAudioEditor:
         # UI oluştur
         self.setup_ui()
         
+        # İşleme arka planda, sonuçlar Tk döngüsünde kuyruktan alınır
+        self.render_service = RenderService(self.root, self.render_audio, on_result=self.show_processed_audio,
+                                            on_progress=self.show_processing_progress,
+                                            on_error=self.show_processing_error)
+        
         # Log manager'ı başlat
         self.log_manager = LogManager(self.log_text)
         self.log_manager.log_message("🎵 MYP Ses Düzenleyici başlatıldı")
@@ -1011,32 +993,46 @@ class MYPAudioEditor:
         self.log_manager.log_message(f"🔧 {key}: {int_value}%")
         
     def process_audio_stable(self):
-        """Stabil ses işleme"""
-        if self.original_audio is None or self.processing:
+        """Stabil ses işleme - arka planda, süren işleme yeni ayarla iptal edilir"""
+        if self.original_audio is None:
             return
             
-        try:
-            self.processing = True
-            self.status_label.configure(text="İşleniyor...", text_color="#FF9800")
-            
-            # Ses işleme
-            settings = self.settings_manager.get_settings()
-            self.processed_audio = self.audio_processor.process_audio(self.original_audio, settings)
-            
-            # Görselleştirmeyi güncelle
-            self.viz_manager.plot_audio_comparison(self.original_audio, self.processed_audio)
-            
-            # Butonları aktif et
-            self.play_processed_btn.configure(state="normal")
-            self.export_btn.configure(state="normal")
-            
-            self.status_label.configure(text="İşlendi", text_color="#4CAF50")
-            
-        except Exception as e:
-            self.log_manager.log_message(f"❌ İşleme hatası: {e}", "ERROR")
-            self.status_label.configure(text="Hata", text_color="#FF0000")
-        finally:
-            self.processing = False
+        self.processing = True
+        self.status_label.configure(text="İşleniyor...", text_color="#FF9800")
+        self.render_service.submit(self.settings_manager.get_settings())
+        
+    def render_audio(self, settings, cancel, progress):
+        """İşleme iş parçacığında: ses işleme"""
+        original_audio = self.original_audio
+        if original_audio is None:
+            return None
+        return original_audio, self.audio_processor.process_audio(original_audio, settings, cancel, progress)
+        
+    def show_processing_progress(self, stage, done, total):
+        """İşleme ilerlemesini göster"""
+        self.status_label.configure(text=f"İşleniyor: {stage} ({done}/{total})", text_color="#FF9800")
+        
+    def show_processed_audio(self, result):
+        """Tk iş parçacığında: işlenmiş sesi göster"""
+        self.processing = False
+        if result is None:
+            return
+        original_audio, self.processed_audio = result
+        
+        # Görselleştirmeyi güncelle
+        self.viz_manager.plot_audio_comparison(original_audio, self.processed_audio)
+        
+        # Butonları aktif et
+        self.play_processed_btn.configure(state="normal")
+        self.export_btn.configure(state="normal")
+        
+        self.status_label.configure(text="İşlendi", text_color="#4CAF50")
+        
+    def show_processing_error(self, error):
+        """Tk iş parçacığında: işleme hatasını bildir"""
+        self.processing = False
+        self.log_manager.log_message(f"❌ İşleme hatası: {error}", "ERROR")
+        self.status_label.configure(text="Hata", text_color="#FF0000")
             
     def play_original(self):
         """Orijinal sesi çal"""
@@ -1158,6 +1154,7 @@ class MYPAudioEditor:
             self.audio_player.stop()
             if self.update_timer:
                 self.root.after_cancel(self.update_timer)
+            self.render_service.close(timeout=1.0)
         except:
             pass
         
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MYP Ses Düzenleyici - Aşama Ölçümleri (Süre, CPU, Bellek)
+Mehmet Yay tarafından geliştirildi
+"""
+
+import functools
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from myp_logging import get_logger
+
+try:
+    import resource
+except ImportError:  # Windows: RSS ölçümü yok
+    resource = None
+
+log = get_logger('instrumentation')
+
+# Bellek ölçüm yöntemleri: Python/NumPy ayırmaları (tracemalloc), süreç tepe RSS artışı ya da kapalı
+MEMORY_MODES = ('tracemalloc', 'rss', None)
+
+
+class MemorySink:
+    """Olayları bellekte biriktir (testler, karşılaştırma betikleri)"""
+
+    def __init__(self):
+        self.events = []
+        self._lock = threading.Lock()
+
+    def __call__(self, event):
+        with self._lock:
+            self.events.append(event)
+
+    def clear(self):
+        with self._lock:
+            self.events.clear()
+
+
+class JsonLinesSink:
+    """Olayları dosyaya satır başına bir JSON olarak ekle"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+    def __call__(self, event):
+        line = json.dumps(event, ensure_ascii=False)
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as log_file:
+                log_file.write(line + '\n')
+
+
+class _Measurement:
+    """Tek çağrının duvar saati, iş parçacığı CPU süresi ve bellek ölçümü"""
+
+    def __init__(self, memory):
+        self.memory = memory
+        self.wall = time.perf_counter()
+        self.cpu = time.thread_time()
+        self.base = 0
+        if memory == 'tracemalloc':
+            # Tepe değer süreç geneli: paralel aşamalarda diğer işlerin ayırmaları da görünür
+            self.base = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        elif memory == 'rss':
+            self.base = _max_rss()
+
+    def stop(self):
+        """(duvar saati, CPU süresi, tepe bayt) döndür"""
+        wall = time.perf_counter() - self.wall
+        cpu = time.thread_time() - self.cpu
+        peak = None
+        if self.memory == 'tracemalloc':
+            peak = max(0, tracemalloc.get_traced_memory()[1] - self.base)
+        elif self.memory == 'rss':
+            peak = max(0, _max_rss() - self.base)
+        return wall, cpu, peak
+
+
+def _max_rss():
+    """Sürecin tepe RSS değeri (bayt)"""
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux kB, macOS bayt döndürür
+    return usage if sys.platform == 'darwin' else usage * 1024
+
+
+def _samples(audio_data):
+    """Dizinin örnek sayısı (dizi değilse, ör. analiz sözlüğü, 0)"""
+    return len(audio_data) if getattr(audio_data, 'ndim', 0) else 0
+
+
+def _realtime_factor(samples, sample_rate, wall_time):
+    """Gerçek zamanın kaç katı hızlı (ses süresi / işleme süresi)"""
+    if not sample_rate or wall_time <= 0:
+        return None
+    return samples / sample_rate / wall_time
+
+
+class RunRecorder:
+    """Bir işleme çalıştırmasının aşama ölçümleri
+
+    wrap() ile sarılan aşama her çağrıldığında (parça parça da olsa) aşama toplamına
+    eklenir; finish() aşama başına bir 'stage' ve sonunda bir 'run' olayı yayar.
+    """
+
+    def __init__(self, instrumentation, component, operation, sample_rate=None, **fields):
+        self.instrumentation = instrumentation
+        self.component = component
+        self.operation = operation
+        self.sample_rate = sample_rate
+        self.fields = fields
+        self.run_id = instrumentation.next_run_id()
+        self._stages = {}
+        self._lock = threading.Lock()
+        # Aşama ölçümleri tepe sayacını sıfırladığından çalıştırma tepesi aşamalardan da toplanır
+        self._peak_seen = 0
+        self._memory = instrumentation.start_memory()
+        self._process_cpu = time.process_time()
+        self._run = _Measurement(self._memory)
+
+    def wrap(self, name, func):
+        """func'ı ölçerek çağıran sarmalayıcı (ilk argüman ses verisi)"""
+        @functools.wraps(func)
+        def measured(audio_data, *args, **kwargs):
+            measurement = _Measurement(self._memory)
+            result = func(audio_data, *args, **kwargs)
+            wall, cpu, peak = measurement.stop()
+            with self._lock:
+                totals = self._stages.setdefault(name, {
+                    'calls': 0, 'wall_time': 0.0, 'cpu_time': 0.0, 'peak_bytes': None,
+                    'input_samples': 0, 'output_samples': 0,
+                })
+                totals['calls'] += 1
+                totals['wall_time'] += wall
+                totals['cpu_time'] += cpu
+                if peak is not None:
+                    totals['peak_bytes'] = max(totals['peak_bytes'] or 0, peak)
+                    self._peak_seen = max(self._peak_seen, measurement.base + peak)
+                totals['input_samples'] += _samples(audio_data)
+                totals['output_samples'] += _samples(result)
+            return result
+        return measured
+
+    def finish(self, input_samples=None, output_samples=None, **fields):
+        """Aşama ve çalıştırma olaylarını yay"""
+        wall, _, peak = self._run.stop()
+        if peak is not None:
+            peak = max(peak, self._peak_seen - self._run.base)
+        cpu = time.process_time() - self._process_cpu
+        self.instrumentation.stop_memory(self._memory)
+        base = dict(component=self.component, operation=self.operation, run_id=self.run_id,
+                    sample_rate=self.sample_rate, **self.fields)
+        with self._lock:
+            stages = list(self._stages.items())
+        for name, totals in stages:
+            self.instrumentation.emit(dict(base, event='stage', stage=name, **totals,
+                                           realtime_factor=_realtime_factor(
+                                               totals['input_samples'], self.sample_rate, totals['wall_time'])))
+        self.instrumentation.emit(dict(base, event='run', stage=None, wall_time=wall, cpu_time=cpu,
+                                       peak_bytes=peak, input_samples=input_samples,
+                                       output_samples=output_samples,
+                                       realtime_factor=_realtime_factor(input_samples or 0, self.sample_rate, wall),
+                                       **fields))
+
+
+class Instrumentation:
+    """Ölçüm olaylarını takılabilir hedeflere (sink) JSON uyumlu sözlük olarak gönder
+
+    Hedef yoksa kapalıdır: run() None döndürür, @instrumented yalnızca bir bayrak okur.
+    Hedef: olay sözlüğü alan herhangi bir çağrılabilir (MemorySink, JsonLinesSink, fonksiyon).
+    """
+
+    def __init__(self, memory='tracemalloc'):
+        self.set_memory_mode(memory)
+        self._sinks = []
+        self._lock = threading.Lock()
+        self._run_ids = itertools.count(1)
+        self._tracing_runs = 0
+        self.enabled = False
+
+    def add_sink(self, sink):
+        """Hedef ekle (ölçüm açılır); eklenen hedefi döndürür"""
+        with self._lock:
+            self._sinks.append(sink)
+            self.enabled = True
+        return sink
+
+    def remove_sink(self, sink):
+        """Hedefi çıkar; hedef kalmazsa ölçüm kapanır"""
+        with self._lock:
+            if sink in self._sinks:
+                self._sinks.remove(sink)
+            self.enabled = bool(self._sinks)
+
+    def set_memory_mode(self, memory):
+        """Bellek ölçüm yöntemini değiştir ('tracemalloc', 'rss', None)"""
+        if memory not in MEMORY_MODES:
+            raise ValueError(f"Geçersiz bellek ölçümü: {memory} ({MEMORY_MODES})")
+        self.memory = None if memory == 'rss' and resource is None else memory
+
+    def next_run_id(self):
+        return f"{os.getpid()}-{next(self._run_ids)}"
+
+    def run(self, component, operation, sample_rate=None, **fields):
+        """Çalıştırma kaydedicisi; ölçüm kapalıysa None"""
+        if not self.enabled:
+            return None
+        return RunRecorder(self, component, operation, sample_rate, **fields)
+
+    def emit(self, event):
+        """Olayı tüm hedeflere gönder (hedef hatası işlemeyi durdurmaz)"""
+        event['timestamp'] = time.time()
+        with self._lock:
+            sinks = list(self._sinks)
+        for sink in sinks:
+            try:
+                sink(event)
+            except Exception as e:
+                log.warning("⚠️ Ölçüm hedefi hatası: %s", e)
+
+    def start_memory(self):
+        """Çalıştırma için bellek ölçümünü başlat, kullanılacak yöntemi döndür"""
+        if self.memory != 'tracemalloc':
+            return self.memory
+        with self._lock:
+            if self._tracing_runs == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._tracing_runs = 1
+            elif self._tracing_runs:
+                self._tracing_runs += 1
+        return 'tracemalloc'
+
+    def stop_memory(self, memory):
+        """Son çalıştırma bitince (kendi başlattıysa) tracemalloc'u durdur"""
+        if memory != 'tracemalloc':
+            return
+        with self._lock:
+            if self._tracing_runs:
+                self._tracing_runs -= 1
+                if self._tracing_runs == 0:
+                    tracemalloc.stop()
+
+
+def instrumented(method):
+    """Tüm diziyi işleyen efekt metodunu ölç (ölçüm kapalıyken doğrudan çağırır)"""
+    @functools.wraps(method)
+    def wrapper(self, audio_data, *args, **kwargs):
+        if not instrumentation.enabled:
+            return method(self, audio_data, *args, **kwargs)
+        recorder = instrumentation.run(type(self).__name__, method.__name__, getattr(self, 'sample_rate', None))
+        if recorder is None:
+            return method(self, audio_data, *args, **kwargs)
+        result = recorder.wrap(method.__name__, lambda audio: method(self, audio, *args, **kwargs))(audio_data)
+        recorder.finish(input_samples=_samples(audio_data), output_samples=_samples(result))
+        return result
+    return wrapper
+
+
+# Süreç boyunca paylaşılan ölçüm noktası
+instrumentation = Instrumentation()
+
+# MYP_METRICS_LOG verilirse olaylar bu dosyaya JSON satırları olarak yazılır
+if os.environ.get('MYP_METRICS_LOG'):
+    instrumentation.add_sink(JsonLinesSink(os.environ['MYP_METRICS_LOG']))
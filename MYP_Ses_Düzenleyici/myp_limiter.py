@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MYP Ses Düzenleyici - İleri Bakışlı True-Peak Limiter
+Mehmet Yay tarafından geliştirildi
+"""
+
+import numpy as np
+from scipy import signal, ndimage
+
+DEFAULT_CEILING_DB = -1.0   # dBTP
+DEFAULT_RELEASE = 0.05      # 50ms
+DEFAULT_LOOKAHEAD = 0.005   # 5ms
+
+# ITU-R BS.1770-4 Ek 2 true-peak ölçer interpolasyonu: 4x aşırı örnekleme, 48 tap,
+# faz başına 12 tap. Faz p, (n - 6 + p/4) anındaki örneği tahmin eder. Limiter tepeyi
+# ölçerle aynı filtreyle bulur ve kazancı filtrenin kapsadığı tüm örneklerde tam uygular,
+# böylece çıktının BS.1770 true-peak değeri tavanı aşmaz.
+TRUE_PEAK_PHASES = np.array([
+    [0.0017089843750, 0.0109863281250, -0.0196533203125, 0.0332031250000,
+     -0.0594482421875, 0.1373291015625, 0.9721679687500, -0.1022949218750,
+     0.0476074218750, -0.0266113281250, 0.0148925781250, -0.0083007812500],
+    [-0.0291748046875, 0.0292968750000, -0.0517578125000, 0.0891113281250,
+     -0.1665039062500, 0.4650878906250, 0.7797851562500, -0.2003173828125,
+     0.1015625000000, -0.0582275390625, 0.0330810546875, -0.0189208984375],
+    [-0.0189208984375, 0.0330810546875, -0.0582275390625, 0.1015625000000,
+     -0.2003173828125, 0.7797851562500, 0.4650878906250, -0.1665039062500,
+     0.0891113281250, -0.0517578125000, 0.0292968750000, -0.0291748046875],
+    [-0.0083007812500, 0.0148925781250, -0.0266113281250, 0.0476074218750,
+     -0.1022949218750, 0.9721679687500, 0.1373291015625, -0.0594482421875,
+     0.0332031250000, -0.0196533203125, 0.0109863281250, 0.0017089843750],
+])
+
+# BS.1770 filtresi üst bantta ideal (bant sınırlı) yeniden yapılandırmadan biraz düşük okur;
+# daha düz yanıtlı ölçerlerde (ör. uzun filtreli 4x/8x yeniden örnekleme) de tavan aşılmasın
+# diye kazanç tavanın bu kadar altına göre hesaplanır (müzik benzeri sinyalde fark <= ~0.24 dB)
+TRUE_PEAK_MARGIN_DB = 0.25
+
+# limit() içinde işlenen parça boyu (release rampası kısa kalsın diye)
+LIMIT_CHUNK_SIZE = 2 ** 16
+
+
+class TruePeakLimiter:
+    """Aşırı örneklenmiş tepe algılamalı, ileri bakışlı brickwall limiter
+
+    process() her blok için aynı uzunlukta, latency örnek gecikmeli çıktı verir;
+    limit() tüm diziyi gecikmesiz (hizalı) olarak sınırlar.
+    """
+
+    def __init__(self, sample_rate, ceiling_db=DEFAULT_CEILING_DB, release=DEFAULT_RELEASE,
+                 lookahead=DEFAULT_LOOKAHEAD):
+        self.sample_rate = int(sample_rate)
+        self.ceiling_db = float(ceiling_db)
+        self.window = max(1, int(round(lookahead * self.sample_rate)))
+        # Release: doğrusal genlikte üstel dönüş = dB'de sabit yükselme eğimi
+        self.release_slope = 20 * np.log10(np.e) / (release * self.sample_rate)
+
+        self.phases = list(TRUE_PEAK_PHASES)
+        # n anındaki tepe tahmini girişin [n - support + 1, n] örneklerine bağlı: kazanç
+        # bu örneklerin hepsinde en az tepenin gerektirdiği kadar olmalı
+        support = TRUE_PEAK_PHASES.shape[1]
+        self.hold = self.window + support - 1
+        self.latency = self.window + support - 2
+        self.reset()
+
+    def reset(self):
+        """Akış durumunu sıfırla"""
+        self._delay = None
+        self._zi = None
+        self._gain_history = None
+        self._release_history = None
+        self._release_state = 0.0
+
+    def _init_state(self, block):
+        dtype = block.dtype
+        self._delay = np.zeros((self.latency,) + block.shape[1:], dtype=dtype)
+        self._zi = [np.zeros((len(phase) - 1,) + block.shape[1:], dtype=dtype) for phase in self.phases]
+        self._gain_history = np.zeros(self.hold - 1, dtype=dtype)
+        self._release_history = np.zeros(self.window - 1, dtype=dtype)
+
+    def _true_peak(self, block):
+        """Örnek başına aşırı örneklenmiş tepe (tüm kanallar bağlı)"""
+        peak = None
+        for p, phase in enumerate(self.phases):
+            estimate, self._zi[p] = signal.lfilter(
+                phase.astype(block.dtype, copy=False), [1.0], block, axis=0, zi=self._zi[p]
+            )
+            np.abs(estimate, out=estimate)
+            if estimate.ndim == 2:
+                estimate = estimate.max(axis=1)
+            peak = estimate if peak is None else np.maximum(peak, estimate, out=peak)
+        return peak
+
+    def process(self, block):
+        """Bloğu sınırla; latency örnek önceki girişe karşılık gelen çıktıyı döndür"""
+        if self._delay is None:
+            self._init_state(block)
+        dtype = block.dtype
+        count = len(block)
+        if count == 0:
+            return block.copy()
+
+        # Gerekli kazanç (dB): tavanı aşan tepeler için negatif
+        gain = self._true_peak(block)
+        np.maximum(gain, 1e-9, out=gain)
+        np.log10(gain, out=gain)
+        gain *= -20
+        gain += self.ceiling_db - TRUE_PEAK_MARGIN_DB
+        np.minimum(gain, 0, out=gain)
+
+        # İleri bakış: son 'hold' örneğin en düşük kazancı (O(n) kayan minimum)
+        extended = np.concatenate((self._gain_history, gain))
+        self._gain_history = extended[count:]
+        held = ndimage.minimum_filter1d(extended, self.hold)
+        held = held[self.hold // 2:self.hold // 2 + count]
+
+        # Release: env[n] = min_k(held[k] + slope*(n-k)) -> birikimli minimum ile vektörel
+        ramp = np.arange(1, count + 1, dtype=dtype)
+        ramp *= dtype.type(self.release_slope)
+        released = np.subtract(held, ramp, out=held)
+        np.minimum.accumulate(released, out=released)
+        released += ramp
+        ramp += dtype.type(self._release_state)
+        np.minimum(released, ramp, out=released)
+        self._release_state = float(released[-1])
+
+        # Attack: pencere boyunca kutu ortalama; kazanç tepeye ulaşana kadar yumuşakça iner
+        extended = np.concatenate((self._release_history, released))
+        self._release_history = extended[count:]
+        total = np.concatenate(([0.0], np.cumsum(extended, dtype=np.float64)))
+        smoothed = ((total[self.window:] - total[:-self.window]) / self.window).astype(dtype)
+
+        # dB -> doğrusal kazanç, gecikmeli sinyale uygula
+        smoothed *= dtype.type(np.log(10) / 20)
+        np.exp(smoothed, out=smoothed)
+        delayed = np.concatenate((self._delay, block))
+        self._delay = delayed[count:]
+        output = delayed[:count]
+        output *= smoothed[:, np.newaxis] if output.ndim == 2 else smoothed
+        return output
+
+    def flush(self):
+        """Gecikme hattında kalan son latency örneği döndür"""
+        if self._delay is None:
+            return np.zeros(0, dtype=np.float32)
+        return self.process(np.zeros_like(self._delay))
+
+    def limit(self, audio_data, out=None):
+        """Tüm diziyi sınırla, girişle hizalı aynı boyda çıktı döndür (out girişin kendisi olabilir)"""
+        self.reset()
+        out = np.empty_like(audio_data) if out is None else out
+        position = -self.latency
+        for start in range(0, len(audio_data), LIMIT_CHUNK_SIZE):
+            position = self._place(out, self.process(audio_data[start:start + LIMIT_CHUNK_SIZE]), position)
+        self._place(out, self.flush(), position)
+        self.reset()
+        return out
+
+    @staticmethod
+    def _place(out, block, position):
+        """Gecikmeli çıktı bloğunu hizalı konumuna yaz, yeni konumu döndür"""
+        skip = max(0, -position)
+        end = min(len(out), position + len(block))
+        if end > position + skip:
+            out[position + skip:end] = block[skip:end - position]
+        return position + len(block)
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MYP Ses Düzenleyici - Seviyeli, Hız Sınırlı Olay Günlüğü
+Mehmet Yay tarafından geliştirildi
+"""
+
+import atexit
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+
+DEBUG = logging.DEBUG
+INFO = logging.INFO
+WARNING = logging.WARNING
+ERROR = logging.ERROR
+
+ROOT_LOGGER = 'myp'
+# Varsayılan seviye MYP_LOG_LEVEL ile değiştirilebilir (DEBUG / INFO / WARNING / ERROR)
+DEFAULT_LEVEL = os.environ.get('MYP_LOG_LEVEL', 'INFO').upper()
+
+# Aynı mesaj şablonu bu aralıkta (sn) en fazla RATE_LIMIT_BURST kez yazılır, fazlası sayılır
+RATE_LIMIT_INTERVAL = 1.0
+RATE_LIMIT_BURST = 20
+
+# Yazıcı iş parçacığı tek seferde en fazla bu kadar satırı birleştirip yazar
+WRITE_BATCH = 256
+
+_setup_lock = threading.Lock()
+_handler = None
+
+
+class RateLimitFilter(logging.Filter):
+    """Aynı şablondan (logger + mesaj) aralık başına en fazla burst kayıt geçir
+
+    Bastırılan kayıtların sayısı, şablonun bir sonraki geçen kaydına eklenir;
+    ERROR ve üstü hiç bastırılmaz.
+    """
+
+    def __init__(self, interval=RATE_LIMIT_INTERVAL, burst=RATE_LIMIT_BURST):
+        super().__init__()
+        self.interval = interval
+        self.burst = burst
+        self._windows = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if record.levelno >= ERROR:
+            return True
+        key = (record.name, record.msg)
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self.interval:
+                suppressed = window[2] if window is not None else 0
+                self._windows[key] = [now, 1, 0]
+                record.suppressed = suppressed
+                return True
+            if window[1] < self.burst:
+                window[1] += 1
+                record.suppressed = 0
+                return True
+            window[2] += 1
+            return False
+
+
+class _Formatter(logging.Formatter):
+    """Yalnızca mesaj (emoji başlıkları olduğu gibi) + bastırılan kayıt sayısı"""
+
+    def format(self, record):
+        text = record.getMessage()
+        suppressed = getattr(record, 'suppressed', 0)
+        if suppressed:
+            text += f" (+{suppressed} benzer mesaj bastırıldı)"
+        if record.exc_info:
+            text += '\n' + self.formatException(record.exc_info)
+        return text
+
+
+class AsyncStreamHandler(logging.Handler):
+    """Kayıtları kuyruğa al; ayrı iş parçacığı biçimlendirip toplu halde yazar
+
+    Çağıran iş parçacığı stdout kilidini beklemez. Yazılan akış her seferinde
+    sys.stdout'tan alınır (GUI / test yönlendirmeleri çalışır). fork sonrası
+    çocuk süreçte yazıcı yeniden başlatılır.
+    """
+
+    def __init__(self, stream=None):
+        super().__init__()
+        self._stream = stream
+        self._pid = None
+        self._queue = None
+        self._start_lock = threading.Lock()
+        self.setFormatter(_Formatter())
+
+    def _ensure_writer(self):
+        if self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            self._queue = queue.Queue()
+            thread = threading.Thread(target=self._write_loop, args=(self._queue,),
+                                      name='myp-log-writer', daemon=True)
+            thread.start()
+            self._pid = os.getpid()
+
+    def emit(self, record):
+        self._ensure_writer()
+        self._queue.put(record)
+
+    def _write_loop(self, records):
+        while True:
+            batch = [records.get()]
+            while len(batch) < WRITE_BATCH:
+                try:
+                    batch.append(records.get_nowait())
+                except queue.Empty:
+                    break
+            lines = []
+            for record in batch:
+                try:
+                    lines.append(self.format(record))
+                except Exception:
+                    self.handleError(record)
+            try:
+                stream = self._stream or sys.stdout
+                if lines and stream is not None:
+                    stream.write('\n'.join(lines) + '\n')
+                    stream.flush()
+            except Exception:
+                pass
+            finally:
+                for _ in batch:
+                    records.task_done()
+
+    def flush(self):
+        """Kuyruktaki tüm kayıtlar yazılana kadar bekle"""
+        if self._pid == os.getpid() and self._queue is not None:
+            self._queue.join()
+
+
+def _setup():
+    """'myp' kök günlüğünü bir kez kur"""
+    global _handler
+    with _setup_lock:
+        if _handler is not None:
+            return
+        root = logging.getLogger(ROOT_LOGGER)
+        root.setLevel(logging.getLevelName(DEFAULT_LEVEL) if DEFAULT_LEVEL in
+                      ('DEBUG', 'INFO', 'WARNING', 'ERROR') else INFO)
+        root.propagate = False
+        _handler = AsyncStreamHandler()
+        _handler.addFilter(RateLimitFilter())
+        root.addHandler(_handler)
+        atexit.register(flush)
+
+
+def get_logger(name):
+    """Modül günlüğü ('myp.<name>'); mesajlar %-biçim argümanlarıyla verilir (kapalı seviyede biçimlenmez)"""
+    _setup()
+    return logging.getLogger(f'{ROOT_LOGGER}.{name}')
+
+
+def set_level(level, name=None):
+    """Seviyeyi ayarla (name verilmezse tüm MYP günlükleri)"""
+    _setup()
+    logging.getLogger(ROOT_LOGGER if name is None else f'{ROOT_LOGGER}.{name}').setLevel(level)
+
+
+def set_quiet(quiet=True, name=None):
+    """Sessiz mod: yalnızca uyarı ve hatalar; yalnızca tanı amaçlı istatistikler hesaplanmaz"""
+    set_level(WARNING if quiet else INFO, name)
+
+
+def is_quiet(name=None):
+    _setup()
+    return not logging.getLogger(ROOT_LOGGER if name is None else f'{ROOT_LOGGER}.{name}').isEnabledFor(INFO)
+
+
+def flush():
+    """Bekleyen günlük satırlarını yaz"""
+    if _handler is not None:
+        _handler.flush()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MYP Ses Düzenleyici - Gürültü Profilleri
+Mehmet Yay tarafından geliştirildi
+"""
+
+import os
+import re
+import hashlib
+import threading
+import numpy as np
+from myp_spectral import N_FFT, stationary_threshold
+
+# Profillerin saklandığı klasör (MYP_NOISE_PROFILE_DIR ile değiştirilebilir)
+PROFILE_DIRECTORY = os.environ.get(
+    'MYP_NOISE_PROFILE_DIR', os.path.join(os.path.expanduser('~'), '.myp', 'noise_profiles')
+)
+PROFILE_EXTENSION = '.npz'
+PROFILE_VERSION = 1
+
+
+class NoiseProfile:
+    """Durağan gürültü eşiği (kanal, frekans dB) ve öğrenildiği sample rate"""
+
+    def __init__(self, threshold, sample_rate, source=''):
+        self.threshold = np.asarray(threshold, dtype=np.float32).reshape(-1, N_FFT // 2 + 1)
+        self.sample_rate = int(sample_rate)
+        self.source = source
+        # İçerik özeti: önbellek anahtarlarında profil kimliği (id yeniden kullanılabilir)
+        digest = hashlib.sha1(self.threshold.tobytes())
+        digest.update(str(self.sample_rate).encode())
+        self.fingerprint = digest.hexdigest()
+
+    @property
+    def channels(self):
+        return self.threshold.shape[0]
+
+    def threshold_for(self, sample_rate, channels):
+        """Verilen sample rate ve kanal sayısı için (kanal, frekans) eşik
+
+        Farklı rate'te frekans eksenine göre ara değerlenir; mono profil tüm kanallara
+        yayılır, kanal sayısı uyuşmazsa kanalların ortalaması kullanılır
+        """
+        threshold = self.threshold
+        if int(sample_rate) != self.sample_rate:
+            bins = np.arange(threshold.shape[1])
+            source_freqs = bins * self.sample_rate / N_FFT
+            target_freqs = bins * int(sample_rate) / N_FFT
+            threshold = np.stack([np.interp(target_freqs, source_freqs, row) for row in threshold])
+        if threshold.shape[0] != channels:
+            threshold = np.repeat(threshold.mean(axis=0, keepdims=True), channels, axis=0)
+        return threshold
+
+    def save(self, path):
+        """Sıkıştırılmış .npz olarak kaydet (birkaç KB)"""
+        np.savez_compressed(path, threshold=self.threshold, sample_rate=self.sample_rate,
+                            n_fft=N_FFT, version=PROFILE_VERSION, source=self.source)
+
+    @classmethod
+    def load(cls, path):
+        """Kaydedilmiş profili yükle"""
+        with np.load(path) as data:
+            if int(data['n_fft']) != N_FFT:
+                raise ValueError(f"Profil n_fft={int(data['n_fft'])} ile öğrenilmiş, beklenen {N_FFT}")
+            return cls(data['threshold'], int(data['sample_rate']), str(data['source']))
+
+
+def learn_noise_profile(audio_data, sample_rate, seconds=None, source=''):
+    """Referans klipten (ya da ilk 'seconds' saniyeden) gürültü profili çıkar"""
+    if seconds is not None:
+        audio_data = audio_data[:int(seconds * sample_rate)]
+    if len(audio_data) < N_FFT:
+        raise ValueError(f"Gürültü klibi çok kısa: {len(audio_data)} örnek (en az {N_FFT})")
+    return NoiseProfile(stationary_threshold(audio_data, limit=None), sample_rate, source)
+
+
+class NoiseProfileStore:
+    """Ada göre diskte saklanan gürültü profilleri (yüklenenler süreç içinde önbelleklenir)"""
+
+    def __init__(self, directory=PROFILE_DIRECTORY):
+        self.directory = directory
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def path(self, name):
+        """Profil dosyasının yolu (ad yalnızca harf, rakam, '.', '_' ve '-' içerebilir)"""
+        if not re.fullmatch(r'[\w.-]+', name):
+            raise ValueError(f"Geçersiz profil adı: {name}")
+        return os.path.join(self.directory, name + PROFILE_EXTENSION)
+
+    def save(self, name, profile):
+        """Profili ada kaydet (varsa üzerine yazar)"""
+        path = self.path(name)
+        os.makedirs(self.directory, exist_ok=True)
+        profile.save(path)
+        with self._lock:
+            self._cache[name] = (os.path.getmtime(path), profile)
+        return path
+
+    def load(self, name):
+        """Ada kayıtlı profili yükle; dosya değişmediyse önbellekten döner"""
+        path = self.path(name)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Gürültü profili bulunamadı: {name} ({path})")
+        mtime = os.path.getmtime(path)
+        with self._lock:
+            cached = self._cache.get(name)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+        profile = NoiseProfile.load(path)
+        with self._lock:
+            self._cache[name] = (mtime, profile)
+        return profile
+
+    def names(self):
+        """Kayıtlı profil adları"""
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(os.path.splitext(entry)[0] for entry in os.listdir(self.directory)
+                      if entry.endswith(PROFILE_EXTENSION))
+
+    def delete(self, name):
+        """Profili sil"""
+        path = self.path(name)
+        with self._lock:
+            self._cache.pop(name, None)
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+# Süreç boyunca paylaşılan profil deposu
+noise_profiles = NoiseProfileStore()
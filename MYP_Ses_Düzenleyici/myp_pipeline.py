@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MYP Ses Düzenleyici - Aşama Boru Hattı (Pipeline)
+Mehmet Yay tarafından geliştirildi
+"""
+
+import queue
+import threading
+import time
+from myp_logging import get_logger, INFO
+
+log = get_logger('pipeline')
+
+# Aşamalar arası kuyrukta bekleyebilecek en fazla blok (dolunca üretici bekler)
+DEFAULT_QUEUE_DEPTH = 2
+# Kuyruk beklemelerinde durdurma isteğinin kontrol aralığı (sn)
+POLL_INTERVAL = 0.05
+
+_END = object()
+
+
+class _Stopped(Exception):
+    """Boru hattı durduruldu (hata ya da tüketici erken bıraktı)"""
+
+
+class StageStats:
+    """Bir aşamanın sayaçları: iş süresi, girdi bekleme ve çıktı (geri basınç) bekleme"""
+
+    def __init__(self, name):
+        self.name = name
+        self.items = 0
+        self.busy = 0.0
+        self.starved = 0.0
+        self.blocked = 0.0
+
+    def as_dict(self, wall_time):
+        wall_time = max(wall_time, 1e-9)
+        return {
+            'name': self.name,
+            'items': self.items,
+            'busy': self.busy,
+            'starved': self.starved,
+            'blocked': self.blocked,
+            'utilization': self.busy / wall_time,
+        }
+
+
+class StagePipeline:
+    """Aşamaları ayrı iş parçacıklarında, sınırlı kuyruklarla birbirine bağlayarak çalıştır
+
+    stages: [(ad, dönüşüm)]; dönüşüm bir blok yineleyicisi alıp blok yineleyicisi döndürür
+    (durum taşıyan üreteçler olabilir). Kaynak da ayrı bir iş parçacığında okunur; çıktıyı
+    tüketen çağıran iş parçacığı 'çıkış' aşaması olarak ölçülür. Blok k+1 bir aşamadayken
+    blok k sonraki aşamada işlenir; kuyruklar dolunca üst aşamalar bekler (geri basınç).
+    NumPy/SciPy çekirdekleri GIL'i bıraktığından aşamalar gerçekten örtüşür.
+    """
+
+    def __init__(self, stages, depth=DEFAULT_QUEUE_DEPTH, source_name='okuma', sink_name='çıkış'):
+        self.stages = list(stages)
+        self.depth = depth
+        self.source_name = source_name
+        self.sink_name = sink_name
+        self.wall_time = 0.0
+        self._stats = []
+        self._stop = threading.Event()
+        self._error = None
+
+    def run(self, source):
+        """Kaynağı aşamalardan geçir, çıktı bloklarını sırayla üret"""
+        self._stop.clear()
+        self._error = None
+        names = [self.source_name] + [name for name, _ in self.stages]
+        self._stats = [StageStats(name) for name in names + [self.sink_name]]
+        queues = [queue.Queue(maxsize=self.depth) for _ in names]
+
+        threads = [threading.Thread(target=self._run_stage, name='myp-pipeline-okuma', daemon=True,
+                                    args=(self._stats[0], lambda: iter(source), queues[0]))]
+        for index, (name, transform) in enumerate(self.stages, start=1):
+            factory = (lambda transform=transform, inbox=queues[index - 1], stats=self._stats[index]:
+                       iter(transform(self._drain(inbox, stats))))
+            threads.append(threading.Thread(target=self._run_stage, name=f'myp-pipeline-{name}', daemon=True,
+                                            args=(self._stats[index], factory, queues[index])))
+
+        sink = self._stats[-1]
+        start_time = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        try:
+            outbox = queues[-1]
+            while True:
+                try:
+                    item = self._get(outbox, sink)
+                except _Stopped:
+                    break
+                if item is _END:
+                    break
+                sink.items += 1
+                resumed = time.perf_counter()
+                yield item
+                sink.busy += time.perf_counter() - resumed
+        finally:
+            self._stop.set()
+            for thread in threads:
+                thread.join()
+            self.wall_time = time.perf_counter() - start_time
+        if self._error is not None:
+            raise self._error
+
+    def _run_stage(self, stats, factory, outbox):
+        """Aşama iş parçacığı: üretilen blokları sonraki kuyruğa koy"""
+        try:
+            items = factory()
+            while True:
+                waited = stats.starved
+                started = time.perf_counter()
+                item = next(items, _END)
+                stats.busy += time.perf_counter() - started - (stats.starved - waited)
+                if item is _END:
+                    break
+                stats.items += 1
+                self._put(outbox, item, stats)
+            self._put(outbox, _END, stats)
+        except _Stopped:
+            pass
+        except Exception as e:
+            if self._error is None:
+                self._error = e
+            self._stop.set()
+
+    def _drain(self, inbox, stats):
+        """Giriş kuyruğunu yineleyici olarak sun (bekleme süresi girdi beklemesine yazılır)"""
+        while True:
+            item = self._get(inbox, stats)
+            if item is _END:
+                return
+            yield item
+
+    def _get(self, inbox, stats):
+        started = time.perf_counter()
+        while True:
+            try:
+                item = inbox.get(timeout=POLL_INTERVAL)
+                break
+            except queue.Empty:
+                if self._stop.is_set():
+                    raise _Stopped()
+        if stats is not None:
+            stats.starved += time.perf_counter() - started
+        return item
+
+    def _put(self, outbox, item, stats):
+        started = time.perf_counter()
+        while True:
+            try:
+                outbox.put(item, timeout=POLL_INTERVAL)
+                break
+            except queue.Full:
+                if self._stop.is_set():
+                    raise _Stopped()
+        stats.blocked += time.perf_counter() - started
+
+    def stats(self):
+        """Aşama başına sayaçlar ve kullanım oranı (iş süresi / toplam süre)"""
+        return [stats.as_dict(self.wall_time) for stats in self._stats]
+
+    def bottleneck(self):
+        """En yüksek kullanımlı aşamanın adı"""
+        stats = self.stats()
+        return max(stats, key=lambda entry: entry['utilization'])['name'] if stats else None
+
+    def report(self):
+        """Aşama kullanımını tek kayıt olarak günlüğe yaz"""
+        if not log.isEnabledFor(INFO):
+            return
+        lines = [f"📊 Boru hattı ({self.wall_time:.2f} sn, kuyruk derinliği {self.depth}):"]
+        for entry in self.stats():
+            lines.append(f"   {entry['name']:<18} %{entry['utilization'] * 100:5.1f} meşgul, "
+                         f"girdi bekleme {entry['starved']:.2f} sn, çıktı bekleme {entry['blocked']:.2f} sn "
+                         f"({entry['items']} blok)")
+        lines.append(f"   🐢 Darboğaz: {self.bottleneck()}")
+        log.info('\n'.join(lines))
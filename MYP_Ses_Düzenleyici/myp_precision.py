@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MYP Ses Düzenleyici - Hassasiyet Politikası
+Mehmet Yay tarafından geliştirildi
+"""
+
+import os
+import numpy as np
+
+# Desteklenen işleme hassasiyetleri
+PRECISION_DTYPES = {
+    'float32': np.float32,
+    'float64': np.float64,
+}
+DEFAULT_PRECISION = 'float32'
+
+
+class DtypeError(TypeError):
+    """Aşama çıktısı politika dışı dtype üretti (yalnızca debug modunda)"""
+
+
+class PrecisionPolicy:
+    """Zincir boyunca kullanılacak tek dtype (varsayılan float32, isteğe bağlı float64)"""
+
+    def __init__(self, precision=DEFAULT_PRECISION, debug=None):
+        if precision not in PRECISION_DTYPES:
+            raise ValueError(f"Geçersiz hassasiyet: {precision} ({', '.join(PRECISION_DTYPES)})")
+        self.precision = precision
+        self.dtype = np.dtype(PRECISION_DTYPES[precision])
+        # Debug modu açıkça verilmezse MYP_DTYPE_DEBUG ortam değişkeninden okunur
+        if debug is None:
+            debug = os.environ.get('MYP_DTYPE_DEBUG', '') not in ('', '0')
+        self.debug = debug
+
+    def cast(self, audio_data):
+        """Veriyi politika dtype'ına çevir (zaten uygunsa kopyalamadan)"""
+        return np.asarray(audio_data).astype(self.dtype, copy=False)
+
+    def check(self, audio_data, stage):
+        """Debug modunda aşama çıktısının dtype'ını doğrula, veriyi aynen döndür"""
+        if self.debug and audio_data.dtype != self.dtype:
+            raise DtypeError(f"{stage}: {audio_data.dtype} üretti, beklenen {self.dtype}")
+        return audio_data
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MYP Ses Düzenleyici - Son İstek Kazanır İşleme Zamanlayıcısı ve Arka Plan İşleme Servisi
+Mehmet Yay tarafından geliştirildi
+"""
+
+import queue
+import threading
+import time
+from myp_logging import get_logger
+
+log = get_logger('render_scheduler')
+
+# Tk döngüsünün sonuç kuyruğunu yoklama aralığı (ms): ~60 fps
+POLL_INTERVAL_MS = 16
+
+
+class RenderCancelled(Exception):
+    """İşleme daha yeni bir istek geldiği için iptal edildi"""
+
+
+class CancellationToken:
+    """İşlemenin iptal bayrağı; aşama ve blok sınırlarında check() ile yoklanır"""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def check(self):
+        """İptal edildiyse RenderCancelled yükselt"""
+        if self._event.is_set():
+            raise RenderCancelled()
+
+
+class RenderScheduler:
+    """Ayar değişikliklerini tek iş parçacığında, yalnızca en yenisini işleyerek uygula
+
+    Bekleyen istekler en yeni ayarla birleştirilir (aradakiler atlanır); yeni istek
+    gelince süren işleme iptal edilir. render(settings, token) sonucu on_result'a verilir.
+    """
+
+    def __init__(self, render, on_result=None, on_error=None, name='myp-render'):
+        self.render = render
+        self.on_result = on_result
+        self.on_error = on_error
+        self.name = name
+        self._condition = threading.Condition()
+        self._pending = None
+        self._has_pending = False
+        self._token = None
+        self._closed = False
+        self._counters = {
+            'submitted': 0,     # gelen istek
+            'rendered': 0,      # tamamlanan işleme
+            'dropped': 0,       # işlenmeden yerini yenisine bırakan istek
+            'cancelled': 0,     # yarıda kesilen işleme
+            'failed': 0,        # hata ile biten işleme
+        }
+        self.last_render_time = None
+        self._thread = threading.Thread(target=self._worker, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, settings):
+        """İsteği sıraya koy: bekleyen eski istek atılır, süren işleme iptal edilir"""
+        with self._condition:
+            if self._closed:
+                return
+            self._counters['submitted'] += 1
+            if self._has_pending:
+                self._counters['dropped'] += 1
+            self._pending = settings
+            self._has_pending = True
+            if self._token is not None:
+                self._token.cancel()
+            self._condition.notify()
+
+    def cancel(self):
+        """Bekleyen isteği at ve süren işlemeyi iptal et"""
+        with self._condition:
+            if self._has_pending:
+                self._counters['dropped'] += 1
+            self._pending = None
+            self._has_pending = False
+            if self._token is not None:
+                self._token.cancel()
+
+    def _worker(self):
+        while True:
+            with self._condition:
+                while not self._has_pending and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                settings = self._pending
+                self._pending = None
+                self._has_pending = False
+                token = self._token = CancellationToken()
+
+            started = time.perf_counter()
+            try:
+                result = self.render(settings, token)
+                token.check()
+            except RenderCancelled:
+                with self._condition:
+                    self._counters['cancelled'] += 1
+                continue
+            except Exception as e:
+                with self._condition:
+                    self._counters['failed'] += 1
+                log.error("❌ İşleme hatası: %s", e)
+                if self.on_error is not None:
+                    try:
+                        self.on_error(e)
+                    except Exception as callback_error:
+                        log.error("❌ Hata bildirimi başarısız: %s", callback_error)
+                continue
+            finally:
+                with self._condition:
+                    if self._token is token:
+                        self._token = None
+
+            with self._condition:
+                self._counters['rendered'] += 1
+                self.last_render_time = time.perf_counter() - started
+            if self.on_result is not None:
+                try:
+                    self.on_result(result)
+                except Exception as e:
+                    log.error("❌ Sonuç işleme hatası: %s", e)
+
+    def stats(self):
+        """Sayaçlar, bekleyen istek sayısı (0/1) ve süren işleme durumu"""
+        with self._condition:
+            return dict(self._counters, queue_depth=int(self._has_pending),
+                        in_flight=self._token is not None, last_render_time=self.last_render_time)
+
+    def close(self, timeout=None):
+        """İş parçacığını durdur (süren işleme iptal edilir)"""
+        with self._condition:
+            self._closed = True
+            self._pending = None
+            self._has_pending = False
+            if self._token is not None:
+                self._token.cancel()
+            self._condition.notify()
+        self._thread.join(timeout)
+
+
+class RenderService:
+    """Arka planda işle, sonuçları Tk iş parçacığında teslim et
+
+    İşleme RenderScheduler iş parçacığında çalışır (son istek kazanır); sonuç, hata ve
+    aşama ilerlemesi iş parçacığı güvenli kuyruğa konur, Tk döngüsü kuyruğu root.after
+    ile yoklar. on_result / on_progress / on_error yalnızca Tk iş parçacığında çağrılır.
+    render(settings, cancel, progress): progress(aşama adı, tamamlanan, toplam)
+    """
+
+    def __init__(self, root, render, on_result, on_progress=None, on_error=None,
+                 poll_interval=POLL_INTERVAL_MS):
+        self.root = root
+        self.render = render
+        self.on_result = on_result
+        self.on_progress = on_progress
+        self.on_error = on_error
+        self.poll_interval = poll_interval
+        self._events = queue.Queue()
+        self._closed = False
+        self.scheduler = RenderScheduler(self._run, on_result=lambda result: self._events.put(('result', result)),
+                                         on_error=lambda error: self._events.put(('error', error)))
+        self._poll_id = root.after(poll_interval, self._poll)
+
+    def _run(self, settings, cancel):
+        def progress(name, done, total):
+            self._events.put(('progress', (name, done, total)))
+        return self.render(settings, cancel, progress)
+
+    def submit(self, settings):
+        """Yeni ayarla işleme iste (bekleyen istek atılır, süren işleme iptal edilir)"""
+        self.scheduler.submit(settings)
+
+    def cancel(self):
+        self.scheduler.cancel()
+
+    def stats(self):
+        return self.scheduler.stats()
+
+    def _poll(self):
+        """Kuyruktaki olayları Tk iş parçacığında dağıt (ilerlemeden yalnızca en yenisi)"""
+        progress = None
+        while True:
+            try:
+                kind, payload = self._events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'progress':
+                progress = payload
+                continue
+            progress = None
+            self._deliver(self.on_result if kind == 'result' else self.on_error, payload)
+        if progress is not None:
+            self._deliver(self.on_progress, *progress)
+        if not self._closed:
+            self._poll_id = self.root.after(self.poll_interval, self._poll)
+
+    def _deliver(self, callback, *args):
+        if callback is None:
+            return
+        try:
+            callback(*args)
+        except Exception as e:
+            log.error("❌ Arayüz güncelleme hatası: %s", e)
+
+    def close(self, timeout=None):
+        """Yoklamayı ve işleme iş parçacığını durdur"""
+        self._closed = True
+        try:
+            self.root.after_cancel(self._poll_id)
+        except Exception:
+            pass
+        self.scheduler.close(timeout)
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MYP Ses Düzenleyici - Polifaz Yeniden Örnekleme
+Mehmet Yay tarafından geliştirildi
+"""
+
+from math import gcd
+import numpy as np
+from scipy import signal
+from myp_filter_bank import filter_bank
+
+# Kalite seviyesi: (yarım filtre uzunluğu çarpanı, Kaiser beta)
+# 'medium', scipy.signal.resample_poly varsayılanı ile aynı çekirdeği üretir
+QUALITY_LEVELS = {
+    'fast': (4, 5.0),
+    'medium': (10, 5.0),
+    'high': (24, 9.0),
+}
+DEFAULT_QUALITY = 'medium'
+
+
+def resample_ratio(source_rate, target_rate):
+    """Sadeleştirilmiş (yukarı, aşağı) örnekleme çarpanları"""
+    source_rate = int(source_rate)
+    target_rate = int(target_rate)
+    if source_rate <= 0 or target_rate <= 0:
+        raise ValueError(f"Geçersiz sample rate: {source_rate} -> {target_rate}")
+    divisor = gcd(source_rate, target_rate)
+    return target_rate // divisor, source_rate // divisor
+
+
+def get_kernel(source_rate, target_rate, quality=DEFAULT_QUALITY):
+    """(kaynak, hedef, kalite) için alçak geçiren FIR çekirdeğini bir kez tasarla"""
+    if quality not in QUALITY_LEVELS:
+        raise ValueError(f"Geçersiz kalite: {quality} ({', '.join(QUALITY_LEVELS)})")
+    up, down = resample_ratio(source_rate, target_rate)
+
+    def design():
+        length_factor, beta = QUALITY_LEVELS[quality]
+        max_rate = max(up, down)
+        half_len = length_factor * max_rate
+        return signal.firwin(2 * half_len + 1, 1.0 / max_rate, window=('kaiser', beta))
+
+    key = ('resample', int(source_rate), int(target_rate), quality)
+    return filter_bank.get_compiled(key, design)
+
+
+def resample(audio_data, source_rate, target_rate, quality=DEFAULT_QUALITY):
+    """Tüm diziyi zaman ekseninde (axis=0) yeniden örnekle, dtype korunur"""
+    if int(source_rate) == int(target_rate):
+        return audio_data
+    up, down = resample_ratio(source_rate, target_rate)
+    kernel = get_kernel(source_rate, target_rate, quality).astype(audio_data.dtype)
+    resampled = signal.resample_poly(audio_data, up, down, axis=0, window=kernel)
+    return resampled.astype(audio_data.dtype, copy=False)
+
+
+class StreamingResampler:
+    """Bloklar arası geçmişi taşıyan polifaz yeniden örnekleyici
+
+    Tüm bloklar ve flush() çıktısı art arda eklendiğinde resample() ile
+    aynı sonucu verir.
+    """
+
+    def __init__(self, source_rate, target_rate, quality=DEFAULT_QUALITY):
+        self.source_rate = int(source_rate)
+        self.target_rate = int(target_rate)
+        self.up, self.down = resample_ratio(source_rate, target_rate)
+
+        # resample_poly ile aynı hizalama: çekirdek başına sıfır eklenerek
+        # çıktı örnekleri filtrenin merkezine, 'down' ızgarasına oturtulur
+        kernel = get_kernel(source_rate, target_rate, quality) * self.up
+        half_len = (len(kernel) - 1) // 2
+        pre_pad = self.down - half_len % self.down
+        self.kernel = np.concatenate((np.zeros(pre_pad), kernel))
+        self.pre_remove = (half_len + pre_pad) // self.down
+
+        # Bir çıktı için geriye doğru gereken giriş sayısı
+        self.history = -(-len(self.kernel) // self.up)
+
+        self._buffer = None
+        self._buffer_start = 0
+        self._consumed = 0
+        self._produced = 0
+
+    def process(self, block):
+        """Yeni giriş bloğu için hazır olan çıktı örneklerini döndür"""
+        squeeze = block.ndim == 1
+        block = block.reshape(len(block), -1)
+        if self._buffer is None:
+            # Sinyal öncesi sıfır kabul edilir; tampon başı 'down' katında tutulur
+            lead = -(-self.history // self.down) * self.down
+            self._buffer = np.zeros((lead, block.shape[1]), dtype=block.dtype)
+            self._buffer_start = -lead
+
+        self._buffer = np.concatenate((self._buffer, block))
+        self._consumed += len(block)
+
+        # Gereken tüm girişleri gelmiş olan çıktılar
+        available = (self._consumed * self.up - 1) // self.down - self.pre_remove + 1
+        output = self._render(available)
+        return output[:, 0] if squeeze else output
+
+    def flush(self):
+        """Sinyal sonrası sıfır kabul ederek kalan çıktıları döndür"""
+        if self._buffer is None:
+            return np.zeros((0, 1), dtype=np.float32)
+        total = -(-self._consumed * self.up // self.down)
+        padding = np.zeros((self.history + self.down, self._buffer.shape[1]), dtype=self._buffer.dtype)
+        self._buffer = np.concatenate((self._buffer, padding))
+        return self._render(total)
+
+    def _render(self, last):
+        """Tampondan [üretilen, last) aralığındaki çıktıları hesapla, tamponu kırp"""
+        first = self._produced
+        if last <= first:
+            return np.zeros((0, self._buffer.shape[1]), dtype=self._buffer.dtype)
+
+        kernel = self.kernel.astype(self._buffer.dtype, copy=False)
+        filtered = signal.upfirdn(kernel, self._buffer, self.up, self.down, axis=0)
+        # filtered[i], global çıktı ızgarasında (start * up / down + i) konumundadır
+        offset = self._buffer_start * self.up // self.down - self.pre_remove
+        output = filtered[first - offset:last - offset].astype(self._buffer.dtype, copy=False)
+        self._produced = last
+
+        # Bir sonraki çıktı için gereken en eski girişten ('down' katına yuvarlanmış) sonrasını sakla
+        needed = ((last + self.pre_remove) * self.down - len(self.kernel) + 1) // self.up
+        keep_from = (needed // self.down) * self.down
+        if keep_from > self._buffer_start:
+            self._buffer = self._buffer[keep_from - self._buffer_start:]
+            self._buffer_start = keep_from
+        return output
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MYP Ses Düzenleyici - Parçalı Paralel İşleme
+Mehmet Yay tarafından geliştirildi
+"""
+
+import argparse
+import time
+import numpy as np
+from myp_spectral import CHUNK_SIZE, PADDING, stationary_threshold
+from myp_thread_pool import parallel_map
+from myp_logging import get_logger, flush
+
+log = get_logger('segment_render')
+
+DEFAULT_SEGMENT_SECONDS = 60.0
+# IIR filtreler, kompresör zarfları ve gürültü tabanı (2 sn zaman sabiti) bu sürede oturur
+DEFAULT_WARMUP_SECONDS = 4.0
+DEFAULT_CROSSFADE_SECONDS = 0.05
+
+
+class SegmentRenderer:
+    """Uzun sinyali parçalara bölüp paylaşılan havuzda işle, çapraz geçişle birleştir
+
+    Her parça iki yanından warmup kadar bağlamla işlenir (filtre ve zarf durumları
+    oturur), bağlam atılır; komşu parçalar crossfade boyunca doğrusal geçişle birleşir.
+    Son adım (limiter / normalizasyon) çağırana kalır, tüm sinyal üzerinde sırayla çalışır.
+    """
+
+    def __init__(self, processor, segment_seconds=DEFAULT_SEGMENT_SECONDS,
+                 warmup_seconds=DEFAULT_WARMUP_SECONDS, crossfade_seconds=DEFAULT_CROSSFADE_SECONDS,
+                 workers=None):
+        self.processor = processor
+        self.segment_seconds = segment_seconds
+        self.warmup_seconds = warmup_seconds
+        self.crossfade_seconds = crossfade_seconds
+        self.workers = workers or processor.cpu_count
+        # Son çalıştırmada bir parti (workers parça + bağlam) için en yüksek bellek
+        self.peak_bytes = 0
+
+    def render(self, audio_data, settings, sample_rate=None, recorder=None):
+        """Tüm sinyali parçalı işle, girişle aynı boyda çıktı döndür (giriş değişmez)
+
+        recorder: aşama ölçümleri için çalıştırma kaydedicisi (ölçüm kapalıysa None)
+        """
+        output = np.empty(audio_data.shape, dtype=self.processor.dtype)
+        position = 0
+        for block in self.render_stream([audio_data], settings, sample_rate, recorder):
+            output[position:position + len(block)] = block
+            position += len(block)
+        return output
+
+    def render_stream(self, blocks, settings, sample_rate=None, recorder=None):
+        """Blok akışını parçalı işle, sırayla parça boyunda bloklar üret
+
+        Bellekte aynı anda en fazla workers parça (ve ısınma bağlamı) tutulur; parçaların
+        sonuncusu kısa kalmaz (öncekine eklenir).
+        """
+        processor = self.processor
+        sample_rate = sample_rate or processor.sample_rate
+        warmup = int(self.warmup_seconds * sample_rate)
+        crossfade = min(int(self.crossfade_seconds * sample_rate), warmup)
+        segment = max(1, int(self.segment_seconds * sample_rate))
+        denoise = settings.get('noise_reduction', 0) > 0
+        if denoise:
+            # Gürültü azaltma dosya genelinde CHUNK_SIZE parçalarıyla çalışır: parça sınırları
+            # bu ızgaraya oturur ve her parça komşu örnekleri (PADDING) görür
+            segment = -(-segment // CHUNK_SIZE) * CHUNK_SIZE
+            warmup = max(warmup, PADDING)
+        log.info("🧩 Parçalı işleme: %.0f sn parçalar, %s işçi", segment / sample_rate, self.workers)
+
+        blocks = iter(blocks)
+        buffer = None            # okunmuş ve henüz bırakılmamış giriş (buffer[0] = base)
+        base = 0
+        exhausted = False
+        noise_state = None
+        previous_tail = None
+        next_start = 0
+        self.peak_bytes = 0
+
+        while True:
+            # Parti için gereken giriş: workers parça, ısınma bağlamı ve son parçanın
+            # kısa kalıp kalmayacağını görecek kadar bir parça daha
+            need = next_start + (self.workers + 1) * segment + warmup
+            pending = [] if buffer is None else [buffer]
+            available = base + sum(len(block) for block in pending)
+            while not exhausted and available < need:
+                block = next(blocks, None)
+                if block is None:
+                    exhausted = True
+                else:
+                    pending.append(np.asarray(block, dtype=processor.dtype))
+                    available += len(block)
+            if not pending or available <= next_start:
+                return
+            buffer = pending[0] if len(pending) == 1 else np.concatenate(pending)
+            del pending
+
+            # Gürültü eşiği tek sefer, sıralı işlemedeki gibi dosyanın başından (ya da profilden)
+            if denoise and noise_state is None:
+                channel_count = 1 if buffer.ndim == 1 else buffer.shape[1]
+                if processor.noise_profile is not None:
+                    threshold = processor.noise_profile.threshold_for(sample_rate, channel_count)
+                else:
+                    threshold = stationary_threshold(buffer)
+                noise_state = {'threshold': threshold}
+
+            segments = []
+            start = next_start
+            while len(segments) < self.workers and start < available:
+                end = min(start + segment, available)
+                if exhausted and available - end < segment:
+                    end = available
+                segments.append((start, end))
+                start = end
+
+            def render_segment(bounds, buffer=buffer, base=base, available=available):
+                start, end = bounds
+                first = max(0, start - warmup)
+                last = min(available, end + warmup)
+                work = np.array(buffer[first - base:last - base])
+                state = None if noise_state is None else dict(noise_state, offset=first)
+                peak = processor._render_in_place(work, settings, sample_rate,
+                                                  noise_state=state, recorder=recorder)
+                # Parça aralığı + sonraki parçayla çapraz geçiş bölgesi
+                keep_end = min(available, end + crossfade)
+                return work[start - first:keep_end - first], peak
+
+            batch_peak = buffer.nbytes
+            results = parallel_map(render_segment, segments, self.workers)
+            for (start, end), (rendered, peak) in zip(segments, results):
+                batch_peak += peak
+                body = rendered[:end - start]
+                if previous_tail is not None:
+                    # Önceki parçanın kuyruğundan bu parçaya doğrusal geçiş
+                    fade = len(previous_tail)
+                    ramp = np.linspace(0, 1, fade + 2, dtype=body.dtype)[1:-1]
+                    if body.ndim == 2:
+                        ramp = ramp[:, np.newaxis]
+                    body[:fade] -= previous_tail
+                    body[:fade] *= ramp
+                    body[:fade] += previous_tail
+                previous_tail = rendered[end - start:]
+                yield body
+            self.peak_bytes = max(self.peak_bytes, batch_peak)
+
+            # Sonraki partinin ısınma bağlamından öncesini bırak
+            next_start = segments[-1][1]
+            keep_from = max(base, next_start - warmup)
+            buffer = buffer[keep_from - base:]
+            base = keep_from
+
+    def compare_with_sequential(self, audio_data, settings, sample_rate=None):
+        """Parçalı ve sıralı işlemeyi karşılaştır: süreler ve fark (en büyük / RMS dB)"""
+        processor = self.processor
+        sample_rate = sample_rate or processor.sample_rate
+        segment_seconds = processor.segment_seconds
+        try:
+            processor.segment_seconds = None
+            start = time.perf_counter()
+            sequential = processor.process_audio_professional(audio_data, settings, sample_rate)
+            sequential_time = time.perf_counter() - start
+        finally:
+            processor.segment_seconds = segment_seconds
+
+        start = time.perf_counter()
+        segmented = processor._apply_final_stage(
+            self.render(processor.precision.cast(audio_data), settings, sample_rate), sample_rate
+        )
+        segmented_time = time.perf_counter() - start
+
+        error = segmented.astype(np.float64) - sequential
+        rms = np.sqrt(np.mean(np.square(error)))
+        reference = np.sqrt(np.mean(np.square(sequential, dtype=np.float64)))
+        return {
+            'sequential_time': sequential_time,
+            'segmented_time': segmented_time,
+            'max_error': float(np.max(np.abs(error))),
+            'rms_error_db': float(20 * np.log10(max(rms, 1e-20) / max(reference, 1e-20))),
+        }
+
+
+def main():
+    from myp_audio_processor import MYPAudioProcessor
+    from myp_benchmark import make_test_signal
+
+    parser = argparse.ArgumentParser(description="Parçalı paralel işleme ile sıralı işlemenin karşılaştırması")
+    parser.add_argument('--seconds', type=float, default=240.0, help="test sinyali süresi")
+    parser.add_argument('--segment', type=float, default=DEFAULT_SEGMENT_SECONDS, help="parça süresi (sn)")
+    parser.add_argument('--workers', type=int, default=None, help="işçi sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument('--noise', action='store_true', help="gürültü azaltmayı da dahil et")
+    parser.add_argument('--tolerance', type=float, default=-40.0, help="kabul edilen en yüksek RMS fark (dB)")
+    args = parser.parse_args()
+
+    settings = dict(MYPAudioProcessor.DEFAULT_SETTINGS)
+    if not args.noise:
+        settings['noise_reduction'] = 0
+
+    processor = MYPAudioProcessor()
+    renderer = SegmentRenderer(processor, args.segment, workers=args.workers)
+    result = renderer.compare_with_sequential(make_test_signal(args.seconds, 2), settings)
+    flush()
+
+    print(f"\n⏱️ Sıralı: {result['sequential_time']:.2f} sn, parçalı: {result['segmented_time']:.2f} sn "
+          f"({renderer.workers} işçi)")
+    print(f"📏 Fark: en büyük {result['max_error']:.2e}, RMS {result['rms_error_db']:.1f} dB")
+    if result['rms_error_db'] <= args.tolerance:
+        print("✅ Parçalı çıktı sıralı çıktıyla tolerans içinde")
+    else:
+        print(f"❌ Fark toleransı aşıyor ({args.tolerance:.0f} dB)")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MYP Ses Düzenleyici - Ortak STFT Alanında Gürültü Azaltma
+Mehmet Yay tarafından geliştirildi
+
+Sonuç eski iki geçişli noisereduce çıktısından en fazla TOLERANCE_DB (-40 dB, sinyal RMS'ine
+göre RMS fark) uzaklaşır; tests/test_spectral.py ile denetlenir.
+"""
+
+import numpy as np
+import librosa
+from scipy import signal, ndimage
+
+# noisereduce 2.0.1 varsayılanları (eski iki geçişli sonuçla uyum için aynı tutulur)
+N_FFT = 1024
+HOP_LENGTH = N_FFT // 4
+CHUNK_SIZE = 600000
+PADDING = 30000
+TIME_CONSTANT = 2.0          # sn, durağan olmayan eşikteki gürültü tabanı
+FREQ_MASK_SMOOTH_HZ = 500
+TIME_MASK_SMOOTH_MS = 50
+THRESH_N_MULT = 2            # durağan olmayan: ortalamanın kaç katı üstü sinyal sayılır
+SIGMOID_SLOPE = 10
+N_STD_THRESH = 1.5           # durağan: gürültü ortalaması + kaç standart sapma
+TOP_DB = 80.0
+
+# Eski iki geçişli noisereduce sonucuna göre kabul edilen en yüksek RMS fark (dB, sinyal RMS'ine
+# göre). Tek geçişte ikinci kapı ilk kapının ISTFT/STFT tur dönüşü yerine maskelenmiş spektrumdan
+# hesaplanır; fark parça sınırlarında büyür (ölçülen: 10 sn -68 dB, 20 sn -60 dB, ~-49 dB'e kadar)
+TOLERANCE_DB = -40.0
+
+
+def amplitude_to_db(magnitude, axes):
+    """Genliği dB'ye çevir; her kanal kendi tepesinin TOP_DB altında kırpılır"""
+    power = np.square(magnitude)
+    np.maximum(power, 1e-40, out=power)
+    db = np.log10(power, out=power)
+    db *= 10
+    floor = db.max(axis=axes, keepdims=True) - TOP_DB
+    return np.maximum(db, floor, out=db)
+
+
+def smoothing_filter(n_grad_freq, n_grad_time):
+    """Maskeyi frekans/zamanda yumuşatan üçgen filtre, ayrık (frekans, zaman) çekirdekleri
+
+    İkisinin dış çarpımı noisereduce'un 2-D filtresidir; ayrı ayrı uygulamak daha hızlıdır
+    """
+    def ramp(n):
+        taps = np.concatenate([np.linspace(0, 1, n + 1, endpoint=False), np.linspace(1, 0, n + 2)])[1:-1]
+        return taps / np.sum(taps)
+    return ramp(n_grad_freq), ramp(n_grad_time)
+
+
+def stft(channels):
+    """(kanal, örnek) dizisinin STFT'si: (kanal, frekans, zaman)"""
+    return librosa.stft(channels, n_fft=N_FFT, hop_length=HOP_LENGTH, win_length=N_FFT)
+
+
+def stationary_threshold(noise, limit=CHUNK_SIZE):
+    """Gürültü örneğinden (kanal, frekans) dB eşiği: ortalama + N_STD_THRESH * std
+
+    noise: (samples,) veya (samples, channels); limit: kullanılacak en fazla örnek (None: hepsi)
+    """
+    channels = np.ascontiguousarray(noise.reshape(len(noise), -1)[:limit].T)
+    noise_db = amplitude_to_db(np.abs(stft(channels)), axes=(1, 2))
+    return noise_db.mean(axis=2) + noise_db.std(axis=2) * N_STD_THRESH
+
+
+class SpectralNoiseReducer:
+    """Durağan ve durağan olmayan spektral kapıyı tek STFT / tek ISTFT ile uygula
+
+    Kanallar (kanal, frekans, zaman) dizisi olarak birlikte dönüştürülür; iki maske
+    aynı spektrumda art arda uygulanır (ikinci maske ilkinin çıktısından hesaplanır).
+    Sonuç eski iki geçişli noisereduce çıktısıyla TOLERANCE_DB içinde aynıdır.
+    """
+
+    def __init__(self, sample_rate, stationary_amount, nonstationary_amount):
+        self.sample_rate = int(sample_rate)
+        self.stationary_amount = stationary_amount
+        self.nonstationary_amount = nonstationary_amount
+
+        n_grad_freq = int(FREQ_MASK_SMOOTH_HZ / (self.sample_rate / (N_FFT / 2)))
+        n_grad_time = int(TIME_MASK_SMOOTH_MS / ((HOP_LENGTH / self.sample_rate) * 1000))
+        self.kernel = None
+        if n_grad_freq > 1 or n_grad_time > 1:
+            self.kernel = smoothing_filter(max(n_grad_freq, 1), max(n_grad_time, 1))
+
+        # Gürültü tabanı için tek kutuplu filtre (zamanda ileri-geri)
+        t_frames = TIME_CONSTANT * self.sample_rate / float(HOP_LENGTH)
+        self.smoothing_pole = (np.sqrt(1 + 4 * t_frames ** 2) - 1) / (2 * t_frames ** 2)
+
+    def _smooth_mask(self, mask):
+        """Maskeyi frekans ve zaman ekseninde yumuşat (kenarlar sıfır kabul edilir)"""
+        if self.kernel is None:
+            return mask
+        freq_taps, time_taps = self.kernel
+        mask = ndimage.convolve1d(mask, freq_taps.astype(mask.dtype), axis=1, mode='constant')
+        return ndimage.convolve1d(mask, time_taps.astype(mask.dtype), axis=2, mode='constant', output=mask)
+
+    def _gate(self, spectrum, threshold):
+        """Spektrumu iki maskeyle yerinde çarp"""
+        magnitude = np.abs(spectrum)
+        dtype = magnitude.dtype
+
+        # 1. Durağan kapı: gürültü eşiğinin üstündeki hücreler geçer
+        if self.stationary_amount > 0:
+            above = amplitude_to_db(magnitude, axes=(1, 2)) > threshold[:, :, np.newaxis]
+            mask = above.astype(dtype)
+            mask *= self.stationary_amount
+            mask += 1.0 - self.stationary_amount
+            mask = self._smooth_mask(mask)
+            spectrum *= mask
+            magnitude *= mask
+
+        # 2. Durağan olmayan kapı: zamanda yumuşatılmış tabanın üstü (sigmoid)
+        if self.nonstationary_amount > 0:
+            floor = signal.filtfilt([self.smoothing_pole], [1, self.smoothing_pole - 1],
+                                    magnitude, axis=-1, padtype=None).astype(dtype, copy=False)
+            np.maximum(floor, np.finfo(dtype).tiny, out=floor)
+            # sigmoid((|S| - taban) / taban - THRESH_N_MULT), yerinde
+            mask = np.subtract(magnitude, floor, out=magnitude)
+            mask /= floor
+            mask -= THRESH_N_MULT
+            mask *= -SIGMOID_SLOPE
+            np.exp(mask, out=mask)
+            mask += 1
+            np.reciprocal(mask, out=mask)
+            mask = self._smooth_mask(mask)
+            mask *= self.nonstationary_amount
+            mask += 1.0 - self.nonstationary_amount
+            spectrum *= mask
+
+    def process(self, audio_data, threshold=None, out=None, offset=0, lead=0, trail=0):
+        """Gürültüyü azalt; (samples,) veya (samples, channels), dtype korunur
+
+        threshold: stationary_threshold() çıktısı (kanal, frekans), verilmezse sinyalin kendisinden
+        out: sonuç tamponu (girişin kendisi olabilir)
+        offset: audio_data[0]'ın tüm dosyadaki konumu; parçalar dosya genelinde CHUNK_SIZE
+        katlarına hizalanır (parçalı işlemede sonuç sıralı işlemeyle aynı kalsın diye)
+        lead / trail: baştaki / sondaki yalnızca bağlam olan örnek sayısı; tamamen bu
+        bölgelerde kalan parçalar işlenmez, oradaki çıktı tanımsız kalabilir
+        """
+        length = len(audio_data)
+        channels = audio_data.reshape(length, -1).T
+        if threshold is None:
+            threshold = stationary_threshold(audio_data)
+        if out is None:
+            out = np.empty_like(audio_data)
+        out_channels = out.reshape(length, -1).T
+
+        # noisereduce ile aynı parça düzeni: her parça iki yanından komşu örneklerle
+        # (sinyal dışında sıfır) PADDING kadar genişletilir, yalnızca orta kısım yazılır.
+        # Birden çok parça varsa sonuncusu da tam CHUNK_SIZE boyunda (sıfırla) okunur.
+        # Sonraki parça, bu parçanın çıktısı yazılmadan önce okunur (out girişle aynı olabilir).
+        size = CHUNK_SIZE if offset or length > CHUNK_SIZE else length
+        first = -(offset % CHUNK_SIZE)
+        first += max(0, lead - first) // CHUNK_SIZE * CHUNK_SIZE
+        padded = self._read_chunk(channels, first, size)
+        stop = length - trail
+        for start in range(first, stop, CHUNK_SIZE):
+            end = min(start + CHUNK_SIZE, length)
+            spectrum = stft(padded)
+            self._gate(spectrum, threshold)
+            restored = librosa.istft(spectrum, hop_length=HOP_LENGTH, win_length=N_FFT, length=padded.shape[1])
+            padded = self._read_chunk(channels, end, size) if end < stop else None
+            begin = max(start, 0)
+            out_channels[:, begin:end] = restored[:, PADDING + begin - start:PADDING + end - start]
+        return out
+
+    @staticmethod
+    def _read_chunk(channels, start, size):
+        """[start - PADDING, start + size + PADDING) aralığı, sinyal dışı sıfır"""
+        length = channels.shape[1]
+        end = min(start + size, length)
+        padded = np.zeros((channels.shape[0], size + 2 * PADDING), dtype=channels.dtype)
+        first, last = max(0, start - PADDING), min(length, end + PADDING)
+        padded[:, first - start + PADDING:last - start + PADDING] = channels[:, first:last]
+        return padded
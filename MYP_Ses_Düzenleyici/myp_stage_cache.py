@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MYP Ses Düzenleyici - Artımlı Aşama Önbelleği
+Mehmet Yay tarafından geliştirildi
+"""
+
+import itertools
+import threading
+import time
+import weakref
+from collections import OrderedDict, deque
+
+# Önbellekte tutulacak en fazla aşama çıktısı (bayt); aşılınca yeniden hesaplaması en ucuz
+# ve en eski kullanılan atılır
+DEFAULT_BUDGET_BYTES = 512 * 1024 * 1024
+
+
+def _freeze(value):
+    """Parametreyi anahtar olabilecek (hashable) biçime çevir (ör. ayar sözlüğü)"""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _buffer_key(value):
+    """Dizinin bellek alanının kimliği (aynı tampon birden çok anahtarda tek sayılır)"""
+    return value.__array_interface__['data'][0], value.nbytes
+
+
+class StageCache:
+    """Aşama çıktıları için bellek bütçeli, yeniden hesaplama maliyetine duyarlı önbellek
+
+    Atma GreedyDual ile yapılır: her girişin önceliği saat + maliyet (aşamanın işlem süresi,
+    saniye), kullanıldıkça yenilenir; en düşük öncelikli giriş atılır ve saat onun
+    önceliğine ilerler. Maliyetler eşitse LRU'dur; pahalı gürültü azaltma çıktısı ucuz
+    aşamalar dönerken hemen atılmaz.
+
+    Giriş dizileri kimlikleriyle (id değil, dizi yaşadıkça geçerli bir jeton) tanınır;
+    giriş dizisi silinince ona ait tüm çıktılar önbellekten düşer. Etkisiz aşama girişini
+    döndürdüğünde aynı tampon birden çok anahtarda saklanır, used_bytes'a bir kez eklenir.
+    """
+
+    def __init__(self, budget_bytes=DEFAULT_BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._priorities = {}
+        self._costs = {}
+        self._buffers = {}
+        self._clock = 0.0
+        self._sources = {}
+        self._tokens = itertools.count(1)
+        # Zayıf referans geri çağrısı önbellek işlemi sırasında (GC, aynı iş parçacığında)
+        # gelebilir: yalnızca kuyruğa ekler, girişler kilit altında _purge ile düşürülür
+        self._released = deque()
+        self._lock = threading.RLock()
+
+    def source_token(self, audio_data):
+        """Giriş dizisinin kimlik jetonu (aynı dizi için aynı, yeni dizi için yeni)"""
+        with self._lock:
+            self._purge()
+            entry = self._sources.get(id(audio_data))
+            if entry is not None and entry[0]() is audio_data:
+                return entry[1]
+            token = next(self._tokens)
+            self._sources[id(audio_data)] = (weakref.ref(audio_data, self._source_released(id(audio_data), token)),
+                                             token)
+            return token
+
+    def _source_released(self, source_id, token):
+        def release(_):
+            self._released.append((source_id, token))
+        return release
+
+    def _purge(self):
+        """Silinmiş giriş dizilerine ait çıktıları düşür (kilit altında çağrılır)"""
+        while self._released:
+            source_id, token = self._released.popleft()
+            entry = self._sources.get(source_id)
+            if entry is not None and entry[1] == token:
+                del self._sources[source_id]
+            for key in [key for key in self._entries if key[0] == token]:
+                self._remove(key)
+
+    def _remove(self, key):
+        """Girişi çıkar; tamponu başka anahtarda kalmadıysa baytlarını düş"""
+        value = self._entries.pop(key)
+        del self._priorities[key]
+        del self._costs[key]
+        buffer = _buffer_key(value)
+        self._buffers[buffer] -= 1
+        if not self._buffers[buffer]:
+            del self._buffers[buffer]
+            self.used_bytes -= value.nbytes
+
+    def get(self, key):
+        """Önbellekteki çıktı (en son kullanılan yapılır) ya da None"""
+        with self._lock:
+            self._purge()
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._priorities[key] = self._clock + self._costs[key]
+            self.hits += 1
+            return value
+
+    def put(self, key, value, cost=0.0):
+        """Çıktıyı ekle; bütçe aşılırsa en düşük öncelikli girişleri at (bütçeden büyükse eklenmez)
+
+        cost: çıktının yeniden hesaplanma maliyeti (ör. aşamanın işlem süresi, saniye)
+        """
+        if value.nbytes > self.budget_bytes:
+            return
+        with self._lock:
+            self._purge()
+            if key in self._entries:
+                self._remove(key)
+            buffer = _buffer_key(value)
+            if buffer not in self._buffers:
+                self.used_bytes += value.nbytes
+            self._buffers[buffer] = self._buffers.get(buffer, 0) + 1
+            self._entries[key] = value
+            self._costs[key] = float(cost)
+            self._priorities[key] = self._clock + self._costs[key]
+            while self.used_bytes > self.budget_bytes:
+                # Eşit öncelikte en eski kullanılan (OrderedDict sırası) atılır
+                evicted = min(self._entries, key=self._priorities.__getitem__)
+                self._clock = self._priorities[evicted]
+                self._remove(evicted)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._priorities.clear()
+            self._costs.clear()
+            self._buffers.clear()
+            self._clock = 0.0
+            self.used_bytes = 0
+
+    def stats(self):
+        """Önbellek sayaçları"""
+        with self._lock:
+            self._purge()
+            return {
+                'entries': len(self._entries),
+                'used_bytes': self.used_bytes,
+                'budget_bytes': self.budget_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+
+class CachedChain:
+    """Aşama zincirini önbellekle çalıştır: k. aşama değişince yalnızca k..n yeniden işlenir
+
+    k. aşamanın çıktısı (giriş kimliği, önceki tüm aşamaların ve kendisinin ad + parametresi)
+    anahtarıyla saklanır. Aşamalar girişlerini değiştirmemeli (yeni dizi döndürmeli);
+    dönen dizi önbellekle paylaşılır, çağıran yerinde değiştirecekse kopyalamalıdır.
+    """
+
+    def __init__(self, cache=None, budget_bytes=DEFAULT_BUDGET_BYTES):
+        self.cache = cache if cache is not None else StageCache(budget_bytes)
+        # Son çalıştırmada önbellekten alınan ve yeniden işlenen aşama sayıları
+        self.last_reused = 0
+        self.last_computed = 0
+
+    def run(self, audio_data, stages, variant=None, cancel=None, progress=None):
+        """stages: [(ad, fonksiyon(ses, parametre), parametre)]; son aşamanın çıktısını döndür
+
+        variant: tüm anahtarlara eklenen ek bağlam (ör. sample rate, dtype)
+        cancel: her aşamadan önce yoklanan iptal jetonu (check() iptalde hata yükseltir)
+        progress: progress(aşama adı, tamamlanan aşama, toplam aşama) her aşama bitince
+        """
+        token = self.cache.source_token(audio_data)
+        keys = []
+        prefix = (token, _freeze(variant))
+        for name, _, param in stages:
+            prefix = prefix + ((name, _freeze(param)),)
+            keys.append(prefix)
+
+        # Önbellekteki en uzun ön ekten devam et
+        start, current = 0, audio_data
+        for index in range(len(stages) - 1, -1, -1):
+            cached = self.cache.get(keys[index])
+            if cached is not None:
+                start, current = index + 1, cached
+                break
+        if start and progress is not None:
+            progress(stages[start - 1][0], start, len(stages))
+
+        for index, ((name, stage, param), key) in enumerate(zip(stages[start:], keys[start:]), start=start + 1):
+            if cancel is not None:
+                cancel.check()
+            started = time.perf_counter()
+            current = stage(current, param)
+            # Girişin kendisi (etkisiz aşama) saklanmaz: önbellek girişi yaşatmasın
+            if current is not audio_data:
+                self.cache.put(key, current, cost=time.perf_counter() - started)
+            if progress is not None:
+                progress(name, index, len(stages))
+
+        self.last_reused = start
+        self.last_computed = len(stages) - start
+        return current
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MYP Ses Düzenleyici - Paylaşılan İş Parçacığı Havuzu
+Mehmet Yay tarafından geliştirildi
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+_pools = {}
+_pools_lock = threading.Lock()
+_local = threading.local()
+
+
+def _mark_worker():
+    """Havuz iş parçacığını işaretle (iç içe gönderimde seri çalışmak için)"""
+    _local.worker = True
+
+
+def in_worker_thread():
+    """Çağıran iş parçacığı paylaşılan havuzun işçisi mi"""
+    return getattr(_local, 'worker', False)
+
+
+def shared_thread_pool(workers):
+    """Süreç genelinde, işçi sayısına göre tek bir havuz"""
+    with _pools_lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='myp-worker',
+                                      initializer=_mark_worker)
+            _pools[workers] = pool
+        return pool
+
+
+def parallel_map(func, items, workers):
+    """func'ı items üzerinde sırayı koruyarak uygula, sonuçları sırayla üret
+
+    workers <= 1, tek iş ya da zaten havuz içindeyken (kilitlenmemek için) seri çalışır.
+    Havuzdaki işler GIL'i bırakan NumPy/SciPy çekirdekleri olduğunda gerçekten paralel koşar.
+    """
+    items = list(items)
+    if workers <= 1 or len(items) <= 1 or in_worker_thread():
+        return map(func, items)
+    return shared_thread_pool(workers).map(func, items)
@@ -12,6 +12,10 @@ import threading
 import os
 import time
 from myp_audio_processor import MYPAudioProcessor
+from myp_stage_cache import CachedChain
+from myp_render_scheduler import RenderService, RenderCancelled
+from myp_window_render import WindowedRenderer
+from myp_resampler import resample
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import numpy as np
@@ -36,62 +40,66 @@ import json
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
+# Ayarlar bu kadar süre (ms) değişmeyince tam kalite işleme başlar; o zamana kadar önizleme işlenir
+FULL_RENDER_DELAY_MS = 400
+
 class RealTimeAudioProcessor:
     def __init__(self, sample_rate=44100):
         self.sample_rate = sample_rate
-        self.processor = MYPAudioProcessor()
-        
-    def apply_effects_realtime(self, audio_data, settings):
-        """Gerçek zamanlı efekt uygulama"""
+        self.processor = MYPAudioProcessor(parallel=True)
+        # Aşama çıktıları önbellekte: kaydırıcı değişince yalnızca o aşama ve sonrası işlenir
+        self.stage_chain = CachedChain()
+        # Sürükleme sırasında işlenen önizleme kopyası (11 kHz mono) ve kaynağı
+        self.proxy_source = None
+        self.proxy_audio = None
+        self.proxy_rate = None
+        
+    def apply_effects_realtime(self, audio_data, settings, cancel=None, progress=None):
+        """Gerçek zamanlı efekt uygulama
+
+        cancel: daha yeni bir ayar gelince işlemeyi aşama/parça sınırında kesen iptal jetonu
+        progress: progress(aşama adı, tamamlanan, toplam) her aşama bitince
+        """
         try:
-            processed = audio_data.copy()
-            
-            # Her efekti ayar değerine göre uygula
-            if settings.get('noise_reduction', 0) > 0:
-                processed = self.processor.mehmet_yay_advanced_noise_reduction(
-                    processed, settings['noise_reduction'] / 100.0
-                )
-            
-            if settings.get('vocal_enhance', 0) > 0:
-                processed = self.processor.mehmet_yay_professional_vocal_enhance(
-                    processed, settings['vocal_enhance'] / 100.0
-                )
-            
-            if settings.get('bass_boost', 0) > 0:
-                processed = self.processor.mehmet_yay_cinematic_bass_boost(
-                    processed, settings['bass_boost'] / 100.0
-                )
-            
-            if settings.get('treble_enhance', 0) > 0:
-                processed = self.processor.mehmet_yay_crystal_treble_enhance(
-                    processed, settings['treble_enhance'] / 100.0
-                )
-            
-            if settings.get('stereo_enhance', 0) > 0:
-                processed = self.processor.mehmet_yay_3d_stereo_enhance(
-                    processed, settings['stereo_enhance'] / 100.0
-                )
-            
-            if settings.get('warmth_filter', 0) > 0:
-                processed = self.processor.mehmet_yay_heart_touching_warmth(
-                    processed, settings['warmth_filter'] / 100.0
-                )
-            
-            if settings.get('compression', 0) > 0:
-                processed = self.processor.mehmet_yay_professional_compression(
-                    processed, settings['compression'] / 100.0
-                )
-            
-            if settings.get('mastering', 0) > 0:
-                processed = self.processor.mehmet_yay_final_mastering(
-                    processed, settings['mastering'] / 100.0
-                )
-            
-            return processed
+            # Kaydırıcı değerleri yüzde, motor yoğunlukları 0-1 arası
+            intensities = {key: value / 100.0 for key, value in settings.items()}
+            return self.processor.process_audio_incremental(
+                audio_data, intensities, self.sample_rate, self.stage_chain, cancel, progress
+            )
             
+        except RenderCancelled:
+            raise
         except Exception as e:
             print(f"Gerçek zamanlı işleme hatası: {e}")
             return audio_data
+    
+    def apply_effects_preview(self, audio_data, settings, cancel=None, progress=None):
+        """Önizleme: efektleri seyreltilmiş kopyaya uygula, (veri, sample rate) döndür"""
+        if self.proxy_source is not audio_data:
+            self.proxy_audio, self.proxy_rate = self.processor.make_proxy(audio_data, self.sample_rate)
+            self.proxy_source = audio_data
+        try:
+            intensities = {key: value / 100.0 for key, value in settings.items()}
+            preview = self.processor.process_audio_incremental(
+                self.proxy_audio, intensities, self.proxy_rate, self.stage_chain, cancel, progress,
+                final_stage='normalize'
+            )
+            return preview, self.proxy_rate
+            
+        except RenderCancelled:
+            raise
+        except Exception as e:
+            print(f"Önizleme hatası: {e}")
+            return self.proxy_audio, self.proxy_rate
+    
+    def create_window_renderer(self, audio_data, settings):
+        """İşlenmiş çalma için yalnızca çalma konumu çevresini işleyen pencereli işleyici"""
+        intensities = {key: value / 100.0 for key, value in settings.items()}
+        return WindowedRenderer(self.processor, audio_data, self.sample_rate, intensities)
+    
+    def update_window_renderer(self, renderer, settings):
+        """Pencereli işleyiciye yeni ayarları ver (çalma konumundaki pencere yeniden işlenince duyulur)"""
+        renderer.set_settings({key: value / 100.0 for key, value in settings.items()})
 
 class AdvancedAudioPlayer:
     def __init__(self, callback=None):
@@ -107,6 +115,8 @@ class AdvancedAudioPlayer:
         self.callback = callback
         self.duration = 0
         self.play_processed = False
+        # İşlenmiş çalma için pencereli işleyici (varsa işlenmiş ses çalarken istenir)
+        self.window_renderer = None
         
         # PyAudio başlat
         try:
@@ -120,20 +130,19 @@ class AdvancedAudioPlayer:
             # Pydub ile yükle
             audio = AudioSegment.from_file(file_path)
             
-            # Stereo'ya çevir
-            if audio.channels == 1:
-                audio = audio.set_channels(2)
+            # NumPy array'e çevir
+            samples = np.array(audio.get_array_of_samples())
+            samples = samples.reshape((-1, audio.channels)).astype(np.float32) / 32768.0
             
-            # Sample rate ayarla
+            # Sample rate ayarla (önbellekli polifaz çekirdek, kanal çoğaltmadan önce)
             if audio.frame_rate != self.sample_rate:
-                audio = audio.set_frame_rate(self.sample_rate)
+                samples = resample(samples, audio.frame_rate, self.sample_rate)
             
-            # NumPy array'e çevir
-            samples = np.array(audio.get_array_of_samples())
-            if audio.channels == 2:
-                samples = samples.reshape((-1, 2))
+            # Mono kaynak 1-D kalır, çalarken mono akış açılır
+            if audio.channels == 1:
+                samples = samples[:, 0]
             
-            self.audio_data = samples.astype(np.float32) / 32768.0
+            self.audio_data = samples
             self.duration = len(audio) / 1000.0  # saniye
             self.current_position = 0
             
@@ -146,9 +155,13 @@ class AdvancedAudioPlayer:
         """İşlenmiş ses verisini ayarla"""
         self.processed_audio_data = processed_data
     
+    def set_window_renderer(self, renderer):
+        """İşlenmiş sesi çalma konumu çevresinde işleyen WindowedRenderer'ı ayarla (None: kapalı)"""
+        self.window_renderer = renderer
+    
     def play(self, use_processed=False):
         """Sesi çal"""
-        if not self.audio_data or not self.p:
+        if self.audio_data is None or not self.p:
             return False
         
         self.play_processed = use_processed
@@ -166,18 +179,23 @@ class AdvancedAudioPlayer:
     def _play_audio(self):
         """Ses çalma thread'i"""
         try:
-            # Stream aç
+            # Hangi ses verisini kullanacağını belirle
+            # Pencereli işleyici varsa işlenmiş ses çalınırken blok blok ondan okunur
+            renderer = self.window_renderer if self.play_processed else None
+            if renderer is not None:
+                audio_to_play = renderer.source
+            else:
+                audio_to_play = self.processed_audio_data if (self.play_processed and self.processed_audio_data is not None) else self.audio_data
+            
+            # Stream aç (mono veri mono akışla çalınır)
             stream = self.p.open(
                 format=pyaudio.paInt16,
-                channels=2,
+                channels=audio_to_play.shape[1] if len(audio_to_play.shape) == 2 else 1,
                 rate=self.sample_rate,
                 output=True,
                 frames_per_buffer=1024
             )
             
-            # Hangi ses verisini kullanacağını belirle
-            audio_to_play = self.processed_audio_data if (self.play_processed and self.processed_audio_data is not None) else self.audio_data
-            
             # Başlangıç pozisyonunu hesapla
             start_sample = int(self.current_position * self.sample_rate)
             
@@ -190,7 +208,10 @@ class AdvancedAudioPlayer:
                 if not self.is_paused:
                     # Chunk al
                     end_pos = min(sample_pos + chunk_size, len(audio_to_play))
-                    chunk = audio_to_play[sample_pos:end_pos]
+                    if renderer is not None:
+                        chunk = renderer.read(sample_pos, end_pos - sample_pos)
+                    else:
+                        chunk = audio_to_play[sample_pos:end_pos]
                     
                     if len(chunk) > 0:
                         # Volume uygula
@@ -205,6 +226,8 @@ class AdvancedAudioPlayer:
                         
                         # Pozisyonu güncelle
                         self.current_position = sample_pos / self.sample_rate
+                        if renderer is not None:
+                            renderer.set_position(sample_pos)
                         
                         # Callback çağır
                         if self.callback:
@@ -239,6 +262,8 @@ class AdvancedAudioPlayer:
         """Pozisyona git"""
         if self.duration > 0:
             self.current_position = max(0, min(position, self.duration))
+            if self.window_renderer is not None:
+                self.window_renderer.set_position(int(self.current_position * self.sample_rate))
     
     def set_volume(self, volume):
         """Ses seviyesini ayarla"""
@@ -273,13 +298,23 @@ class MYPUltimateGUI:
         except:
             pass
         
-        self.processor = MYPAudioProcessor()
+        self.processor = MYPAudioProcessor(parallel=True)
         self.realtime_processor = RealTimeAudioProcessor()
         self.current_file = None
         self.processed_file = None
         self.processing = False
         self.audio_data = None
         self.processed_audio_data = None
+        # Sürükleme sırasında gösterilen önizleme ve ayar sürümleri (tam kalite işleme hangi sürümde)
+        self.preview_audio_data = None
+        self.preview_rate = None
+        self.settings_version = 0
+        self.full_render_version = 0
+        self.full_render_timer = None
+        # Tam kalite işleme bitince çalışacak dışa aktarma adımı (ensure_full_render)
+        self.pending_export = None
+        # İşlenmiş çalma: yalnızca çalma konumu çevresi işlenir (dosya yüklenince kurulur)
+        self.window_renderer = None
         
         # Gelişmiş ses çalar
         self.audio_player = AdvancedAudioPlayer(callback=self.audio_position_callback)
@@ -307,6 +342,12 @@ class MYPUltimateGUI:
         self.realtime_update_timer = None
         
         self.setup_ui()
+        
+        # Efektler arka planda işlenir, sonuçlar Tk döngüsünde kuyruktan alınır
+        self.render_service = RenderService(self.root, self.render_realtime_effects,
+                                            on_result=self.show_realtime_effects,
+                                            on_progress=self.show_realtime_progress,
+                                            on_error=self.show_realtime_error)
         self.start_timers()
         
     def setup_ui(self):
@@ -779,15 +820,84 @@ class MYPUltimateGUI:
         self.log_message(f"🔧 {key}: {int_value}%")
     
     def apply_realtime_effects(self):
-        """Gerçek zamanlı efektleri uygula"""
+        """Gerçek zamanlı efektleri arka planda uygula: hemen önizleme, değişiklik durunca tam kalite"""
         if self.audio_data is None:
             return
         
-        try:
-            # Efektleri uygula
-            self.processed_audio_data = self.realtime_processor.apply_effects_realtime(
+        self.settings_version += 1
+        self.render_service.submit(('preview', self.settings_version, self.realtime_settings.copy()))
+        # Çalan işlenmiş ses yeni ayarla çalma konumundan başlayarak arka planda yeniden işlenir
+        if self.window_renderer is not None:
+            self.realtime_processor.update_window_renderer(self.window_renderer, self.realtime_settings)
+        
+        if self.full_render_timer is not None:
+            self.root.after_cancel(self.full_render_timer)
+        self.full_render_timer = self.root.after(FULL_RENDER_DELAY_MS, self.request_full_render)
+    
+    def reset_window_renderer(self):
+        """Yüklenen ses için işlenmiş çalmayı pencereli işleyiciye bağla (eskisini kapat)"""
+        if self.window_renderer is not None:
+            self.window_renderer.close(timeout=1.0)
+        self.window_renderer = None
+        if self.audio_data is not None:
+            self.window_renderer = self.realtime_processor.create_window_renderer(
                 self.audio_data, self.realtime_settings
             )
+        self.audio_player.set_window_renderer(self.window_renderer)
+    
+    def request_full_render(self):
+        """Son ayarlarla tam kalite işleme iste"""
+        self.full_render_timer = None
+        self.render_service.submit(('full', self.settings_version, self.realtime_settings.copy()))
+    
+    def ensure_full_render(self, on_ready):
+        """Dışa aktarmadan önce: son ayarların tam kalite işlemesi hazır olunca on_ready'yi çağır
+
+        İşleme RenderService iş parçacığında yapılır (arayüz donmaz, süren işleme aynı
+        iş parçacığında sırayla biter); sonuç gelince on_ready Tk iş parçacığında çağrılır.
+        """
+        if self.audio_data is None or self.full_render_version == self.settings_version:
+            on_ready()
+            return
+        if self.full_render_timer is not None:
+            self.root.after_cancel(self.full_render_timer)
+            self.full_render_timer = None
+        self.pending_export = on_ready
+        self.render_service.submit(('full', self.settings_version, self.realtime_settings.copy()))
+        
+        self.log_message("⏳ Dışa aktarma için tam kalite işleniyor...")
+        self.status_label.configure(text="Tam kalite işleniyor...", text_color="#FF9800")
+    
+    def render_realtime_effects(self, request, cancel, progress):
+        """İşleme iş parçacığında: efektleri önizleme kopyasına ya da tüm sese uygula"""
+        kind, version, settings = request
+        audio_data = self.audio_data
+        if audio_data is None:
+            return None
+        if kind == 'preview':
+            output = self.realtime_processor.apply_effects_preview(audio_data, settings, cancel, progress)
+        else:
+            output = self.realtime_processor.apply_effects_realtime(audio_data, settings, cancel, progress)
+        return kind, version, output
+    
+    def show_realtime_progress(self, stage, done, total):
+        """İşleme ilerlemesini göster"""
+        self.status_label.configure(text=f"İşleniyor: {stage} ({done}/{total})", text_color="#FF9800")
+    
+    def show_realtime_effects(self, result):
+        """Tk iş parçacığında: önizlemeyi ya da tam kalite sesi çalar ve görselleştirmeye ver"""
+        if result is None:
+            return
+        kind, version, output = result
+        
+        if kind == 'preview':
+            self.preview_audio_data, self.preview_rate = output
+            self.status_label.configure(text=f"Önizleme ({self.preview_rate} Hz)", text_color="#FFD700")
+        elif version >= self.full_render_version:
+            self.processed_audio_data = output
+            self.full_render_version = version
+            if version == self.settings_version:
+                self.preview_audio_data = None
             
             # Ses çalar'a güncellemeyi bildir
             self.audio_player.set_processed_audio(self.processed_audio_data)
@@ -795,12 +905,23 @@ class MYPUltimateGUI:
             # İşlenmiş çalma butonunu aktif et
             self.play_processed_btn.configure(state="normal")
             self.export_processed_btn.configure(state="normal")
-            
-            # Görselleştirmeyi güncelle
-            self.update_visualization()
-            
-        except Exception as e:
-            self.log_message(f"❌ Gerçek zamanlı işleme hatası: {e}")
+            self.status_label.configure(text="İşlendi", text_color="#4CAF50")
+        
+        # Görselleştirmeyi güncelle
+        self.update_visualization()
+        
+        # Son ayarların tam kalite sonucu geldi: bekleyen dışa aktarmayı sürdür
+        if kind == 'full' and self.full_render_version == self.settings_version and self.pending_export is not None:
+            on_ready, self.pending_export = self.pending_export, None
+            on_ready()
+    
+    def show_realtime_error(self, error):
+        """Tk iş parçacığında: işleme hatasını bildir (bekleyen dışa aktarma iptal edilir)"""
+        self.log_message(f"❌ Gerçek zamanlı işleme hatası: {error}")
+        self.status_label.configure(text="Hata", text_color="#FF0000")
+        if self.pending_export is not None:
+            self.pending_export = None
+            messagebox.showerror("Hata", f"Tam kalite işleme başarısız:\n{error}")
     
     def select_file(self):
         """Dosya seçimi"""
@@ -856,6 +977,7 @@ class MYPUltimateGUI:
                 
                 # Ses verisini al
                 self.audio_data, _ = self.processor.mehmet_yay_load_audio(self.current_file)
+                self.reset_window_renderer()
                 
                 # İlk görselleştirme
                 self.update_visualization()
@@ -886,7 +1008,7 @@ class MYPUltimateGUI:
     
     def play_processed(self):
         """İşlenmiş sesi çal"""
-        if self.audio_player and self.processed_audio_data is not None:
+        if self.audio_player and (self.processed_audio_data is not None or self.window_renderer is not None):
             try:
                 self.stop_audio()
                 if self.audio_player.play(use_processed=True):
@@ -969,8 +1091,8 @@ class MYPUltimateGUI:
             pass
     
     def export_processed_audio(self):
-        """İşlenmiş sesi dışa aktar"""
-        if self.processed_audio_data is None:
+        """İşlenmiş sesi dışa aktar (tam kalite işleme arka planda bitince kaydedilir)"""
+        if self.audio_data is None and self.processed_audio_data is None:
             messagebox.showwarning("Uyarı", "Henüz işlenmiş ses yok! Ayarları değiştirin.")
             return
         
@@ -997,36 +1119,40 @@ class MYPUltimateGUI:
         )
         
         if save_path:
-            try:
-                self.log_message(f"💾 Kaydediliyor: {format_choice} formatında...")
-                self.status_label.configure(text="Kaydediliyor...", text_color="#FF9800")
-                
-                # Geçici WAV dosyası oluştur
-                temp_wav = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
-                sf.write(temp_wav.name, self.processed_audio_data, self.processor.sample_rate)
-                
-                # Format'a göre dönüştür
-                audio = AudioSegment.from_wav(temp_wav.name)
-                
-                if format_choice == "MP3":
-                    bitrate = quality_choice.replace("kbps", "k")
-                    audio.export(save_path, format="mp3", bitrate=bitrate)
-                elif format_choice == "FLAC":
-                    audio.export(save_path, format="flac")
-                else:
-                    audio.export(save_path, format="wav")
-                
-                # Geçici dosyayı sil
-                os.unlink(temp_wav.name)
-                
-                self.log_message(f"✅ İşlenmiş ses kaydedildi: {os.path.basename(save_path)}")
-                self.status_label.configure(text="Kaydedildi", text_color="#00FF00")
-                messagebox.showinfo("Başarılı", f"İşlenmiş ses başarıyla kaydedildi:\n{save_path}")
-                
-            except Exception as e:
-                self.log_message(f"❌ Kaydetme hatası: {e}")
-                self.status_label.configure(text="Hata", text_color="#FF0000")
-                messagebox.showerror("Hata", f"Dosya kaydedilemedi:\n{e}")
+            self.ensure_full_render(lambda: self.save_processed_audio(save_path, format_choice, quality_choice))
+    
+    def save_processed_audio(self, save_path, format_choice, quality_choice):
+        """Tam kalite işlenmiş sesi seçilen biçimde kaydet"""
+        try:
+            self.log_message(f"💾 Kaydediliyor: {format_choice} formatında...")
+            self.status_label.configure(text="Kaydediliyor...", text_color="#FF9800")
+            
+            # Geçici WAV dosyası oluştur
+            temp_wav = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
+            sf.write(temp_wav.name, self.processed_audio_data, self.processor.sample_rate)
+            
+            # Format'a göre dönüştür
+            audio = AudioSegment.from_wav(temp_wav.name)
+            
+            if format_choice == "MP3":
+                bitrate = quality_choice.replace("kbps", "k")
+                audio.export(save_path, format="mp3", bitrate=bitrate)
+            elif format_choice == "FLAC":
+                audio.export(save_path, format="flac")
+            else:
+                audio.export(save_path, format="wav")
+            
+            # Geçici dosyayı sil
+            os.unlink(temp_wav.name)
+            
+            self.log_message(f"✅ İşlenmiş ses kaydedildi: {os.path.basename(save_path)}")
+            self.status_label.configure(text="Kaydedildi", text_color="#00FF00")
+            messagebox.showinfo("Başarılı", f"İşlenmiş ses başarıyla kaydedildi:\n{save_path}")
+            
+        except Exception as e:
+            self.log_message(f"❌ Kaydetme hatası: {e}")
+            self.status_label.configure(text="Hata", text_color="#FF0000")
+            messagebox.showerror("Hata", f"Dosya kaydedilemedi:\n{e}")
     
     def export_original_audio(self):
         """Orijinal sesi dışa aktar"""
@@ -1107,8 +1233,16 @@ class MYPUltimateGUI:
                 ax1.tick_params(colors='white', labelsize=8)
                 ax1.grid(True, alpha=0.3)
                 
-                # İşlenmiş ses
-                if self.processed_audio_data is not None:
+                # İşlenmiş ses (ayar sürüklenirken seyreltilmiş önizleme)
+                if self.preview_audio_data is not None:
+                    preview_step = max(1, len(self.preview_audio_data) // len(original_sample))
+                    processed_sample = self.preview_audio_data[::preview_step]
+                    preview_axis = np.linspace(0, len(self.preview_audio_data) / self.preview_rate,
+                                               len(processed_sample))
+                    
+                    ax2.plot(preview_axis, processed_sample, color='#FFD700', linewidth=0.8)
+                    ax2.set_title('İşlenmiş Ses (Önizleme)', color='white', fontsize=10)
+                elif self.processed_audio_data is not None:
                     if len(self.processed_audio_data.shape) == 2:
                         processed_sample = self.processed_audio_data[::sample_rate, 0]
                     else:
@@ -1251,6 +1385,11 @@ class MYPUltimateGUI:
         try:
             self.stop_audio()
             self.audio_player.cleanup()
+            if self.full_render_timer is not None:
+                self.root.after_cancel(self.full_render_timer)
+            self.render_service.close(timeout=1.0)
+            if self.window_renderer is not None:
+                self.window_renderer.close(timeout=1.0)
         except:
             pass
     
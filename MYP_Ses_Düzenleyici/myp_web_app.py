@@ -183,7 +183,7 @@ def main():
             try:
                 st.subheader("📊 Orijinal Ses Analizi")
                 processor = MYPAudioProcessor()
-                audio_data, _ = processor.mehmet_yay_load_audio(temp_input_path)
+                audio_data, sample_rate = processor.mehmet_yay_load_audio(temp_input_path)
                 
                 if audio_data is not None:
                     # Görselleştirme
@@ -192,7 +192,7 @@ def main():
                         st.plotly_chart(fig, use_container_width=True)
                     
                     # Ses bilgileri
-                    duration = len(audio_data) / processor.sample_rate
+                    duration = len(audio_data) / sample_rate
                     channels = "Stereo" if len(audio_data.shape) == 2 else "Mono"
                     
                     col_info1, col_info2, col_info3 = st.columns(3)
@@ -201,7 +201,7 @@ def main():
                     with col_info2:
                         st.metric("🔊 Kanal", channels)
                     with col_info3:
-                        st.metric("📊 Sample Rate", f"{processor.sample_rate} Hz")
+                        st.metric("📊 Sample Rate", f"{sample_rate} Hz")
             except Exception as e:
                 st.error(f"Ses analizi hatası: {e}")
             
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MYP Ses Düzenleyici - Çalma Konumu Çevresinde Pencereli İşleme
+Mehmet Yay tarafından geliştirildi
+"""
+
+import threading
+import numpy as np
+from myp_spectral import CHUNK_SIZE, PADDING, stationary_threshold
+from myp_buffer_pool import Workspace
+from myp_logging import get_logger
+
+log = get_logger('window_render')
+
+# Çalarken istenen bölge bu boydaki pencereler halinde işlenir
+DEFAULT_WINDOW_SECONDS = 1.0
+# Gürültü azaltma sonrası aşamalar nedensel (IIR, kompresör zarfı): pencere öncesinden
+# bu kadar bağlam işlenip atılır, durumlar oturur
+DEFAULT_WARMUP_SECONDS = 1.0
+# Arka planda çalma konumunun bu kadar ilerisine kadar işlenir (çalma ilerledikçe kayar)
+DEFAULT_LOOKAHEAD_SECONDS = 10.0
+
+
+class WindowedRenderer:
+    """Sinyali yalnızca çalma konumu çevresinde, istendikçe pencere pencere işle
+
+    Tüm işleme arka plan iş parçacığında, çalma konumundaki pencereden lookahead kadar
+    ileriye doğru yapılır. read() çalma geri çağrısından çağrılır ve hiç işlemez: hazır
+    pencereleri kopyalar, hiç işlenmemiş (ya da işlenemeyen) pencere için kuru kaynağı döndürür.
+
+    Ayar değişince tüm pencereler eskir; çalma konumundaki pencere yeniden işlenene kadar
+    eski ayarlı çıktı çalınır. Değişiklik bir blokta değil, bir pencere işleme süresinde
+    duyulur (~0.1-0.3 sn); gürültü azaltma yoğunluğu değişince önce çalma konumunu içeren
+    CHUNK_SIZE'lık ızgara parçası yeniden temizlenir (~1 sn, yavaş makinede birkaç saniye).
+
+    Gürültü azaltma dosya genelindeki CHUNK_SIZE ızgarasında, ortak eşikle ve PADDING
+    bağlamıyla parça parça (ayarı değişmedikçe bir kez) yapılır; son adım her zaman
+    true-peak limiter'dır (global normalizasyon pencereyle yapılamaz).
+    """
+
+    def __init__(self, processor, audio_data, sample_rate=None, settings=None,
+                 window_seconds=DEFAULT_WINDOW_SECONDS, warmup_seconds=DEFAULT_WARMUP_SECONDS,
+                 lookahead_seconds=DEFAULT_LOOKAHEAD_SECONDS):
+        self.processor = processor
+        self.sample_rate = sample_rate or processor.sample_rate
+        self.source = processor.precision.cast(audio_data)
+        self.length = len(self.source)
+        self.window = max(1, int(window_seconds * self.sample_rate))
+        self.warmup = int(warmup_seconds * self.sample_rate)
+        self.tail = processor._make_limiter(self.sample_rate).latency
+        self.output = np.zeros_like(self.source)
+        self.window_count = -(-self.length // self.window)
+        self.lookahead = max(1, int(lookahead_seconds / window_seconds))
+
+        self._lock = threading.Condition()
+        self._version = 0
+        self._plan = []
+        self._ready = [-1] * self.window_count
+        # İşlenemeyen pencere: hangi sürümde hata verdi (o sürümde yeniden denenmez)
+        self._failed = [-1] * self.window_count
+        self._position = 0
+        self._closed = False
+
+        # Gürültü azaltılmış kaynak: ızgara parçası başına hangi yoğunlukla işlendiği
+        self._denoised = None
+        self._denoised_chunks = {}
+        self._noise_intensity = 0
+        self._threshold = None
+
+        self.set_settings(settings if settings is not None else {})
+        self._thread = threading.Thread(target=self._background, name='myp-window-render', daemon=True)
+        self._thread.start()
+
+    def set_settings(self, settings):
+        """Yeni ayarlar: tüm pencereler eskir, arka plan işlemesi çalma konumundan yeniden başlar"""
+        plan = self.processor._stage_plan(settings)
+        with self._lock:
+            self._version += 1
+            self._plan = plan
+            self._lock.notify_all()
+
+    def set_position(self, sample):
+        """Çalma konumu (örnek); arka plan işlemesi buradan ileriye öncelik verir"""
+        with self._lock:
+            moved = self._window_index(sample) != self._window_index(self._position)
+            self._position = max(0, min(int(sample), self.length))
+            if moved:
+                self._lock.notify_all()
+
+    def read(self, start, count):
+        """[start, start + count) aralığının kopyası; beklemez, işlenmemiş pencereler kuru döner
+
+        Çalma konumu start'a taşınır: arka plan işlemesi buradan ileriye öncelik verir.
+        """
+        start = max(0, int(start))
+        end = min(self.length, start + int(count))
+        self.set_position(start)
+        with self._lock:
+            chunk = np.array(self.output[start:end])
+            for index in self._window_range(start, end):
+                if self._ready[index] < 0:
+                    first = max(start, index * self.window)
+                    last = min(end, first + self.window)
+                    chunk[first - start:last - start] = self.source[first:last]
+        return chunk
+
+    def wait(self, start, count, timeout=None):
+        """Aralıktaki pencereler güncel ayarla işlenene kadar bekle (çalma dışı kullanım için)
+
+        Aralık lookahead'den uzunsa çalma konumu da ilerletilmelidir. Hepsi hazırsa True,
+        zaman aşımı, kapanma ya da işlenemeyen pencerede False döner.
+        """
+        start = max(0, int(start))
+        end = min(self.length, start + int(count))
+        self.set_position(start)
+        indices = self._window_range(start, end)
+        with self._lock:
+            self._lock.wait_for(
+                lambda: self._closed or all(self._version in (self._ready[index], self._failed[index])
+                                            for index in indices),
+                timeout,
+            )
+            return not self._closed and all(self._ready[index] == self._version for index in indices)
+
+    def close(self, timeout=None):
+        with self._lock:
+            self._closed = True
+            self._lock.notify_all()
+        self._thread.join(timeout)
+
+    def _window_index(self, sample):
+        return min(int(sample) // self.window, self.window_count - 1)
+
+    def _window_range(self, start, end):
+        return range(self._window_index(start), self._window_index(max(start, end - 1)) + 1)
+
+    def _background(self):
+        """Çalma konumundan ileriye (lookahead içinde) eski pencereleri sırayla işle"""
+        while True:
+            with self._lock:
+                while not self._closed and self._next_stale() is None:
+                    self._lock.wait()
+                if self._closed:
+                    return
+                index = self._next_stale()
+                version, plan = self._version, self._plan
+            try:
+                self._render_window(index, plan, version)
+            except Exception as e:
+                log.error("❌ Pencere işleme hatası: %s", e)
+                # _ready değişmez: read() eski çıktıyı ya da kuru kaynağı vermeye devam eder
+                with self._lock:
+                    self._failed[index] = version
+                    self._lock.notify_all()
+
+    def _next_stale(self):
+        """Çalma konumundaki pencereden lookahead içinde eski ilk pencere (yoksa None)"""
+        first = self._window_index(self._position)
+        for index in range(first, min(self.window_count, first + self.lookahead)):
+            if self._version not in (self._ready[index], self._failed[index]):
+                return index
+        return None
+
+    def _render_window(self, index, plan, version):
+        """Pencereyi ısınma bağlamıyla işle, limiter'dan geçirip çıktıya yaz"""
+        processor = self.processor
+        start = index * self.window
+        end = min(self.length, start + self.window)
+        first = max(0, start - self.warmup)
+        last = min(self.length, end + self.tail)
+
+        if plan and plan[0][0] == 'noise_reduction':
+            _, stage, intensity = plan[0]
+            plan = plan[1:]
+            source = self._denoised_range(stage, intensity, first, last)
+        else:
+            source = self.source
+
+        work = np.array(source[first:last])
+        with Workspace(processor.buffer_pool) as workspace:
+            processor._run_stages_in_place(work, plan, [{} for _ in plan], self.sample_rate, workspace)
+        processor._make_limiter(self.sample_rate).limit(work, out=work)
+        # read() yarım yazılmış pencere görmesin
+        with self._lock:
+            self.output[start:end] = work[start - first:end - first]
+            self._ready[index] = version
+            self._lock.notify_all()
+
+    def _denoised_range(self, stage, intensity, first, last):
+        """Gürültü azaltılmış kaynağın [first, last) aralığını hazırla (ızgara parçaları bir kez)"""
+        if self._denoised is None:
+            self._denoised = np.empty_like(self.source)
+        if intensity != self._noise_intensity:
+            self._denoised_chunks.clear()
+            self._noise_intensity = intensity
+        if self._threshold is None:
+            # Sıralı işlemedeki gibi eşik dosyanın başından (ya da kayıtlı profilden)
+            channel_count = 1 if self.source.ndim == 1 else self.source.shape[1]
+            if self.processor.noise_profile is not None:
+                self._threshold = self.processor.noise_profile.threshold_for(self.sample_rate, channel_count)
+            else:
+                self._threshold = stationary_threshold(self.source)
+
+        for chunk in range(first // CHUNK_SIZE, (last - 1) // CHUNK_SIZE + 1):
+            if chunk in self._denoised_chunks:
+                continue
+            chunk_start = chunk * CHUNK_SIZE
+            chunk_end = min(self.length, chunk_start + CHUNK_SIZE)
+            context_start = max(0, chunk_start - PADDING)
+            context_end = min(self.length, chunk_end + PADDING)
+            work = np.array(self.source[context_start:context_end])
+            state = {'threshold': self._threshold, 'offset': context_start,
+                     'lead': chunk_start - context_start, 'trail': context_end - chunk_end}
+            denoised = stage(work, intensity, state=state, sample_rate=self.sample_rate, out=work)
+            self._denoised[chunk_start:chunk_end] = denoised[chunk_start - context_start:chunk_end - context_start]
+            self._denoised_chunks[chunk] = True
+        return self._denoised
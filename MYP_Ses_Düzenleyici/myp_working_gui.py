@@ -17,6 +17,9 @@ from scipy import signal
 import noisereduce as nr
 from pydub import AudioSegment
 from pydub.playback import play
+from myp_resampler import resample
+from myp_stage_cache import CachedChain
+from myp_render_scheduler import RenderService, RenderCancelled
 import pygame
 import tempfile
 import shutil
@@ -27,21 +30,27 @@ import matplotlib.pyplot as plt
 class WorkingAudioProcessor:
     def __init__(self):
         self.sample_rate = 44100
+        # Aşama çıktıları önbellekte: kaydırıcı değişince yalnızca o aşama ve sonrası işlenir
+        self.stage_chain = CachedChain()
         
     def load_audio(self, file_path):
         """Ses dosyasını yükle"""
         try:
             print(f"📂 Yükleniyor: {os.path.basename(file_path)}")
             
-            # Librosa ile yükle
-            audio_data, sr = librosa.load(file_path, sr=self.sample_rate, mono=False)
+            # Librosa ile özgün sample rate'te yükle
+            audio_data, sr = librosa.load(file_path, sr=None, mono=False)
+            audio_data = audio_data.reshape(-1, audio_data.shape[-1]).T  # (samples, channels)
             
-            # Stereo'ya çevir
-            if len(audio_data.shape) == 1:
-                audio_data = np.stack([audio_data, audio_data])
+            # Sample rate'i ayarla (önbellekli polifaz çekirdek)
+            audio_data = resample(audio_data, sr, self.sample_rate)
             
-            print(f"✅ Yüklendi: {audio_data.shape[1]/sr:.1f} saniye")
-            return audio_data.T  # (samples, channels)
+            # Mono kaynak 1-D kalır (stereo filtre döngüleri aynı veriyi iki kez işlemesin)
+            if audio_data.shape[1] == 1:
+                audio_data = audio_data[:, 0]
+            
+            print(f"✅ Yüklendi: {len(audio_data)/self.sample_rate:.1f} saniye")
+            return audio_data
             
         except Exception as e:
             print(f"❌ Yükleme hatası: {e}")
@@ -53,14 +62,12 @@ class WorkingAudioProcessor:
             return audio_data
         
         try:
-            if len(audio_data.shape) == 2:
-                # Stereo
-                left = nr.reduce_noise(y=audio_data[:, 0], sr=self.sample_rate, prop_decrease=intensity*0.8)
-                right = nr.reduce_noise(y=audio_data[:, 1], sr=self.sample_rate, prop_decrease=intensity*0.8)
-                return np.column_stack([left, right])
-            else:
-                # Mono
-                return nr.reduce_noise(y=audio_data, sr=self.sample_rate, prop_decrease=intensity*0.8)
+            # Her kanal ayrı temizlenir (mono/stereo/N kanal)
+            channels = audio_data.reshape(len(audio_data), -1)
+            cleaned = np.empty_like(channels)
+            for i in range(channels.shape[1]):
+                cleaned[:, i] = nr.reduce_noise(y=channels[:, i], sr=self.sample_rate, prop_decrease=intensity*0.8)
+            return cleaned.reshape(audio_data.shape)
         except:
             return audio_data
     
@@ -73,15 +80,11 @@ class WorkingAudioProcessor:
             # Vokal frekans aralığı (300Hz - 3kHz)
             sos = signal.butter(4, [300, 3000], btype='band', fs=self.sample_rate, output='sos')
             
-            if len(audio_data.shape) == 2:
-                enhanced = np.zeros_like(audio_data)
-                for i in range(2):
-                    vocal_band = signal.sosfilt(sos, audio_data[:, i])
-                    enhanced[:, i] = audio_data[:, i] + (vocal_band * intensity * 0.3)
-                return enhanced
-            else:
-                vocal_band = signal.sosfilt(sos, audio_data)
-                return audio_data + (vocal_band * intensity * 0.3)
+            # Tüm kanallar tek seferde (mono/stereo/N kanal)
+            vocal_band = signal.sosfilt(sos, audio_data, axis=0)
+            enhanced = audio_data.copy()
+            enhanced += vocal_band * (intensity * 0.3)
+            return enhanced
         except:
             return audio_data
     
@@ -94,15 +97,11 @@ class WorkingAudioProcessor:
             # Bas frekans aralığı (20Hz - 200Hz)
             sos = signal.butter(4, [20, 200], btype='band', fs=self.sample_rate, output='sos')
             
-            if len(audio_data.shape) == 2:
-                enhanced = np.zeros_like(audio_data)
-                for i in range(2):
-                    bass_band = signal.sosfilt(sos, audio_data[:, i])
-                    enhanced[:, i] = audio_data[:, i] + (bass_band * intensity * 0.4)
-                return enhanced
-            else:
-                bass_band = signal.sosfilt(sos, audio_data)
-                return audio_data + (bass_band * intensity * 0.4)
+            # Tüm kanallar tek seferde (mono/stereo/N kanal)
+            bass_band = signal.sosfilt(sos, audio_data, axis=0)
+            enhanced = audio_data.copy()
+            enhanced += bass_band * (intensity * 0.4)
+            return enhanced
         except:
             return audio_data
     
@@ -115,21 +114,17 @@ class WorkingAudioProcessor:
             # Tiz frekans aralığı (4kHz - 16kHz)
             sos = signal.butter(4, [4000, 16000], btype='band', fs=self.sample_rate, output='sos')
             
-            if len(audio_data.shape) == 2:
-                enhanced = np.zeros_like(audio_data)
-                for i in range(2):
-                    treble_band = signal.sosfilt(sos, audio_data[:, i])
-                    enhanced[:, i] = audio_data[:, i] + (treble_band * intensity * 0.3)
-                return enhanced
-            else:
-                treble_band = signal.sosfilt(sos, audio_data)
-                return audio_data + (treble_band * intensity * 0.3)
+            # Tüm kanallar tek seferde (mono/stereo/N kanal)
+            treble_band = signal.sosfilt(sos, audio_data, axis=0)
+            enhanced = audio_data.copy()
+            enhanced += treble_band * (intensity * 0.3)
+            return enhanced
         except:
             return audio_data
     
     def apply_stereo_enhance(self, audio_data, intensity):
         """Stereo genişletme"""
-        if intensity == 0 or len(audio_data.shape) != 2:
+        if intensity == 0 or len(audio_data.shape) != 2 or audio_data.shape[1] != 2:
             return audio_data
         
         try:
@@ -148,24 +143,29 @@ class WorkingAudioProcessor:
         except:
             return audio_data
     
-    def process_realtime(self, audio_data, settings):
-        """Gerçek zamanlı işleme"""
+    def process_realtime(self, audio_data, settings, cancel=None, progress=None):
+        """Gerçek zamanlı işleme
+
+        cancel: aşama sınırlarında yoklanan iptal jetonu, progress: progress(aşama, tamamlanan, toplam)
+        """
         try:
-            processed = audio_data.copy()
-            
-            # Efektleri sırayla uygula
-            processed = self.apply_noise_reduction(processed, settings.get('noise_reduction', 0))
-            processed = self.apply_vocal_enhance(processed, settings.get('vocal_enhance', 0))
-            processed = self.apply_bass_boost(processed, settings.get('bass_boost', 0))
-            processed = self.apply_treble_enhance(processed, settings.get('treble_enhance', 0))
-            processed = self.apply_stereo_enhance(processed, settings.get('stereo_enhance', 0))
-            
-            # Normalize
+            # Efektleri sırayla uygula (değişmeyen aşamaların çıktıları önbellekten)
+            processed = self.stage_chain.run(audio_data, [
+                ('noise_reduction', self.apply_noise_reduction, settings.get('noise_reduction', 0)),
+                ('vocal_enhance', self.apply_vocal_enhance, settings.get('vocal_enhance', 0)),
+                ('bass_boost', self.apply_bass_boost, settings.get('bass_boost', 0)),
+                ('treble_enhance', self.apply_treble_enhance, settings.get('treble_enhance', 0)),
+                ('stereo_enhance', self.apply_stereo_enhance, settings.get('stereo_enhance', 0)),
+            ], variant=self.sample_rate, cancel=cancel, progress=progress)
+            
+            # Normalize (yeni dizi; önbellekteki çıktı değişmez)
             max_val = np.max(np.abs(processed))
             if max_val > 0:
                 processed = processed / max_val * 0.95
             
             return processed
+        except RenderCancelled:
+            raise
         except Exception as e:
             print(f"İşleme hatası: {e}")
             return audio_data
@@ -218,7 +218,9 @@ class SimpleAudioPlayer:
 class WorkingMYPGUI:
     def __init__(self):
         self.root = tk.Tk()
-        self.root.title("🎵 MYP Ses Düzenleyici ")
+        # İşleme sürerken başlığa ilerleme eklenir, bitince bu başlığa dönülür
+        self.window_title = "🎵 MYP Ses Düzenleyici "
+        self.root.title(self.window_title)
         self.root.geometry("1400x900")
         self.root.configure(bg='#2b2b2b')
         
@@ -242,6 +244,11 @@ class WorkingMYPGUI:
         
         self.setup_ui()
         
+        # İşleme arka planda, sonuçlar Tk döngüsünde kuyruktan alınır
+        self.render_service = RenderService(self.root, self.render_audio, on_result=self.show_processed_audio,
+                                            on_progress=self.show_progress)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        
     def setup_ui(self):
         """UI oluştur"""
         # Ana frame
@@ -574,13 +581,32 @@ class WorkingMYPGUI:
         print(f"🔧 {key}: {int_value}%")
         
     def process_realtime(self):
-        """Gerçek zamanlı işleme"""
+        """Gerçek zamanlı işleme - arka planda, en yeni ayar kazanır"""
         if self.original_audio is None:
             return
             
+        self.render_service.submit(self.settings.copy())
+        
+    def render_audio(self, settings, cancel, progress):
+        """İşleme iş parçacığında: efektleri uygula"""
+        original_audio = self.original_audio
+        if original_audio is None:
+            return None
+        return self.processor.process_realtime(original_audio, settings, cancel, progress)
+        
+    def show_progress(self, stage, done, total):
+        """İşleme ilerlemesini pencere başlığında göster (son aşamada özgün başlık)"""
+        suffix = "" if done == total else f"- ⏳ {stage} ({done}/{total})"
+        self.root.title(self.window_title + suffix)
+        
+    def show_processed_audio(self, processed):
+        """Tk iş parçacığında: işlenmiş sesi göster"""
+        # İşleme bitti: ilerleme son aşamaya ulaşmadan biten işlemelerde de başlık geri gelir
+        self.root.title(self.window_title)
+        if processed is None:
+            return
         try:
-            # İşle
-            self.processed_audio = self.processor.process_realtime(self.original_audio, self.settings)
+            self.processed_audio = processed
             
             # Butonları aktif et
             self.play_processed_btn.config(state='normal')
@@ -695,6 +721,11 @@ class WorkingMYPGUI:
         """Uygulamayı çalıştır"""
         print("🎵 MYP 3.0 Sürüm başlatılıyor...")
         self.root.mainloop()
+        
+    def on_closing(self):
+        """Uygulama kapatılırken"""
+        self.render_service.close(timeout=1.0)
+        self.root.destroy()
 
 if __name__ == "__main__":
     app = WorkingMYPGUI()
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+"""MYP Ses Düzenleyici testleri: modüller proje kökünden (düz yerleşim) içe aktarılır"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from myp_logging import set_quiet
+
+# Testlerde işleme günlükleri kapalı
+set_quiet(True)
+
+
+@pytest.fixture
+def stereo_signal():
+    """2 saniyelik stereo test sinyali: iki ton + hafif gürültü (float32)"""
+    rng = np.random.default_rng(0)
+    sample_rate = 44100
+    t = np.arange(2 * sample_rate) / sample_rate
+    tones = 0.3 * np.sin(2 * np.pi * 220 * t) + 0.1 * np.sin(2 * np.pi * 3000 * t)
+    audio = tones[:, None] * np.ones((1, 2)) + 0.02 * rng.standard_normal((len(t), 2))
+    return audio.astype(np.float32)
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""Birleşik EQ ile ardışık doğrusal EQ zinciri aynı sonucu vermeli"""
+
+import numpy as np
+
+from myp_audio_processor import AdvancedAudioProcessor
+
+SAMPLE_RATE = 44100
+EQ_SETTINGS = {'vocal_enhance': 0.6, 'bass_boost': 0.5, 'treble_enhance': 0.4, 'warmth_filter': 0.3}
+
+
+def _run_plan(processor, audio, settings):
+    for _, stage, param in processor._stage_plan(settings):
+        audio = stage(audio, param, sample_rate=SAMPLE_RATE)
+    return audio
+
+
+def test_fused_matches_sequential_within_tolerance(stereo_signal):
+    sequential = _run_plan(AdvancedAudioProcessor(fused_eq=False), stereo_signal, EQ_SETTINGS)
+    fused = _run_plan(AdvancedAudioProcessor(fused_eq=True), stereo_signal, EQ_SETTINGS)
+
+    assert fused.shape == sequential.shape
+    # Belgelenen tolerans: tepe girişin 1e-4'ü (-80 dB)
+    assert np.max(np.abs(fused - sequential)) <= 1e-4 * np.max(np.abs(stereo_signal))
+
+
+def test_fused_stage_param_ignores_non_eq_settings():
+    processor = AdvancedAudioProcessor(fused_eq=True)
+    plan = processor._stage_plan(dict(EQ_SETTINGS, mastering=0.5))
+    changed = processor._stage_plan(dict(EQ_SETTINGS, mastering=0.9, compression=0.4))
+    assert plan[0][0] == changed[0][0] == 'fused_eq'
+    assert plan[0][2] == changed[0][2]
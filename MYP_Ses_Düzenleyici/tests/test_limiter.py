@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""True-peak limiter çıktısının aşırı örneklenmiş tepesi tavanı aşmamalı"""
+
+import numpy as np
+import pytest
+from scipy import signal
+
+from myp_limiter import TruePeakLimiter, TRUE_PEAK_PHASES, DEFAULT_CEILING_DB
+
+SAMPLE_RATE = 44100
+# float32 hesap hatası payı (dB)
+TOLERANCE_DB = 1e-3
+
+
+def _bs1770_true_peak_db(audio_data):
+    """ITU-R BS.1770 4x true-peak (dBTP)"""
+    audio_data = audio_data.astype(np.float64)
+    peak = max(np.abs(signal.lfilter(phase, [1.0], audio_data, axis=0)).max() for phase in TRUE_PEAK_PHASES)
+    return 20 * np.log10(peak)
+
+
+def _oversampled_peak_db(audio_data, factor=4):
+    """Genel amaçlı (polifaz yeniden örnekleme) aşırı örneklenmiş tepe"""
+    upsampled = signal.resample_poly(audio_data.astype(np.float64), factor, 1, axis=0)
+    return 20 * np.log10(np.abs(upsampled).max())
+
+
+def _signals():
+    rng = np.random.default_rng(0)
+    length = 3 * SAMPLE_RATE
+    t = np.arange(length) / SAMPLE_RATE
+    clicks = np.zeros((length, 2))
+    clicks[::4410] = [3.0, -3.0]
+    clicks[1::4410] = [-3.0, 3.0]
+    return {
+        'noise': 3.0 * rng.standard_normal((length, 2)),
+        'sine_19k': 3.0 * np.sin(2 * np.pi * 19000 * t + 0.7)[:, None] * np.ones((1, 2)),
+        'clicks': clicks,
+    }
+
+
+def _pink_noise(cutoff):
+    """Müzik benzeri (1/f) ve bant sınırlı test sinyali, tepe +12 dBFS"""
+    rng = np.random.default_rng(5)
+    length = 6 * SAMPLE_RATE
+    spectrum = np.fft.rfft(rng.standard_normal((length, 2)), axis=0)
+    frequencies = np.fft.rfftfreq(length, 1 / SAMPLE_RATE)
+    spectrum[1:] /= np.sqrt(frequencies[1:, None])
+    pink = np.fft.irfft(spectrum, length, axis=0)
+    pink = signal.sosfilt(signal.butter(8, cutoff, fs=SAMPLE_RATE, output='sos'), pink, axis=0)
+    return pink / np.abs(pink).max() * 4.0
+
+
+@pytest.mark.parametrize('name', list(_signals()))
+def test_bs1770_true_peak_within_ceiling(name):
+    audio_data = _signals()[name].astype(np.float32)
+    limited = TruePeakLimiter(SAMPLE_RATE).limit(audio_data)
+    assert _bs1770_true_peak_db(limited) <= DEFAULT_CEILING_DB + TOLERANCE_DB
+
+
+@pytest.mark.parametrize('cutoff', [16000, 20000])
+def test_oversampled_peak_within_ceiling(cutoff):
+    audio_data = _pink_noise(cutoff).astype(np.float32)
+    limited = TruePeakLimiter(SAMPLE_RATE).limit(audio_data)
+    assert _oversampled_peak_db(limited) <= DEFAULT_CEILING_DB
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""Debug dtype denetimi işleme hatası gibi yutulmamalı"""
+
+import numpy as np
+import pytest
+
+from advanced_features import AdvancedAudioFeatures
+from myp_audio_processor import AdvancedAudioProcessor
+from myp_precision import DtypeError
+
+SAMPLE_RATE = 44100
+
+
+def _float64_processor():
+    """Sıkıştırma aşaması politika dışı float64 üreten debug modlu işlemci"""
+    processor = AdvancedAudioProcessor(debug_dtype=True)
+    processor.professional_compression = lambda audio_data, intensity, **kwargs: audio_data.astype(np.float64)
+    return processor
+
+
+def test_professional_chain_raises_dtype_error(stereo_signal):
+    with pytest.raises(DtypeError):
+        _float64_processor().process_audio_professional(stereo_signal, {'compression': 0.5}, SAMPLE_RATE)
+
+
+def test_incremental_chain_raises_dtype_error(stereo_signal):
+    with pytest.raises(DtypeError):
+        _float64_processor().process_audio_incremental(stereo_signal, {'compression': 0.5}, SAMPLE_RATE)
+
+
+def test_feature_raises_dtype_error(stereo_signal):
+    features = AdvancedAudioFeatures(debug_dtype=True)
+    # Giriş dönüşümü float64 bırakırsa efekt çıktısı politika dışı kalır
+    features.precision.cast = lambda audio_data: np.asarray(audio_data, dtype=np.float64)
+    with pytest.raises(DtypeError):
+        features.normalize_advanced(stereo_signal, method='peak')
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+"""Parçalı paralel işleme sıralı işlemeyle tolerans içinde aynı sonucu vermeli"""
+
+import pytest
+
+from myp_audio_processor import MYPAudioProcessor
+from myp_benchmark import make_test_signal
+from myp_segment_render import SegmentRenderer
+
+# Kabul edilen en yüksek RMS fark (dB, sıralı çıktıya göre) ve örnek farkı. Ölçülen ~-70 dB;
+# ortak eşik ya da offset taşınmazsa gürültü azaltmalı fark -40..-50 dB'e çıkar
+TOLERANCE_DB = -60.0
+MAX_ERROR = 2e-3
+
+
+@pytest.mark.parametrize('noise_reduction', [0, 0.8], ids=['no_noise_reduction', 'noise_reduction'])
+def test_segmented_matches_sequential(noise_reduction):
+    settings = dict(MYPAudioProcessor.DEFAULT_SETTINGS, noise_reduction=noise_reduction)
+    processor = MYPAudioProcessor()
+    # 30 sn sinyal, 8 sn parçalar: parça sınırları gürültü azaltmanın CHUNK_SIZE ızgarasıyla hizalı değil
+    renderer = SegmentRenderer(processor, segment_seconds=8.0, workers=2)
+    result = renderer.compare_with_sequential(make_test_signal(30.0, 2), settings)
+
+    assert result['rms_error_db'] <= TOLERANCE_DB
+    assert result['max_error'] <= MAX_ERROR
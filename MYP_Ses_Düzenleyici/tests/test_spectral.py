@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""Ortak STFT'li gürültü azaltma eski iki geçişli noisereduce sonucuyla tolerans içinde aynı olmalı"""
+
+import numpy as np
+import pytest
+
+noisereduce = pytest.importorskip('noisereduce')
+
+from myp_benchmark import make_test_signal
+from myp_spectral import SpectralNoiseReducer, TOLERANCE_DB
+
+SAMPLE_RATE = 44100
+INTENSITY = 0.8
+
+
+def _two_pass(audio_data):
+    """Eski yol: kanal başına durağan, ardından durağan olmayan noisereduce geçişi"""
+    channels = audio_data.reshape(len(audio_data), -1)
+    cleaned = np.empty_like(channels)
+    for i in range(channels.shape[1]):
+        first_pass = noisereduce.reduce_noise(y=channels[:, i], sr=SAMPLE_RATE, stationary=True,
+                                              prop_decrease=INTENSITY * 0.6)
+        cleaned[:, i] = noisereduce.reduce_noise(y=first_pass, sr=SAMPLE_RATE, stationary=False,
+                                                 prop_decrease=INTENSITY * 0.4)
+    return cleaned.reshape(audio_data.shape)
+
+
+# 20 sn: CHUNK_SIZE parça sınırı da karşılaştırılır
+@pytest.mark.parametrize('seconds, channels', [(10.0, 1), (20.0, 2)], ids=['mono_10s', 'stereo_20s'])
+def test_matches_two_pass_noisereduce(seconds, channels):
+    audio = make_test_signal(seconds, channels).astype(np.float32)
+    expected = _two_pass(audio)
+    result = SpectralNoiseReducer(SAMPLE_RATE, INTENSITY * 0.6, INTENSITY * 0.4).process(audio)
+
+    error = np.asarray(result, dtype=np.float64) - expected
+    error_db = 20 * np.log10(np.sqrt(np.mean(error ** 2)) / np.sqrt(np.mean(np.square(expected, dtype=np.float64))))
+    assert result.dtype == audio.dtype
+    assert error_db <= TOLERANCE_DB
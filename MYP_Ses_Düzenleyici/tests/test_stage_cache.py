@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""Aşama önbelleği: maliyete duyarlı atma, paylaşılan tampon, profil kimliği"""
+
+import gc
+
+import numpy as np
+
+from myp_noise_profile import NoiseProfile
+from myp_spectral import N_FFT
+from myp_stage_cache import CachedChain, StageCache
+
+ENTRY_BYTES = 1000 * 4
+
+
+def _entry():
+    return np.zeros(1000, dtype=np.float32)
+
+
+def test_expensive_entry_survives_cheap_churn():
+    cache = StageCache(budget_bytes=2 * ENTRY_BYTES)
+    cache.put('denoise', _entry(), cost=5.0)
+    for index in range(20):
+        cache.put(('eq', index), _entry(), cost=0.1)
+    assert cache.get('denoise') is not None
+    assert cache.used_bytes <= cache.budget_bytes
+
+
+def test_equal_costs_evict_least_recently_used():
+    cache = StageCache(budget_bytes=2 * ENTRY_BYTES)
+    cache.put('a', _entry())
+    cache.put('b', _entry())
+    cache.get('a')
+    cache.put('c', _entry())
+    assert cache.get('b') is None
+    assert cache.get('a') is not None
+
+
+def test_shared_buffer_counted_once():
+    cache = StageCache(budget_bytes=2 * ENTRY_BYTES)
+    shared = _entry()
+    for key in ('a', 'b', 'c'):
+        cache.put(key, shared)
+    assert cache.used_bytes == ENTRY_BYTES
+    assert cache.evictions == 0
+    cache.put('d', _entry())
+    assert cache.used_bytes == 2 * ENTRY_BYTES
+    assert all(cache.get(key) is shared for key in ('a', 'b', 'c'))
+
+
+def test_profile_fingerprint_follows_content():
+    threshold = np.random.default_rng(0).normal(size=(2, N_FFT // 2 + 1))
+    first = NoiseProfile(threshold, 44100)
+    assert NoiseProfile(threshold.copy(), 44100).fingerprint == first.fingerprint
+    assert NoiseProfile(threshold + 1, 44100).fingerprint != first.fingerprint
+    assert NoiseProfile(threshold, 48000).fingerprint != first.fingerprint
+
+
+def test_released_source_entries_dropped():
+    chain = CachedChain(budget_bytes=4 * ENTRY_BYTES)
+    source = _entry()
+    chain.run(source, [('gain', lambda audio, gain: audio * gain, 2.0)])
+    assert chain.cache.stats()['entries'] == 1
+    del source
+    gc.collect()
+    stats = chain.cache.stats()
+    assert stats['entries'] == 0
+    assert stats['used_bytes'] == 0
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""Akışta (bloklar halinde) gürültü azaltma bellekteki işlemeyle aynı sonucu vermeli"""
+
+import numpy as np
+import pytest
+
+from myp_audio_processor import AdvancedAudioProcessor
+from myp_spectral import CHUNK_SIZE
+
+SAMPLE_RATE = 44100
+
+
+def _noisy_signal(length):
+    rng = np.random.default_rng(1)
+    t = np.arange(length) / SAMPLE_RATE
+    tone = 0.3 * np.sin(2 * np.pi * 220 * t) * (1 + np.sin(2 * np.pi * 0.2 * t))
+    return (tone[:, None] + 0.05 * rng.standard_normal((length, 2))).astype(np.float32)
+
+
+def _stream(processor, audio, block_size):
+    blocks = (audio[start:start + block_size].copy() for start in range(0, len(audio), block_size))
+    return np.concatenate(list(processor._stream_noise_reduction(blocks, 0.8, SAMPLE_RATE)))
+
+
+@pytest.mark.parametrize('length', [CHUNK_SIZE // 2, 2 * CHUNK_SIZE + 12345])
+@pytest.mark.parametrize('block_size', [100000, 2 ** 19])
+def test_streamed_matches_in_memory(length, block_size):
+    processor = AdvancedAudioProcessor()
+    audio = _noisy_signal(length)
+    expected = processor.advanced_noise_reduction(audio, 0.8, sample_rate=SAMPLE_RATE)
+    streamed = _stream(processor, audio, block_size)
+
+    assert streamed.shape == expected.shape
+    np.testing.assert_allclose(streamed, expected, rtol=0, atol=1e-6)
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""Pencereli işleme: read() çalma geri çağrısında işlem yapmadan hemen dönmeli"""
+
+import time
+
+import numpy as np
+
+from myp_audio_processor import MYPAudioProcessor
+from myp_benchmark import make_test_signal
+from myp_window_render import WindowedRenderer
+
+SAMPLE_RATE = 44100
+BLOCK = 1024
+# Tek pencere işlemesi ~0.1-1.3 sn sürer; read() yalnızca kopyalamalı
+MAX_READ_SECONDS = 0.05
+
+
+def test_read_never_renders_and_falls_back_to_dry():
+    processor = MYPAudioProcessor()
+    audio = make_test_signal(12.0, 2)
+    settings = dict(MYPAudioProcessor.DEFAULT_SETTINGS, noise_reduction=0.8)
+    renderer = WindowedRenderer(processor, audio, SAMPLE_RATE, settings)
+    try:
+        source = renderer.source
+        # Konum değişince arka plan işlemesi buradan başlar; henüz işlenmemiş, kuru döner
+        start = 8 * SAMPLE_RATE
+        began = time.perf_counter()
+        chunk = renderer.read(start, BLOCK)
+        assert time.perf_counter() - began < MAX_READ_SECONDS
+        np.testing.assert_array_equal(chunk, source[start:start + BLOCK])
+
+        assert renderer.wait(start, BLOCK, timeout=120)
+        processed = renderer.read(start, BLOCK)
+        assert not np.array_equal(processed, source[start:start + BLOCK])
+
+        # Yeni ayar işlenene kadar eski ayarlı çıktı çalınır (kuruya dönülmez)
+        renderer.set_settings(dict(settings, compression=0.2))
+        began = time.perf_counter()
+        stale = renderer.read(start, BLOCK)
+        assert time.perf_counter() - began < MAX_READ_SECONDS
+        np.testing.assert_array_equal(stale, processed)
+    finally:
+        renderer.close()
+
+
+def test_failed_window_keeps_dry_fallback():
+    processor = MYPAudioProcessor()
+    audio = make_test_signal(4.0, 2)
+
+    def failing_stage(audio_data, param, state=None, sample_rate=None, out=None):
+        raise RuntimeError('aşama hatası')
+
+    processor._stage_plan = lambda settings: [('failing', failing_stage, 1.0)]
+    renderer = WindowedRenderer(processor, audio, SAMPLE_RATE, {})
+    try:
+        start = SAMPLE_RATE
+        # İşlenemeyen pencere hazır sayılmaz, yeniden de denenmez
+        assert not renderer.wait(start, BLOCK, timeout=30)
+        np.testing.assert_array_equal(renderer.read(start, BLOCK), renderer.source[start:start + BLOCK])
+    finally:
+        renderer.close()